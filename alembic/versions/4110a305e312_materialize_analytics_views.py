@@ -0,0 +1,141 @@
+"""materialize analytics views with dependency-driven refresh
+
+Materializes each analytics view that recomputes window functions over the
+hypertable under the name consumers already query: the view definition is
+renamed to analytics.<view>_live and analytics.<view> becomes a materialized
+view selecting from it. Views depending on a renamed view (e.g.
+currency_strength_index on fx_rates_normalized) follow the rename, so
+refreshes always compute from live data and can run in any order. Every
+materialization gets a unique index so it can be refreshed CONCURRENTLY
+without blocking readers.
+
+analytics.materialized_views registers the materializations and their last
+refresh; analytics.materialized_view_dependencies maps each one to LIKE
+patterns over source_series_id, which chronos.ingestion.analytics_refresh
+uses to refresh only those affected by an ingestion run. Views missing from
+the database (e.g. analytics_views.sql never applied) are skipped. Views that
+are already materialized (database/views.sql creates fx_rates_normalized and
+macro_indicators_latest that way at initdb) are only refreshed and
+registered.
+
+Revision ID: 4110a305e312
+Revises: eb256617afcd
+Create Date: 2026-10-19 15:26:44.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4110a305e312"
+down_revision: Union[str, Sequence[str], None] = "eb256617afcd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (view, unique key, source_series_id patterns)
+MATERIALIZATIONS = [
+    ("fx_rates_normalized", ("series_id", "observation_date"), ("DEX%", "FX%")),
+    (
+        "currency_strength_index",
+        ("source_series_id", "observation_date"),
+        ("FXEURCAD", "FXGBPCAD", "FXJPYCAD", "FXUSDCAD"),
+    ),
+    ("fx_volatility", ("source_series_id",), ("DEX%", "FX%")),
+    ("macro_indicators_latest", ("source_name", "source_series_id"), ("%",)),
+    (
+        "v_cook_county_housing_pilot",
+        ("observation_date",),
+        ("ATNHPIUS17031A", "MHIIL17031A052NCEN"),
+    ),
+]
+
+
+def _relkind(name: str) -> str | None:
+    """'v' for a view, 'm' for a materialized view, None if missing"""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": f"analytics.{name}"},
+        )
+        .scalar()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "materialized_views",
+        sa.Column("view_name", sa.Text(), primary_key=True),
+        sa.Column("source_view", sa.Text(), nullable=False),
+        sa.Column("refreshed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("refresh_ms", sa.Float(), nullable=True),
+        schema="analytics",
+    )
+    op.create_table(
+        "materialized_view_dependencies",
+        sa.Column(
+            "view_name",
+            sa.Text(),
+            sa.ForeignKey("analytics.materialized_views.view_name", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("source_series_pattern", sa.Text(), primary_key=True),
+        schema="analytics",
+    )
+
+    for view_name, key, patterns in MATERIALIZATIONS:
+        relkind = _relkind(view_name)
+        if relkind not in ("v", "m"):
+            continue
+
+        live_view = f"{view_name}_live"
+        if relkind == "v":
+            op.execute(f"ALTER VIEW analytics.{view_name} RENAME TO {live_view}")
+            op.execute(
+                f"""
+                CREATE MATERIALIZED VIEW analytics.{view_name} AS
+                SELECT * FROM analytics.{live_view}
+                """
+            )
+        else:
+            # Materialized at initdb, before any observations were loaded
+            op.execute(f"REFRESH MATERIALIZED VIEW analytics.{view_name}")
+        # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        op.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{view_name} "
+            f"ON analytics.{view_name} ({', '.join(key)})"
+        )
+        op.execute(
+            sa.text(
+                """
+                INSERT INTO analytics.materialized_views (view_name, source_view, refreshed_at)
+                VALUES (:view_name, :source_view, NOW())
+                """
+            ).bindparams(view_name=view_name, source_view=live_view)
+        )
+        for pattern in patterns:
+            op.execute(
+                sa.text(
+                    """
+                    INSERT INTO analytics.materialized_view_dependencies
+                    (view_name, source_series_pattern)
+                    VALUES (:view_name, :pattern)
+                    """
+                ).bindparams(view_name=view_name, pattern=pattern)
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for view_name, *_ in reversed(MATERIALIZATIONS):
+        if _relkind(view_name) == "m":
+            op.execute(f"DROP MATERIALIZED VIEW analytics.{view_name}")
+        if _relkind(f"{view_name}_live") == "v":
+            op.execute(f"ALTER VIEW analytics.{view_name}_live RENAME TO {view_name}")
+    op.drop_table("materialized_view_dependencies", schema="analytics")
+    op.drop_table("materialized_views", schema="analytics")
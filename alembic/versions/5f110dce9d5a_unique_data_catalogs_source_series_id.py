@@ -0,0 +1,49 @@
+"""unique (source, series_id) on data_catalogs
+
+Lets ingest_catalog upsert the whole catalog with a single
+INSERT ... ON CONFLICT (source, series_id) DO UPDATE instead of a SELECT per
+row. Existing duplicates are removed first, keeping the most recent row.
+
+Revision ID: 5f110dce9d5a
+Revises: e628b9ebaf87
+Create Date: 2026-10-19 12:20:05.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f110dce9d5a"
+down_revision: Union[str, Sequence[str], None] = "e628b9ebaf87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        DELETE FROM metadata.data_catalogs dc
+        USING metadata.data_catalogs newer
+        WHERE dc.source = newer.source
+          AND dc.series_id = newer.series_id
+          AND dc.id < newer.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_data_catalogs_source_series_id",
+        "data_catalogs",
+        ["source", "series_id"],
+        schema="metadata",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_data_catalogs_source_series_id", "data_catalogs", type_="unique", schema="metadata"
+    )
@@ -0,0 +1,39 @@
+"""add catalog_hash to series_metadata_cache
+
+content_hash covers the catalog and API fields together, so it can only be
+compared after the metadata API call. catalog_hash covers the catalog fields
+alone and lets the ingestion CLI skip the API call within the TTL only while
+the catalog entry (name, frequency, category, geography) is unchanged. Rows
+written before this revision have no catalog_hash and are refreshed once.
+
+Revision ID: a7d3c9e15b42
+Revises: e5251565f8b5
+Create Date: 2026-10-19 18:04:12.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3c9e15b42"
+down_revision: Union[str, Sequence[str], None] = "e5251565f8b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "series_metadata_cache",
+        sa.Column("catalog_hash", sa.Text(), nullable=True),
+        schema="metadata",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("series_metadata_cache", "catalog_hash", schema="metadata")
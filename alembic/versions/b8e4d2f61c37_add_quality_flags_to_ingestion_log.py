@@ -0,0 +1,40 @@
+"""add quality_flags to ingestion_log
+
+Series rows store the number of observations each quality check flagged
+(see chronos.ingestion.quality) as a JSON object, e.g. {"spike": 2,
+"stale": 14}. The run row holds the per-check totals over its series rows,
+so the run's quality summary outlives the console output and covers every
+attempt of a resumed run.
+
+Revision ID: b8e4d2f61c37
+Revises: a7d3c9e15b42
+Create Date: 2026-10-19 21:12:45.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4d2f61c37"
+down_revision: Union[str, Sequence[str], None] = "a7d3c9e15b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ingestion_log",
+        sa.Column("quality_flags", postgresql.JSONB(), nullable=True),
+        schema="metadata",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingestion_log", "quality_flags", schema="metadata")
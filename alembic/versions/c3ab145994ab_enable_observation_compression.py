@@ -0,0 +1,62 @@
+"""enable compression on economic_observations
+
+Chunks are compressed segmented by series_id and ordered by observation_date
+DESC, so each series is stored as its own run of compressed batches and a
+full-history single-series read decompresses only that series' segments.
+A policy compresses chunks once their whole range is older than the
+3-year revision window; older revisions are handled by the loader (see
+chronos.ingestion.compression).
+
+Revision ID: c3ab145994ab
+Revises: d451adfc186c
+Create Date: 2026-10-19 14:12:08.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3ab145994ab"
+down_revision: Union[str, Sequence[str], None] = "d451adfc186c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE timeseries.economic_observations SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'series_id',
+            timescaledb.compress_orderby = 'observation_date DESC'
+        )
+        """
+    )
+    op.execute(
+        """
+        SELECT add_compression_policy(
+            'timeseries.economic_observations',
+            compress_after => INTERVAL '3 years',
+            if_not_exists => TRUE
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "SELECT remove_compression_policy('timeseries.economic_observations', if_exists => TRUE)"
+    )
+    op.execute(
+        """
+        SELECT decompress_chunk(c, if_not_compressed => TRUE)
+        FROM show_chunks('timeseries.economic_observations') c
+        """
+    )
+    op.execute("ALTER TABLE timeseries.economic_observations SET (timescaledb.compress = FALSE)")
@@ -0,0 +1,43 @@
+"""add description embedding hash and model to series_metadata
+
+generate_embeddings stores a SHA-256 of the embedded text (prefixed with the
+model name) alongside each vector, so its incremental mode can re-embed only
+series whose description or embedding model changed.
+
+Revision ID: d451adfc186c
+Revises: 5f110dce9d5a
+Create Date: 2026-10-19 13:41:52.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d451adfc186c"
+down_revision: Union[str, Sequence[str], None] = "5f110dce9d5a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "series_metadata",
+        sa.Column("description_embedding_hash", sa.Text(), nullable=True),
+        schema="metadata",
+    )
+    op.add_column(
+        "series_metadata",
+        sa.Column("description_embedding_model", sa.Text(), nullable=True),
+        schema="metadata",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("series_metadata", "description_embedding_model", schema="metadata")
+    op.drop_column("series_metadata", "description_embedding_hash", schema="metadata")
@@ -0,0 +1,193 @@
+"""add precomputed FX rates and calendar-day currency strength
+
+analytics.fx_usd_rates holds the dense business-day x currency matrix of USD
+per unit built by chronos.analytics.fx (holidays carried forward and marked
+is_filled), so SQL consumers get the same rates as the /api/fx endpoints.
+The API's FXRatePublisher rewrites it after FX series are ingested.
+analytics.fx_cross_rates derives every pair from it with a self-join instead
+of per-row string matching on series names.
+
+analytics.currency_strength_index compared each Bank of Canada rate with the
+row 30 rows earlier (LAG(..., 30)), which is ~6 weeks of business days and
+drifts with holidays. It is rebuilt on analytics.fx_usd_rates: every
+currency is compared with its rate on the last business day on or before
+the date 30 calendar days earlier, found by a keyed probe on
+(currency, observation_date). Rows are keyed by currency instead of
+source_series_id. As a plain view over a precomputed table it no longer
+needs the materialization added in 4110a305e312, which would otherwise be
+refreshed before the publisher rewrites the table.
+
+Revision ID: e5251565f8b5
+Revises: 4110a305e312
+Create Date: 2026-10-19 17:02:15.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5251565f8b5"
+down_revision: Union[str, Sequence[str], None] = "4110a305e312"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CURRENCY_STRENGTH_SQL = """
+CREATE VIEW analytics.currency_strength_index AS
+SELECT
+    r.observation_date,
+    r.currency,
+    r.usd_per_unit AS current_rate,
+    past.usd_per_unit AS value_30d_ago,
+    ROUND(CAST(100.0 * (r.usd_per_unit - past.usd_per_unit)
+               / NULLIF(past.usd_per_unit, 0) AS numeric), 2) AS pct_change_30d,
+    CASE
+        WHEN r.usd_per_unit > past.usd_per_unit THEN '📈 Strengthening'
+        WHEN r.usd_per_unit < past.usd_per_unit THEN '📉 Weakening'
+        ELSE '➡️ Stable'
+    END AS trend,
+    r.is_filled
+FROM analytics.fx_usd_rates r
+CROSS JOIN LATERAL (
+    SELECT p.usd_per_unit
+    FROM analytics.fx_usd_rates p
+    WHERE p.currency = r.currency
+    AND p.observation_date <= r.observation_date - 30
+    ORDER BY p.observation_date DESC
+    LIMIT 1
+) past
+WHERE r.currency <> 'USD'
+"""
+
+# Definition and materialization as of 4110a305e312, restored on downgrade
+PREVIOUS_CURRENCY_STRENGTH_SQL = """
+CREATE VIEW analytics.currency_strength_index_live AS
+WITH base_rates AS (
+    SELECT
+        observation_date,
+        source_series_id,
+        usd_per_fx,
+        LAG(usd_per_fx, 30) OVER (PARTITION BY source_series_id ORDER BY observation_date)
+            as value_30d_ago
+    FROM analytics.fx_rates_normalized_live
+    WHERE source_series_id IN ('FXEURCAD', 'FXGBPCAD', 'FXJPYCAD', 'FXUSDCAD')
+)
+SELECT
+    observation_date,
+    source_series_id,
+    usd_per_fx as current_rate,
+    value_30d_ago,
+    ROUND(100.0 * (usd_per_fx - value_30d_ago) / NULLIF(value_30d_ago, 0), 2) as pct_change_30d,
+    CASE
+        WHEN usd_per_fx > value_30d_ago THEN '📈 Strengthening'
+        WHEN usd_per_fx < value_30d_ago THEN '📉 Weakening'
+        ELSE '➡️ Stable'
+    END as trend
+FROM base_rates
+WHERE value_30d_ago IS NOT NULL
+"""
+
+PREVIOUS_DEPENDENCIES = ("FXEURCAD", "FXGBPCAD", "FXJPYCAD", "FXUSDCAD")
+
+
+def _relkind(name: str) -> str | None:
+    """'v' for a view, 'm' for a materialized view, None if missing"""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": f"analytics.{name}"},
+        )
+        .scalar()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fx_usd_rates",
+        sa.Column("observation_date", sa.Date(), primary_key=True),
+        sa.Column("currency", sa.Text(), primary_key=True),
+        sa.Column("usd_per_unit", sa.Float(), nullable=False),
+        sa.Column("is_filled", sa.Boolean(), nullable=False, server_default=sa.false()),
+        schema="analytics",
+    )
+    op.create_index(
+        "idx_fx_usd_rates_currency_date",
+        "fx_usd_rates",
+        ["currency", "observation_date"],
+        schema="analytics",
+    )
+
+    op.execute(
+        """
+        CREATE VIEW analytics.fx_cross_rates AS
+        SELECT
+            b.observation_date,
+            b.currency AS base_currency,
+            q.currency AS quote_currency,
+            b.usd_per_unit / q.usd_per_unit AS rate,
+            (b.is_filled OR q.is_filled) AS is_filled
+        FROM analytics.fx_usd_rates b
+        JOIN analytics.fx_usd_rates q ON q.observation_date = b.observation_date
+        WHERE b.currency <> q.currency
+        """
+    )
+    op.execute(
+        """
+        COMMENT ON VIEW analytics.fx_cross_rates IS
+        'Units of quote_currency per unit of base_currency on every business day,
+        derived from analytics.fx_usd_rates (rewritten by the API after FX ingestion)'
+        """
+    )
+
+    if _relkind("currency_strength_index") == "m":
+        op.execute("DROP MATERIALIZED VIEW analytics.currency_strength_index")
+        op.execute(
+            "DELETE FROM analytics.materialized_views WHERE view_name = 'currency_strength_index'"
+        )
+    elif _relkind("currency_strength_index") == "v":
+        op.execute("DROP VIEW analytics.currency_strength_index")
+    op.execute("DROP VIEW IF EXISTS analytics.currency_strength_index_live")
+    op.execute(CURRENCY_STRENGTH_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS analytics.currency_strength_index")
+    if _relkind("fx_rates_normalized_live") == "v":
+        op.execute(PREVIOUS_CURRENCY_STRENGTH_SQL)
+        op.execute(
+            """
+            CREATE MATERIALIZED VIEW analytics.currency_strength_index AS
+            SELECT * FROM analytics.currency_strength_index_live
+            """
+        )
+        op.execute(
+            """
+            CREATE UNIQUE INDEX uq_currency_strength_index
+            ON analytics.currency_strength_index (source_series_id, observation_date)
+            """
+        )
+        op.execute(
+            """
+            INSERT INTO analytics.materialized_views (view_name, source_view, refreshed_at)
+            VALUES ('currency_strength_index', 'currency_strength_index_live', NOW())
+            """
+        )
+        for pattern in PREVIOUS_DEPENDENCIES:
+            op.execute(
+                sa.text(
+                    """
+                    INSERT INTO analytics.materialized_view_dependencies
+                    (view_name, source_series_pattern)
+                    VALUES ('currency_strength_index', :pattern)
+                    """
+                ).bindparams(pattern=pattern)
+            )
+    op.execute("DROP VIEW IF EXISTS analytics.fx_cross_rates")
+    op.drop_index("idx_fx_usd_rates_currency_date", table_name="fx_usd_rates", schema="analytics")
+    op.drop_table("fx_usd_rates", schema="analytics")
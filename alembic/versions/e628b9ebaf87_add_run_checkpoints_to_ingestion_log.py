@@ -0,0 +1,102 @@
+"""add run checkpoints and stage timings to ingestion_log
+
+Each timeseries_cli run writes one run row (source_series_id NULL) plus one
+row per series, all sharing a run_id. Series rows carry the observation
+watermark, write counts and fetch/parse/write timings, which lets
+`--resume <run_id>` skip completed series and feeds the
+metadata.ingestion_run_stats throughput view.
+
+Revision ID: e628b9ebaf87
+Revises: e6c814de61a7
+Create Date: 2026-10-19 11:03:27.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e628b9ebaf87"
+down_revision: Union[str, Sequence[str], None] = "e6c814de61a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ingestion_log", sa.Column("run_id", postgresql.UUID(), nullable=True), schema="metadata"
+    )
+    op.add_column(
+        "ingestion_log", sa.Column("source_series_id", sa.Text(), nullable=True), schema="metadata"
+    )
+    op.add_column(
+        "ingestion_log", sa.Column("watermark", sa.Date(), nullable=True), schema="metadata"
+    )
+    op.add_column(
+        "ingestion_log",
+        sa.Column("records_unchanged", sa.Integer(), nullable=True),
+        schema="metadata",
+    )
+    for stage in ("fetch", "parse", "write"):
+        op.add_column(
+            "ingestion_log",
+            sa.Column(f"{stage}_ms", sa.Float(), nullable=True),
+            schema="metadata",
+        )
+
+    op.create_index(
+        "idx_ingestion_log_run",
+        "ingestion_log",
+        ["run_id", "source_id", "source_series_id"],
+        schema="metadata",
+    )
+
+    op.execute(
+        """
+        CREATE VIEW metadata.ingestion_run_stats AS
+        SELECT
+            run.run_id,
+            run.ingestion_start,
+            run.ingestion_end,
+            run.status,
+            COUNT(s.log_id) FILTER (WHERE s.status = 'success') AS series_succeeded,
+            COUNT(s.log_id) FILTER (WHERE s.status = 'failed') AS series_failed,
+            SUM(s.records_fetched) AS records_fetched,
+            SUM(s.records_inserted) AS records_inserted,
+            SUM(s.records_updated) AS records_updated,
+            SUM(s.records_unchanged) AS records_unchanged,
+            SUM(s.fetch_ms) AS fetch_ms,
+            SUM(s.parse_ms) AS parse_ms,
+            SUM(s.write_ms) AS write_ms,
+            SUM(s.records_fetched) / NULLIF(SUM(s.fetch_ms + s.parse_ms) / 1000.0, 0)
+                AS fetched_per_second,
+            SUM(s.records_fetched) / NULLIF(SUM(s.write_ms) / 1000.0, 0)
+                AS written_per_second
+        FROM metadata.ingestion_log run
+        LEFT JOIN metadata.ingestion_log s
+            ON s.run_id = run.run_id AND s.source_series_id IS NOT NULL
+        WHERE run.run_id IS NOT NULL AND run.source_series_id IS NULL
+        GROUP BY run.run_id, run.ingestion_start, run.ingestion_end, run.status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS metadata.ingestion_run_stats")
+    op.drop_index("idx_ingestion_log_run", table_name="ingestion_log", schema="metadata")
+    for column in (
+        "write_ms",
+        "parse_ms",
+        "fetch_ms",
+        "records_unchanged",
+        "watermark",
+        "source_series_id",
+        "run_id",
+    ):
+        op.drop_column("ingestion_log", column, schema="metadata")
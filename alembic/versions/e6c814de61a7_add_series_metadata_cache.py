@@ -0,0 +1,55 @@
+"""add series_metadata_cache for conditional metadata refresh
+
+Stores, per series, the source-reported last_updated value, a content hash of
+the metadata last written to series_metadata, and when it was last checked.
+The ingestion CLI uses it to skip redundant metadata API calls and UPSERTs.
+
+Revision ID: e6c814de61a7
+Revises: c545_ccaa_kg
+Create Date: 2026-10-19 09:12:44.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6c814de61a7"
+down_revision: Union[str, Sequence[str], None] = "c545_ccaa_kg"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "series_metadata_cache",
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("source_series_id", sa.Text(), nullable=False),
+        sa.Column("source_last_updated", sa.Text(), nullable=True),
+        sa.Column("content_hash", sa.Text(), nullable=False),
+        sa.Column(
+            "checked_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("source_id", "source_series_id"),
+        # Cache rows disappear with their series, so a cached entry always
+        # implies the series_metadata row exists.
+        sa.ForeignKeyConstraint(
+            ["source_id", "source_series_id"],
+            ["metadata.series_metadata.source_id", "metadata.series_metadata.source_series_id"],
+            name="fk_metadata_cache_series",
+            ondelete="CASCADE",
+        ),
+        schema="metadata",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("series_metadata_cache", schema="metadata")
@@ -0,0 +1,81 @@
+"""key economic_observations_view on (series_id, observation_date)
+
+Replaces the ROW_NUMBER() view_id, which forced a sort of the whole
+hypertable on every Directus page load, with a key computed from the row:
+series_id * 1000000 + days since 0001-01-01. An expression index on the
+hypertable serves view_id lookups and ordered pages, and without the window
+function and trailing ORDER BY the view is inlined so other filters reach
+the primary key index. See database/economic_observations_view.sql.
+
+Revision ID: eb256617afcd
+Revises: c3ab145994ab
+Create Date: 2026-10-19 14:48:31.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "eb256617afcd"
+down_revision: Union[str, Sequence[str], None] = "c3ab145994ab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VIEW_COLUMNS = """
+    eo.series_id,
+    eo.observation_date,
+    eo.value,
+    eo.quality_flag,
+    sm.series_name,
+    sm.source_series_id,
+    sm.geography,
+    sm.units,
+    sm.frequency,
+    sm.seasonal_adjustment,
+    ds.source_name
+FROM timeseries.economic_observations eo
+JOIN metadata.series_metadata sm ON eo.series_id = sm.series_id
+JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
+WHERE sm.is_active = TRUE
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_obs_view_id
+        ON timeseries.economic_observations (
+            (series_id::bigint * 1000000 + (observation_date - DATE '0001-01-01'))
+        )
+        """
+    )
+    op.execute("DROP VIEW IF EXISTS analytics.economic_observations_view")
+    op.execute(
+        f"""
+        CREATE VIEW analytics.economic_observations_view AS
+        SELECT
+            eo.series_id::bigint * 1000000 + (eo.observation_date - DATE '0001-01-01')
+                AS view_id,
+        {VIEW_COLUMNS}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS analytics.economic_observations_view")
+    op.execute(
+        f"""
+        CREATE VIEW analytics.economic_observations_view AS
+        SELECT
+            ROW_NUMBER() OVER (ORDER BY eo.observation_date DESC, eo.series_id) AS view_id,
+        {VIEW_COLUMNS}
+        ORDER BY eo.observation_date DESC, eo.series_id
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS timeseries.idx_obs_view_id")
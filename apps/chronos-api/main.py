@@ -1,13 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from chronos.api.routers import economic, geo
+from chronos.analytics.fx import FXRatePublisher, fx_store
+from chronos.api.routers import economic, fx, geo
+from chronos.api.series_store import SeriesChangeListener, series_store
 from chronos.config.settings import settings
+from chronos.database.connection import get_db_session
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keeps analytics.fx_usd_rates current for SQL consumers
+    fx_publisher = FXRatePublisher(get_db_session)
+
+    def invalidate_derived(series_id: int | None):
+        # Only results built from the changed series are dropped
+        if fx_publisher.is_fx_series(series_id):
+            fx_store.invalidate()
+        economic.invalidate_correlations(series_id)
+
+    listener = SeriesChangeListener(
+        settings.database_url,
+        series_store,
+        on_change=[invalidate_derived, fx_publisher.series_changed],
+    )
+    listener.start()
+    yield
+    listener.stop()
+    fx_publisher.stop()
+
 
 app = FastAPI(
     title="Chronos Intelligence API",
     description="Multi-modal intelligence engine (Graph + Vector + Time-Series)",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -31,6 +60,7 @@ app.add_middleware(
 # Include Routers
 app.include_router(geo.router)
 app.include_router(economic.router)
+app.include_router(fx.router)
 
 
 @app.get("/health")
@@ -40,6 +70,7 @@ async def health_check():
         "service": "chronos-api",
         "environment": settings.environment,
         "database": settings.database_host,
+        "series_store": series_store.stats(),
     }
 
 
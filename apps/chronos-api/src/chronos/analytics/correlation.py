@@ -0,0 +1,151 @@
+"""
+Cross-series correlation and covariance matrices
+
+Series are aligned with chronos.analytics.resample, optionally transformed
+to changes (trending levels correlate spuriously), and reduced to full
+N x N matrices with a handful of matrix products. Missing values are
+handled pairwise: each pair uses only the periods where both series have a
+value, which the mask products below count without looping over pairs.
+
+Rolling matrices use cumulative sums of the same products, so every window
+costs O(N^2) regardless of its length.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+import numpy as np
+
+TRANSFORMS = ("level", "diff", "pct_change")
+
+# Rolling output holds (periods x N x N) floats; refuse anything bigger
+MAX_ROLLING_CELLS = 2_000_000
+
+
+@dataclass
+class Comoments:
+    """Pairwise-complete moments for every pair of columns"""
+
+    n: np.ndarray  # periods where both series have a value
+    covariance: np.ndarray
+    correlation: np.ndarray
+
+
+def transform(values: np.ndarray, how: str) -> np.ndarray:
+    """Level, first difference or percent change down each column"""
+    if how == "level":
+        return values
+    if how == "diff":
+        return np.diff(values, axis=0)
+    if how == "pct_change":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = np.diff(values, axis=0) / values[:-1]
+        changes[~np.isfinite(changes)] = np.nan
+        return changes
+    raise ValueError(f"Unknown transform {how!r}; expected one of {TRANSFORMS}")
+
+
+def _finish(n, sum_x, sum_y, sum_xy, sum_xx, sum_yy, min_periods: int) -> Comoments:
+    """Covariance and correlation from pairwise sums (x varies by row, y by column)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = sum_x / n
+        mean_y = sum_y / n
+        covariance = (sum_xy - n * mean_x * mean_y) / (n - 1)
+        var_x = (sum_xx - n * mean_x**2) / (n - 1)
+        var_y = (sum_yy - n * mean_y**2) / (n - 1)
+        correlation = covariance / np.sqrt(var_x * var_y)
+
+    too_few = n < max(min_periods, 2)
+    covariance[too_few] = np.nan
+    correlation[too_few | ~np.isfinite(correlation)] = np.nan
+    # Rounding can push |r| a hair past 1
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+    return Comoments(n.astype(np.int64), covariance, correlation)
+
+
+def comoments(values: np.ndarray, min_periods: int = 3) -> Comoments:
+    """Pairwise-complete covariance and correlation of the columns of `values`"""
+    present = (~np.isnan(values)).astype(np.float64)
+    x = np.where(np.isnan(values), 0.0, values)
+
+    n = present.T @ present
+    # sum_x[i, j]: sum of column i over periods where column j is also present
+    sum_x = x.T @ present
+    sum_xx = (x * x).T @ present
+    return _finish(n, sum_x, sum_x.T, x.T @ x, sum_xx, sum_xx.T, min_periods)
+
+
+def rolling_comoments(values: np.ndarray, window: int, min_periods: int = 3) -> Comoments:
+    """comoments() over each trailing window; arrays gain a leading period axis
+
+    Entry k covers periods k .. k + window - 1.
+    """
+    periods, columns = values.shape
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    if periods < window:
+        empty = np.empty((0, columns, columns))
+        return Comoments(empty.astype(np.int64), empty, empty)
+    if periods * columns * columns > MAX_ROLLING_CELLS:
+        raise ValueError("Rolling window request too large; use fewer series or a shorter range")
+
+    present = (~np.isnan(values)).astype(np.float64)
+    x = np.where(np.isnan(values), 0.0, values)
+
+    def window_sums(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # Per-period outer products, summed over each window via cumulative sums
+        cumulative = np.cumsum(a[:, :, None] * b[:, None, :], axis=0)
+        cumulative = np.concatenate([np.zeros((1, columns, columns)), cumulative])
+        return cumulative[window:] - cumulative[:-window]
+
+    n = window_sums(present, present)
+    sum_x = window_sums(x, present)
+    sum_xx = window_sums(x * x, present)
+    return _finish(
+        n,
+        sum_x,
+        sum_x.transpose(0, 2, 1),
+        window_sums(x, x),
+        sum_xx,
+        sum_xx.transpose(0, 2, 1),
+        min_periods,
+    )
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]):
+        """Drop the entries whose key satisfies `predicate`"""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
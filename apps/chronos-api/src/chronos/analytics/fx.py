@@ -0,0 +1,372 @@
+"""
+FX cross-rate engine
+
+Builds a dense business-day x currency matrix of USD per unit of each
+currency from the FRED (DEX*) and Bank of Canada (FX*CAD) series, once, and
+derives every cross rate and N-day change from it with array arithmetic:
+
+- cross rate (quote per base) = usd[base] / usd[quote]
+- N-day change compares each date with the last business day on or before
+  the date N calendar days earlier (not N rows earlier)
+
+Each currency takes the first available source in CURRENCY_SOURCES order.
+Bank of Canada rates are quoted in CAD and converted through the USD/CAD
+column. Holidays are filled by carrying the last rate forward for up to
+MAX_FILL_DAYS business days; filled cells are reported as such.
+
+FXRateStore keeps the matrix in process memory and rebuilds it after `ttl`
+seconds. FXRatePublisher writes it to analytics.fx_usd_rates (which backs
+analytics.fx_cross_rates and analytics.currency_strength_index) whenever the
+series change listener reports new FX observations;
+`python -m chronos.analytics.fx` does the same once.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from chronos.analytics.resample import fetch_series
+
+logger = logging.getLogger(__name__)
+
+# How a source quotes its rate
+USD_PER_UNIT = "usd_per_unit"
+UNITS_PER_USD = "units_per_usd"
+CAD_PER_UNIT = "cad_per_unit"
+
+# Currency -> [(source_series_id, quotation)], preferred source first
+CURRENCY_SOURCES = {
+    "CAD": [("DEXCAUS", UNITS_PER_USD), ("FXUSDCAD", UNITS_PER_USD)],
+    "EUR": [("DEXUSEU", USD_PER_UNIT), ("FXEURCAD", CAD_PER_UNIT)],
+    "GBP": [("DEXUSUK", USD_PER_UNIT), ("FXGBPCAD", CAD_PER_UNIT)],
+    "AUD": [("DEXUSAL", USD_PER_UNIT), ("FXAUDCAD", CAD_PER_UNIT)],
+    "NZD": [("DEXUSNZ", USD_PER_UNIT), ("FXNZDCAD", CAD_PER_UNIT)],
+    "JPY": [("DEXJPUS", UNITS_PER_USD), ("FXJPYCAD", CAD_PER_UNIT)],
+    "CHF": [("DEXSZUS", UNITS_PER_USD), ("FXCHFCAD", CAD_PER_UNIT)],
+    "CNY": [("DEXCHUS", UNITS_PER_USD), ("FXCNYCAD", CAD_PER_UNIT)],
+    "MXN": [("DEXMXUS", UNITS_PER_USD), ("FXMXNCAD", CAD_PER_UNIT)],
+    "INR": [("DEXINUS", UNITS_PER_USD), ("FXINRCAD", CAD_PER_UNIT)],
+    "KRW": [("DEXKOUS", UNITS_PER_USD), ("FXKRWCAD", CAD_PER_UNIT)],
+    "BRL": [("DEXBZUS", UNITS_PER_USD), ("FXBRLCAD", CAD_PER_UNIT)],
+    "ZAR": [("DEXSFUS", UNITS_PER_USD), ("FXZARCAD", CAD_PER_UNIT)],
+    "THB": [("DEXTHUS", UNITS_PER_USD)],
+    "MYR": [("DEXMAUS", UNITS_PER_USD)],
+}
+
+# metadata.data_sources names publishing each series family: the schema seeds
+# the short names, the ingestion CLI registers its plugins under the long ones.
+# Other sources may reuse the DEX/FX prefixes for unrelated series.
+SERIES_SOURCES = {
+    "DEX": ("FRED", "Federal Reserve Economic Data"),
+    "FX": ("VALET", "Bank of Canada Valet API"),
+}
+
+# Longest run of missing business days bridged by carrying the last rate forward
+MAX_FILL_DAYS = 5
+
+# Quiet period after the last FX change before analytics.fx_usd_rates is
+# rewritten; an ingestion run notifies once per series
+PUBLISH_DELAY = 30.0
+
+SOURCE_SERIES_SQL = text(
+    """
+    SELECT sm.source_series_id, sm.series_id
+    FROM metadata.series_metadata sm
+    JOIN metadata.data_sources ds ON ds.source_id = sm.source_id
+    JOIN unnest(CAST(:source_series_ids AS text[]), CAST(:source_names AS text[]))
+        AS wanted(source_series_id, source_name)
+        ON wanted.source_series_id = sm.source_series_id
+        AND wanted.source_name = ds.source_name
+"""
+)
+
+# Held until commit, so only one API process rewrites the table at a time
+PUBLISH_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('analytics.fx_usd_rates'))")
+
+DELETE_RATES_SQL = text("DELETE FROM analytics.fx_usd_rates")
+
+INSERT_RATES_SQL = text(
+    """
+    INSERT INTO analytics.fx_usd_rates (observation_date, currency, usd_per_unit, is_filled)
+    SELECT * FROM unnest(
+        CAST(:dates AS date[]),
+        CAST(:currencies AS text[]),
+        CAST(:rates AS double precision[]),
+        CAST(:filled AS boolean[])
+    )
+"""
+)
+
+
+@dataclass
+class FXMatrix:
+    """USD per unit of each currency on every business day"""
+
+    dates: np.ndarray  # datetime64[D], business days
+    currencies: list[str]  # includes USD (always 1.0)
+    usd: np.ndarray  # float64 (dates x currencies), NaN where unknown
+    filled: np.ndarray  # bool, True where the rate was carried forward
+
+    def index(self, currency: str) -> int:
+        try:
+            return self.currencies.index(currency.upper())
+        except ValueError:
+            raise ValueError(f"Unknown currency {currency!r}") from None
+
+    def rows(self, start=None, end=None) -> slice:
+        """Row slice for an inclusive date range"""
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(start, "D"))
+        hi = (
+            len(self.dates)
+            if end is None
+            else np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        )
+        return slice(lo, hi)
+
+    def row_on_or_before(self, dates: np.ndarray) -> np.ndarray:
+        """Row of the last business day on or before each date (-1 if none)"""
+        return np.searchsorted(self.dates, dates, side="right") - 1
+
+    def cross(self, base: str, quote: str) -> np.ndarray:
+        """Units of `quote` per unit of `base` on every date"""
+        return self.usd[:, self.index(base)] / self.usd[:, self.index(quote)]
+
+    def cross_matrix(self, row: int, columns: list[int] | None = None) -> np.ndarray:
+        """All cross rates on one date: [i, j] = units of currency j per unit of i"""
+        usd = self.usd[row] if columns is None else self.usd[row, columns]
+        return usd[:, None] / usd[None, :]
+
+    def change(self, days: int, rows: slice = slice(None)) -> np.ndarray:
+        """Fractional change of each USD rate versus `days` calendar days earlier
+
+        The change of any cross rate follows from these: quote per base moves
+        by (1 + change[base]) / (1 + change[quote]) - 1.
+        """
+        previous = self.row_on_or_before(self.dates[rows] - np.timedelta64(days, "D"))
+        past = np.where(previous[:, None] >= 0, self.usd[np.maximum(previous, 0)], np.nan)
+        return self.usd[rows] / past - 1
+
+
+def forward_fill(values: np.ndarray, limit: int) -> tuple[np.ndarray, np.ndarray]:
+    """Carry values forward over at most `limit` missing rows per column
+
+    Returns:
+        (filled values, mask of cells that were filled)
+    """
+    rows = np.arange(len(values))[:, None]
+    missing = np.isnan(values)
+    last_valid = np.maximum.accumulate(np.where(missing, -1, rows), axis=0)
+    reachable = (last_valid >= 0) & (rows - last_valid <= limit)
+    filled = np.where(
+        missing & reachable,
+        values[np.maximum(last_valid, 0), np.arange(values.shape[1])],
+        values,
+    )
+    return filled, missing & reachable
+
+
+def source_series(db: Session) -> dict[str, int]:
+    """Internal series_id of every configured FX series published by its expected source"""
+    wanted = [
+        (source_series_id, source_name)
+        for sources in CURRENCY_SOURCES.values()
+        for source_series_id, _ in sources
+        for prefix, source_names in SERIES_SOURCES.items()
+        if source_series_id.startswith(prefix)
+        for source_name in source_names
+    ]
+    rows = db.execute(
+        SOURCE_SERIES_SQL,
+        {
+            "source_series_ids": [source_series_id for source_series_id, _ in wanted],
+            "source_names": [source_name for _, source_name in wanted],
+        },
+    ).all()
+    return dict(rows)
+
+
+def build_matrix(db: Session) -> FXMatrix:
+    """Load every configured FX series and assemble the USD-normalized matrix"""
+    series_ids = source_series(db)
+    observations = fetch_series(db, series_ids.values())
+    by_source = {sid: observations[series_ids[sid]] for sid in series_ids}
+
+    loaded = [dates for dates, _ in by_source.values() if len(dates)]
+    if not loaded:
+        return FXMatrix(
+            np.array([], dtype="datetime64[D]"), ["USD"], np.empty((0, 1)), np.empty((0, 1), bool)
+        )
+
+    first = min(dates[0] for dates in loaded)
+    last = max(dates[-1] for dates in loaded)
+    calendar = np.arange(first, last + np.timedelta64(1, "D"))
+    grid = calendar[np.is_busday(calendar)]
+
+    def on_grid(source_series_id: str) -> np.ndarray:
+        column = np.full(len(grid), np.nan)
+        if source_series_id not in by_source:
+            return column
+        dates, values = by_source[source_series_id]
+        rows = np.searchsorted(grid, dates)
+        on_busday = (rows < len(grid)) & (grid[np.minimum(rows, len(grid) - 1)] == dates)
+        column[rows[on_busday]] = values[on_busday]
+        return column
+
+    def combine(sources, usd_per_cad=None) -> np.ndarray:
+        column = np.full(len(grid), np.nan)
+        for source_series_id, quotation in sources:
+            raw = on_grid(source_series_id)
+            with np.errstate(divide="ignore"):
+                if quotation == USD_PER_UNIT:
+                    usd = raw
+                elif quotation == UNITS_PER_USD:
+                    usd = 1.0 / raw
+                elif usd_per_cad is not None:
+                    usd = raw * usd_per_cad
+                else:
+                    continue
+            usd[~np.isfinite(usd) | (usd <= 0)] = np.nan
+            column = np.where(np.isnan(column), usd, column)
+        return column
+
+    # CAD first: Bank of Canada cross rates are converted through it
+    cad, _ = forward_fill(combine(CURRENCY_SOURCES["CAD"])[:, None], MAX_FILL_DAYS)
+    currencies = ["USD", *CURRENCY_SOURCES]
+    columns = [np.ones(len(grid))] + [
+        combine(sources, cad[:, 0]) for sources in CURRENCY_SOURCES.values()
+    ]
+    usd, filled = forward_fill(np.column_stack(columns), MAX_FILL_DAYS)
+
+    # Drop currencies with no data at all
+    present = ~np.all(np.isnan(usd), axis=0)
+    return FXMatrix(
+        grid,
+        [currency for currency, keep in zip(currencies, present, strict=True) if keep],
+        usd[:, present],
+        filled[:, present],
+    )
+
+
+def persist_matrix(db: Session, matrix: FXMatrix):
+    """Replace analytics.fx_usd_rates with the matrix's known cells"""
+    known = ~np.isnan(matrix.usd)
+    rows, columns = np.nonzero(known)
+    db.execute(DELETE_RATES_SQL)
+    db.execute(
+        INSERT_RATES_SQL,
+        {
+            "dates": np.datetime_as_string(matrix.dates[rows], unit="D").tolist(),
+            "currencies": np.asarray(matrix.currencies)[columns].tolist(),
+            "rates": matrix.usd[known].tolist(),
+            "filled": matrix.filled[known].tolist(),
+        },
+    )
+    db.commit()
+
+
+class FXRateStore:
+    """Process-wide FX matrix, rebuilt from the database after `ttl` seconds"""
+
+    def __init__(self, ttl: float = 900.0):
+        self.ttl = ttl
+        self._matrix: FXMatrix | None = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> FXMatrix:
+        with self._lock:
+            if self._matrix is None or time.monotonic() - self._built_at > self.ttl:
+                self._matrix = build_matrix(db)
+                self._built_at = time.monotonic()
+            return self._matrix
+
+    def invalidate(self):
+        with self._lock:
+            self._matrix = None
+
+
+class FXRatePublisher:
+    """Rewrites analytics.fx_usd_rates after FX observations change
+
+    `series_changed` is a SeriesChangeListener callback. A change to one of
+    the FX series (or None: anything may have changed) schedules a rewrite
+    once no further FX change arrived for `delay` seconds, so an ingestion
+    run rewrites the table once rather than once per series.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        delay: float = PUBLISH_DELAY,
+    ):
+        self.session_factory = session_factory
+        self.delay = delay
+        self._series_ids: set[int] | None = None  # unknown until the first publish
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def is_fx_series(self, series_id: int | None) -> bool:
+        """Whether a change to `series_id` (None: any series) can affect FX rates
+
+        Until the first publish has looked the FX series up, every series may.
+        """
+        known = self._series_ids
+        return series_id is None or known is None or series_id in known
+
+    def series_changed(self, series_id: int | None):
+        if not self.is_fx_series(series_id):
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self._publish_logged)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def publish(self) -> FXMatrix | None:
+        """Rebuild and store the matrix; None if another process is storing it"""
+        with self.session_factory() as db:
+            if not db.execute(PUBLISH_LOCK_SQL).scalar():
+                db.rollback()
+                return None
+            self._series_ids = set(source_series(db).values())
+            matrix = build_matrix(db)
+            persist_matrix(db, matrix)
+        return matrix
+
+    def stop(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _publish_logged(self):
+        try:
+            matrix = self.publish()
+        except Exception as e:
+            logger.error(f"Could not publish FX rates: {e}", exc_info=True)
+            return
+        if matrix is not None:
+            logger.info(f"Published FX rates for {len(matrix.currencies)} currencies")
+
+
+fx_store = FXRateStore()
+
+
+if __name__ == "__main__":
+    from chronos.database.connection import get_db_session
+
+    fx = FXRatePublisher(get_db_session).publish()
+    if fx is None:
+        print("⚠️  Another process is writing analytics.fx_usd_rates")
+    else:
+        print(
+            f"✅ Stored {int((~np.isnan(fx.usd)).sum()):,} FX rates for {len(fx.currencies)} currencies"
+        )
@@ -0,0 +1,234 @@
+"""
+Mixed-frequency alignment and resampling
+
+Aligns any set of series onto one calendar at a target frequency so daily
+FX, monthly CPI and quarterly GDP can be compared row by row. Each series is
+aggregated into target periods with NumPy reductions over period keys
+(datetime64 unit casts, no per-row Python), placed on a shared period grid,
+and optionally filled:
+
+- locf: carry the last observation forward
+- linear: interpolate between observations (no extrapolation)
+
+Periods are labelled by their first day, matching how monthly, quarterly
+and annual observations are dated in timeseries.economic_observations.
+Lower-frequency series placed on a higher-frequency grid occupy the period
+their observation falls in and rely on `fill` for the rest.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+FREQUENCIES = ("D", "W", "M", "Q", "A")
+AGGREGATIONS = ("last", "first", "mean", "sum")
+FILLS = ("locf", "linear")
+
+# 1970-01-05 was a Monday: weeks run Monday to Sunday
+_MONDAY_OFFSET = 4
+
+OBSERVATIONS_SQL = text(
+    """
+    SELECT series_id, observation_date, CAST(value AS FLOAT) AS value
+    FROM timeseries.economic_observations
+    WHERE series_id = ANY(:series_ids)
+    AND value IS NOT NULL
+    AND (CAST(:start_date AS DATE) IS NULL OR observation_date >= CAST(:start_date AS DATE))
+    AND (CAST(:end_date AS DATE) IS NULL OR observation_date <= CAST(:end_date AS DATE))
+    ORDER BY series_id, observation_date
+"""
+)
+
+
+@dataclass
+class AlignedSeries:
+    """Series on a shared period grid: values[i, j] is series j in period i"""
+
+    frequency: str
+    dates: np.ndarray  # datetime64[D], first day of each period
+    series_ids: list
+    values: np.ndarray  # float64, NaN where no value
+
+    def column(self, series_id) -> np.ndarray:
+        return self.values[:, self.series_ids.index(series_id)]
+
+
+def period_keys(dates: np.ndarray, frequency: str) -> np.ndarray:
+    """Integer period number of each date (consecutive periods differ by 1)"""
+    days = dates.astype("datetime64[D]")
+    if frequency == "D":
+        return days.astype(np.int64)
+    if frequency == "W":
+        return (days.astype(np.int64) - _MONDAY_OFFSET) // 7
+    if frequency == "M":
+        return days.astype("datetime64[M]").astype(np.int64)
+    if frequency == "Q":
+        return days.astype("datetime64[M]").astype(np.int64) // 3
+    if frequency == "A":
+        return days.astype("datetime64[Y]").astype(np.int64)
+    raise ValueError(f"Unknown frequency {frequency!r}; expected one of {FREQUENCIES}")
+
+
+def period_starts(keys: np.ndarray, frequency: str) -> np.ndarray:
+    """First day of each period key (inverse of period_keys)"""
+    if frequency == "D":
+        return keys.astype("datetime64[D]")
+    if frequency == "W":
+        return (keys * 7 + _MONDAY_OFFSET).astype("datetime64[D]")
+    if frequency == "M":
+        return keys.astype("datetime64[M]").astype("datetime64[D]")
+    if frequency == "Q":
+        return (keys * 3).astype("datetime64[M]").astype("datetime64[D]")
+    if frequency == "A":
+        return keys.astype("datetime64[Y]").astype("datetime64[D]")
+    raise ValueError(f"Unknown frequency {frequency!r}; expected one of {FREQUENCIES}")
+
+
+def aggregate(
+    dates: np.ndarray, values: np.ndarray, frequency: str, how: str = "last"
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce one date-sorted series to (period keys, aggregated values)
+
+    NaN observations (numeric 'NaN' survives the NOT NULL filter) are treated
+    as missing, so a period holding only NaNs is a gap on the grid.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation {how!r}; expected one of {AGGREGATIONS}")
+    valid = ~np.isnan(values)
+    dates, values = dates[valid], values[valid]
+    if not len(dates):
+        return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+
+    keys = period_keys(dates, frequency)
+    # Dates are sorted, so each period is a contiguous run of keys
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+    if how == "first":
+        reduced = values[starts]
+    elif how == "last":
+        reduced = values[np.r_[starts[1:] - 1, len(values) - 1]]
+    else:
+        reduced = np.add.reduceat(values, starts)
+        if how == "mean":
+            reduced = reduced / np.diff(np.r_[starts, len(values)])
+    return keys[starts], reduced
+
+
+def fill_locf(values: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN value down each column"""
+    rows = np.arange(len(values))[:, None]
+    last_valid = np.maximum.accumulate(np.where(np.isnan(values), -1, rows), axis=0)
+    filled = values[np.maximum(last_valid, 0), np.arange(values.shape[1])]
+    filled[last_valid < 0] = np.nan
+    return filled
+
+
+def fill_linear(values: np.ndarray) -> np.ndarray:
+    """Linearly interpolate interior NaNs in each column"""
+    filled = values.copy()
+    rows = np.arange(len(values))
+    for j in range(values.shape[1]):
+        valid = ~np.isnan(values[:, j])
+        if valid.sum() < 2:
+            continue
+        known = rows[valid]
+        interior = (rows > known[0]) & (rows < known[-1]) & ~valid
+        filled[interior, j] = np.interp(rows[interior], known, values[valid, j])
+    return filled
+
+
+def align(
+    series: Mapping,
+    frequency: str,
+    how: str = "last",
+    fill: str | None = None,
+) -> AlignedSeries:
+    """Aggregate each series to `frequency` and place them on one period grid
+
+    Args:
+        series: series_id -> (dates datetime64[D], values float64), each sorted by date
+        frequency: One of FREQUENCIES
+        how: Aggregation within a period, one of AGGREGATIONS
+        fill: None, or one of FILLS
+    """
+    if fill is not None and fill not in FILLS:
+        raise ValueError(f"Unknown fill {fill!r}; expected one of {FILLS}")
+
+    series_ids = list(series)
+    aggregated = [aggregate(*series[sid], frequency, how) for sid in series_ids]
+
+    nonempty = [keys for keys, _ in aggregated if len(keys)]
+    if not nonempty:
+        return AlignedSeries(
+            frequency,
+            np.array([], dtype="datetime64[D]"),
+            series_ids,
+            np.empty((0, len(series_ids))),
+        )
+
+    first = min(keys[0] for keys in nonempty)
+    last = max(keys[-1] for keys in nonempty)
+    grid = np.arange(first, last + 1)
+
+    values = np.full((len(grid), len(series_ids)), np.nan)
+    for j, (keys, reduced) in enumerate(aggregated):
+        values[keys - first, j] = reduced
+
+    if fill == "locf":
+        values = fill_locf(values)
+    elif fill == "linear":
+        values = fill_linear(values)
+
+    return AlignedSeries(frequency, period_starts(grid, frequency), series_ids, values)
+
+
+def fetch_series(
+    db: Session,
+    series_ids: Iterable[int],
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Load observations for several series in one query as NumPy arrays"""
+    series_ids = list(series_ids)
+    rows = db.execute(
+        OBSERVATIONS_SQL,
+        {"series_ids": series_ids, "start_date": start_date, "end_date": end_date},
+    ).all()
+
+    result = {sid: (np.array([], dtype="datetime64[D]"), np.array([])) for sid in series_ids}
+    if not rows:
+        return result
+
+    ids, dates, values = (np.asarray(column) for column in zip(*rows, strict=True))
+    dates = dates.astype("datetime64[D]")
+    values = values.astype(np.float64)
+    # Rows are ordered by series_id, so each series is one contiguous slice
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+    for start, end in zip(starts, ends, strict=True):
+        result[int(ids[start])] = (dates[start:end], values[start:end])
+    return result
+
+
+def resample(
+    db: Session,
+    series_ids: Iterable[int],
+    frequency: str,
+    how: str = "last",
+    fill: str | None = None,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+) -> AlignedSeries:
+    """Fetch and align series from the database"""
+    return align(fetch_series(db, series_ids, start_date, end_date), frequency, how, fill)
+
+
+def to_json_values(values: np.ndarray) -> list:
+    """Array to a list with NaN as None (JSON null)"""
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
@@ -0,0 +1,58 @@
+"""
+Query embeddings for semantic series search
+
+Uses the same sentence-transformers model that generate_embeddings.py uses
+to fill metadata.series_metadata.description_embedding, so query vectors
+and stored vectors share one space. sentence-transformers is optional (the
+`semantic` extra): when it is not installed, or the model cannot be loaded
+(e.g. offline with an empty model cache), embed_query() returns None and
+search falls back to trigram matching only until the process restarts.
+"""
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Distinct normalized queries kept in memory (~2 KB per 384-dim vector literal)
+QUERY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def get_model():
+    """Load the embedding model once per process, or None if unavailable
+
+    Failures are cached as None like a missing package, so a model that
+    cannot be loaded is reported once rather than retried on every search.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("sentence-transformers not installed - semantic search disabled")
+        return None
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception as e:
+        logger.error(f"Could not load {EMBEDDING_MODEL} - semantic search disabled: {e}")
+        return None
+
+
+def normalize_query(query: str) -> str:
+    """Collapse case and whitespace so equivalent queries share a cache entry"""
+    return " ".join(query.lower().split())
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _embed(normalized: str) -> str | None:
+    model = get_model()
+    if model is None:
+        return None
+    embedding = model.encode(normalized)
+    return "[" + ",".join(map(repr, embedding.tolist())) + "]"
+
+
+def embed_query(query: str) -> str | None:
+    """pgvector literal for a search query, cached by normalized text"""
+    return _embed(normalize_query(query))
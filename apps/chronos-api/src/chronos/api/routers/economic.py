@@ -1,14 +1,83 @@
 import logging
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from chronos.analytics.correlation import (
+    TRANSFORMS,
+    TTLCache,
+    comoments,
+    rolling_comoments,
+    transform,
+)
+from chronos.analytics.resample import (
+    AGGREGATIONS,
+    FILLS,
+    FREQUENCIES,
+    resample,
+    to_json_values,
+)
 from chronos.api.dependencies import get_db
+from chronos.api.embeddings import embed_query
+from chronos.api.series_store import BUCKET_FREQUENCIES, series_store
 
 router = APIRouter(prefix="/api/economic", tags=["economic"])
 logger = logging.getLogger(__name__)
 
+# Correlation results keyed by request signature; observations change at most
+# a few times a day, so a short TTL keeps heatmaps fresh enough
+correlation_cache = TTLCache(maxsize=256, ttl=600)
+MAX_CORRELATION_SERIES = 200
+
+
+def invalidate_correlations(series_id: int | None):
+    """Drop cached correlations involving `series_id` (None: all of them)
+
+    Keys start with the requested series IDs, see correlation().
+    """
+    if series_id is None:
+        correlation_cache.clear()
+    else:
+        correlation_cache.discard_where(lambda key: series_id in key[0])
+
+
+# Each ranking contributes at most this many candidates before paging
+MAX_SEARCH_CANDIDATES = 1000
+
+LEXICAL_CANDIDATES = """
+    lexical AS (
+        SELECT
+            series_id,
+            GREATEST(
+                word_similarity(:q, series_name),
+                COALESCE(word_similarity(:q, series_description), 0)
+            ) AS lexical_score
+        FROM metadata.series_metadata
+        -- <% is the GIN-indexable form of word_similarity() >= threshold
+        WHERE is_active = TRUE AND (:q <% series_name OR :q <% series_description)
+        ORDER BY lexical_score DESC
+        LIMIT :candidates
+    )
+"""
+
+SEMANTIC_CANDIDATES = """
+    semantic AS (
+        SELECT series_id, 1 - distance AS semantic_score
+        FROM (
+            -- Bare ORDER BY <=> LIMIT so the ivfflat index drives the scan
+            SELECT series_id, is_active,
+                   description_embedding <=> CAST(:embedding AS vector) AS distance
+            FROM metadata.series_metadata
+            WHERE description_embedding IS NOT NULL
+            ORDER BY description_embedding <=> CAST(:embedding AS vector)
+            LIMIT :candidates
+        ) nearest
+        WHERE is_active = TRUE
+    )
+"""
+
 
 @router.get("/series")
 async def get_series(db: Session = Depends(get_db)):
@@ -30,6 +99,90 @@ async def get_series(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/search")
+def search_series(
+    q: str = Query(..., min_length=2, max_length=200, description="Search text"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_CANDIDATES),
+    semantic_weight: float = Query(
+        0.6, ge=0.0, le=1.0, description="Share of the score from vector similarity"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Ranks active series by a hybrid of trigram and embedding similarity.
+
+    Candidates come from the trigram GIN indexes (series_name and
+    series_description) and the ivfflat description_embedding index; the
+    union is scored as semantic_weight * cosine similarity +
+    (1 - semantic_weight) * word similarity. Falls back to trigram-only
+    ranking when no embedding model is available.
+
+    Declared sync so query encoding runs in the threadpool, not the event loop.
+    """
+    try:
+        candidates = min(offset + limit + 1, MAX_SEARCH_CANDIDATES)
+        params = {"q": q, "candidates": candidates, "limit": limit + 1, "offset": offset}
+
+        embedding = embed_query(q) if semantic_weight > 0 else None
+        if embedding is not None:
+            params.update(embedding=embedding, semantic_weight=semantic_weight)
+            ctes = f"{LEXICAL_CANDIDATES}, {SEMANTIC_CANDIDATES},"
+            scored = """
+                scored AS (
+                    SELECT
+                        series_id,
+                        COALESCE(l.lexical_score, 0) AS lexical_score,
+                        COALESCE(s.semantic_score, 0) AS semantic_score,
+                        :semantic_weight * COALESCE(s.semantic_score, 0)
+                            + (1 - :semantic_weight) * COALESCE(l.lexical_score, 0) AS score
+                    FROM lexical l
+                    FULL JOIN semantic s USING (series_id)
+                )
+            """
+            mode = "hybrid"
+        else:
+            ctes = f"{LEXICAL_CANDIDATES},"
+            scored = """
+                scored AS (
+                    SELECT series_id, lexical_score, NULL::float AS semantic_score,
+                           lexical_score AS score
+                    FROM lexical
+                )
+            """
+            mode = "lexical"
+
+        query = text(
+            f"""
+            WITH {ctes} {scored}
+            SELECT sm.series_id, sm.series_name, sm.geography, sm.units, sm.unit_type,
+                   sm.display_units, sm.frequency, ds.source_name,
+                   CAST(sc.score AS FLOAT) AS score,
+                   CAST(sc.lexical_score AS FLOAT) AS lexical_score,
+                   CAST(sc.semantic_score AS FLOAT) AS semantic_score
+            FROM scored sc
+            JOIN metadata.series_metadata sm ON sm.series_id = sc.series_id
+            JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
+            ORDER BY sc.score DESC, sm.series_name ASC, sm.series_id ASC
+            LIMIT :limit OFFSET :offset;
+        """
+        )
+        rows = [dict(row) for row in db.execute(query, params).mappings().all()]
+
+        return {
+            "query": q,
+            "mode": mode,
+            "limit": limit,
+            "offset": offset,
+            # One extra row is fetched to know whether another page exists
+            "has_more": len(rows) > limit,
+            "results": rows[:limit],
+        }
+    except Exception as e:
+        logger.error(f"Error searching series: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/geographies")
 async def get_geographies(db: Session = Depends(get_db)):
     """Fetches all unique geographies."""
@@ -70,6 +223,14 @@ async def get_timeseries(
         if not series_id_list:
             return []
 
+        geo_list = [g.strip() for g in geographies.split(",") if g.strip()] if geographies else []
+
+        # Hot series are answered from memory; see chronos.api.series_store
+        if series_store.enabled:
+            return stored_timeseries(
+                db, series_id_list, start_date, end_date, geo_list, bucket_interval
+            )
+
         where_clauses = ["eo.series_id = ANY(:series_ids)"]
         params = {"series_ids": series_id_list, "bucket_interval": bucket_interval}
 
@@ -81,11 +242,9 @@ async def get_timeseries(
             where_clauses.append("eo.observation_date <= CAST(:end_date AS DATE)")
             params["end_date"] = end_date
 
-        if geographies:
-            geo_list = [g.strip() for g in geographies.split(",") if g.strip()]
-            if geo_list:
-                where_clauses.append("sm.geography = ANY(:geographies)")
-                params["geographies"] = geo_list
+        if geo_list:
+            where_clauses.append("sm.geography = ANY(:geographies)")
+            params["geographies"] = geo_list
 
         query_sql = f"""
             SELECT
@@ -126,3 +285,162 @@ async def get_timeseries(
     except Exception as e:
         logger.error(f"Error fetching timeseries data: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def stored_timeseries(
+    db: Session,
+    series_ids: list[int],
+    start_date: str | None,
+    end_date: str | None,
+    geographies: list[str],
+    bucket_interval: str,
+) -> list[dict]:
+    """/timeseries rows computed from the series store instead of time_bucket SQL"""
+    frequency = BUCKET_FREQUENCIES[bucket_interval]
+    stored = series_store.get_many(db, series_ids)
+
+    rows = []
+    for series_id in dict.fromkeys(series_ids):
+        entry = stored.get(series_id)
+        if entry is None or (geographies and entry.metadata["geography"] not in geographies):
+            continue
+        times, means = entry.bucket_means(frequency, start_date, end_date)
+        metadata = entry.metadata
+        for time, value in zip(
+            np.datetime_as_string(times, unit="D").tolist(),
+            to_json_values(means),
+            strict=True,
+        ):
+            rows.append(
+                {
+                    "time": time,
+                    "series_id": series_id,
+                    "value": value,
+                    "series_name": metadata["series_name"],
+                    "units": metadata["units"],
+                    "unit_type": metadata["unit_type"],
+                    "display_units": metadata["display_units"],
+                }
+            )
+
+    # Stable, so series keep request order within a time
+    rows.sort(key=lambda row: row["time"])
+    return rows
+
+
+def parse_series_ids(series_ids: str) -> list[int]:
+    """Comma-separated series IDs to a de-duplicated list, preserving order"""
+    return list(dict.fromkeys(int(sid) for sid in series_ids.split(",") if sid.strip().isdigit()))
+
+
+@router.get("/resample")
+def get_resampled(
+    series_ids: str = Query(..., description="Comma-separated list of series IDs"),
+    frequency: str = Query("M", description=f"Target frequency: {', '.join(FREQUENCIES)}"),
+    how: str = Query("last", description=f"Aggregation: {', '.join(AGGREGATIONS)}"),
+    fill: str | None = Query(None, description=f"Fill method: {', '.join(FILLS)}"),
+    start_date: str | None = Query(None, alias="start"),
+    end_date: str | None = Query(None, alias="end"),
+    db: Session = Depends(get_db),
+):
+    """
+    Aligns several series onto one calendar at the target frequency.
+
+    Returns one shared list of period start dates and, per series, values
+    aligned to it (null where a series has no value for a period).
+    """
+    series_id_list = parse_series_ids(series_ids)
+    if not series_id_list:
+        return {"frequency": frequency, "dates": [], "series": []}
+
+    try:
+        aligned = resample(db, series_id_list, frequency, how, fill, start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error resampling series: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return {
+        "frequency": aligned.frequency,
+        "how": how,
+        "fill": fill,
+        "dates": np.datetime_as_string(aligned.dates, unit="D").tolist(),
+        "series": [
+            {"series_id": series_id, "values": to_json_values(aligned.values[:, j])}
+            for j, series_id in enumerate(aligned.series_ids)
+        ],
+    }
+
+
+@router.get("/correlation")
+def get_correlation(
+    series_ids: str = Query(..., description="Comma-separated list of series IDs"),
+    frequency: str = Query("M", description=f"Alignment frequency: {', '.join(FREQUENCIES)}"),
+    transform_name: str = Query(
+        "pct_change", alias="transform", description=f"Applied first: {', '.join(TRANSFORMS)}"
+    ),
+    fill: str | None = Query(None, description=f"Fill method: {', '.join(FILLS)}"),
+    window: int | None = Query(None, ge=2, description="Rolling window in periods"),
+    min_periods: int = Query(3, ge=2, description="Fewer overlapping periods gives null"),
+    start_date: str | None = Query(None, alias="start"),
+    end_date: str | None = Query(None, alias="end"),
+    db: Session = Depends(get_db),
+):
+    """
+    Correlation and covariance matrices across series aligned to one frequency.
+
+    Pairs are computed over the periods where both series have a value. With
+    `window`, rolling matrices are returned per window end date as well.
+    Results are cached by request signature.
+    """
+    series_id_list = parse_series_ids(series_ids)
+    if len(series_id_list) > MAX_CORRELATION_SERIES:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_CORRELATION_SERIES} series per request"
+        )
+
+    key = (
+        tuple(series_id_list),
+        frequency,
+        transform_name,
+        fill,
+        window,
+        min_periods,
+        start_date,
+        end_date,
+    )
+
+    def compute():
+        aligned = resample(db, series_id_list, frequency, "last", fill, start_date, end_date)
+        values = transform(aligned.values, transform_name)
+        # A change is dated at the period it ends in
+        dates = aligned.dates[len(aligned.dates) - len(values) :]
+
+        full = comoments(values, min_periods)
+        result = {
+            "series_ids": aligned.series_ids,
+            "frequency": frequency,
+            "transform": transform_name,
+            "start": str(dates[0]) if len(dates) else None,
+            "end": str(dates[-1]) if len(dates) else None,
+            "observations": full.n.tolist(),
+            "correlation": to_json_values(full.correlation),
+            "covariance": to_json_values(full.covariance),
+        }
+        if window:
+            rolling = rolling_comoments(values, window, min_periods)
+            result["rolling"] = {
+                "window": window,
+                "dates": np.datetime_as_string(dates[window - 1 :], unit="D").tolist(),
+                "correlation": to_json_values(rolling.correlation),
+            }
+        return result
+
+    try:
+        return correlation_cache.get_or_compute(key, compute)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error computing correlation: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
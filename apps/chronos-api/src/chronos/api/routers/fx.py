@@ -0,0 +1,155 @@
+import logging
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from chronos.analytics.fx import FXMatrix, fx_store
+from chronos.analytics.resample import to_json_values
+from chronos.api.dependencies import get_db
+
+router = APIRouter(prefix="/api/fx", tags=["fx"])
+logger = logging.getLogger(__name__)
+
+
+def load_matrix(db: Session) -> FXMatrix:
+    try:
+        return fx_store.get(db)
+    except Exception as e:
+        logger.error(f"Error building FX matrix: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def currency_columns(matrix: FXMatrix, currencies: str | None) -> list[int]:
+    """Column indexes for a comma-separated currency list (all when omitted)"""
+    if not currencies:
+        return list(range(len(matrix.currencies)))
+    try:
+        return [matrix.index(c.strip()) for c in currencies.split(",") if c.strip()]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def row_for_date(matrix: FXMatrix, date: str | None) -> int:
+    """Row of the last business day on or before `date` (latest when omitted)"""
+    if date is None:
+        row = len(matrix.dates) - 1
+    else:
+        try:
+            row = int(matrix.row_on_or_before(np.datetime64(date, "D")))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid date {date!r}") from e
+    if row < 0:
+        raise HTTPException(status_code=404, detail="No FX rates on or before this date")
+    return row
+
+
+@router.get("/currencies")
+def get_currencies(db: Session = Depends(get_db)):
+    """
+    Currencies in the FX matrix and the date range it covers.
+    """
+    matrix = load_matrix(db)
+    has_rates = len(matrix.dates) > 0
+    return {
+        "currencies": matrix.currencies,
+        "start": str(matrix.dates[0]) if has_rates else None,
+        "end": str(matrix.dates[-1]) if has_rates else None,
+    }
+
+
+@router.get("/rates")
+def get_cross_rates(
+    base: str = Query(..., description="Currency being priced, e.g. EUR"),
+    quote: str = Query("USD", description="Currency the price is expressed in, e.g. CAD"),
+    start_date: str | None = Query(None, alias="start"),
+    end_date: str | None = Query(None, alias="end"),
+    db: Session = Depends(get_db),
+):
+    """
+    Daily history of one cross rate: units of `quote` per unit of `base`.
+
+    Any pair is derived from the USD-normalized matrix, so pairs that no
+    source quotes directly (e.g. GBP/JPY) are available too. `filled` marks
+    business days where either leg was carried forward over a holiday.
+    """
+    matrix = load_matrix(db)
+    try:
+        base_column, quote_column = matrix.index(base), matrix.index(quote)
+        rows = matrix.rows(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    rates = matrix.cross(base, quote)[rows]
+    filled = matrix.filled[rows][:, [base_column, quote_column]].any(axis=1)
+    return {
+        "base": base.upper(),
+        "quote": quote.upper(),
+        "dates": np.datetime_as_string(matrix.dates[rows], unit="D").tolist(),
+        "rates": to_json_values(rates),
+        "filled": filled.tolist(),
+    }
+
+
+@router.get("/matrix")
+def get_cross_matrix(
+    currencies: str | None = Query(None, description="Comma-separated currencies (default all)"),
+    date: str | None = Query(None, description="ISO date (default latest)"),
+    change_days: int = Query(30, ge=1, le=3660, description="Lookback in calendar days"),
+    db: Session = Depends(get_db),
+):
+    """
+    Every cross rate between the selected currencies on one date, with its
+    change over `change_days` calendar days.
+
+    rates[i][j] is units of currencies[j] per unit of currencies[i]; the
+    date is the last business day on or before `date`.
+    """
+    matrix = load_matrix(db)
+    columns = currency_columns(matrix, currencies)
+    row = row_for_date(matrix, date)
+
+    growth = 1 + matrix.change(change_days, slice(row, row + 1))[0, columns]
+    return {
+        "date": str(matrix.dates[row]),
+        "currencies": [matrix.currencies[j] for j in columns],
+        "rates": to_json_values(matrix.cross_matrix(row, columns)),
+        "change_days": change_days,
+        "changes": to_json_values(growth[:, None] / growth[None, :] - 1),
+    }
+
+
+@router.get("/changes")
+def get_changes(
+    days: int = Query(30, ge=1, le=3660, description="Lookback in calendar days"),
+    base: str = Query("USD", description="Currency the changes are measured against"),
+    currencies: str | None = Query(None, description="Comma-separated currencies (default all)"),
+    start_date: str | None = Query(None, alias="start"),
+    end_date: str | None = Query(None, alias="end"),
+    db: Session = Depends(get_db),
+):
+    """
+    Daily N-day change of each currency's value in `base`.
+
+    Each date is compared with the last business day on or before the date
+    `days` calendar days earlier; positive means the currency strengthened.
+    """
+    matrix = load_matrix(db)
+    columns = currency_columns(matrix, currencies)
+    try:
+        base_column = matrix.index(base)
+        rows = matrix.rows(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    growth = 1 + matrix.change(days, rows)
+    changes = growth[:, columns] / growth[:, [base_column]] - 1
+    return {
+        "base": base.upper(),
+        "days": days,
+        "dates": np.datetime_as_string(matrix.dates[rows], unit="D").tolist(),
+        "series": [
+            {"currency": matrix.currencies[j], "changes": to_json_values(changes[:, k])}
+            for k, j in enumerate(columns)
+        ],
+    }
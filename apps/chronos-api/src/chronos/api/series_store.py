@@ -0,0 +1,315 @@
+"""
+In-process store of hot series
+
+Dashboards request the same few hundred series over and over. SeriesStore
+keeps each requested series' full history in memory as NumPy date/value
+arrays (plus the metadata /timeseries returns), evicting the least recently
+used series once the store exceeds its byte budget. Requests for stored
+series are answered without touching the database.
+
+Entries are only trusted while SeriesChangeListener is LISTENing on
+SERIES_CHANGED_CHANNEL, where ingestion publishes the series_id of every
+series that gained new or revised observations or whose metadata was
+written (timeseries_cli and backfill_metadata). Each message drops that
+series; if the connection is lost the store is cleared and bypassed
+until the listener has reconnected. A silent connection is probed with a
+round trip on every idle poll, and TCP keepalives bound how long a
+half-open connection can go unnoticed.
+"""
+
+import logging
+import select
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from chronos.analytics.resample import period_keys, period_starts
+from chronos.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Must match chronos.ingestion.timeseries_cli.SERIES_CHANGED_CHANNEL
+SERIES_CHANGED_CHANNEL = "chronos_series_changed"
+
+# libpq settings for the LISTEN connection: a dead peer fails the idle probe
+# within about keepalives_idle + keepalives_interval * keepalives_count seconds
+LISTEN_CONNECT_OPTIONS = {
+    "connect_timeout": 10,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+PROBE_SQL = "SELECT 1"
+
+# /timeseries bucket intervals -> resample frequencies (time_bucket weeks start on Monday)
+BUCKET_FREQUENCIES = {
+    "1 day": "D",
+    "1 week": "W",
+    "1 month": "M",
+    "1 quarter": "Q",
+    "1 year": "A",
+}
+
+# Rough size of an entry beyond its arrays (metadata dict, bookkeeping)
+ENTRY_OVERHEAD_BYTES = 1024
+
+METADATA_SQL = text(
+    """
+    SELECT series_id, series_name, units, unit_type, display_units, geography
+    FROM metadata.series_metadata
+    WHERE series_id = ANY(:series_ids)
+"""
+)
+
+OBSERVATIONS_SQL = text(
+    """
+    SELECT series_id, observation_date, CAST(value AS FLOAT) AS value
+    FROM timeseries.economic_observations
+    WHERE series_id = ANY(:series_ids)
+    ORDER BY series_id, observation_date
+"""
+)
+
+
+@dataclass
+class StoredSeries:
+    """Full history of one series; values are NaN where the stored value is NULL"""
+
+    series_id: int
+    metadata: dict
+    dates: np.ndarray  # datetime64[D], sorted
+    values: np.ndarray  # float64
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.values.nbytes + ENTRY_OVERHEAD_BYTES
+
+    def bucket_means(self, frequency: str, start_date=None, end_date=None):
+        """Mean of the non-null values in each period (NaN if there are none)
+
+        Returns:
+            (period start dates, means) for the periods holding observations
+            within [start_date, end_date]
+        """
+        lo = 0 if start_date is None else np.searchsorted(self.dates, np.datetime64(start_date))
+        hi = (
+            len(self.dates)
+            if end_date is None
+            else np.searchsorted(self.dates, np.datetime64(end_date), side="right")
+        )
+        dates, values = self.dates[lo:hi], self.values[lo:hi]
+        if not len(dates):
+            return dates, values
+
+        keys = period_keys(dates, frequency)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        present = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+        counts = np.add.reduceat(present.astype(np.int64), starts)
+        with np.errstate(invalid="ignore"):
+            means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        return period_starts(keys[starts], frequency), means
+
+
+class SeriesStore:
+    """Byte-bounded LRU of StoredSeries keyed by series_id"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, StoredSeries] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so loads that raced one are not stored
+        self._epoch = 0
+        self._listening = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._listening and self.max_bytes > 0
+
+    def set_listening(self, listening: bool):
+        """Entries are only kept while invalidations are being received"""
+        with self._lock:
+            self._listening = listening
+            self._drop_all()
+
+    def invalidate(self, series_id: int):
+        with self._lock:
+            self._epoch += 1
+            entry = self._entries.pop(series_id, None)
+            if entry is not None:
+                self._bytes -= entry.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._drop_all()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "series": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _drop_all(self):
+        self._epoch += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_many(self, db: Session, series_ids: Iterable[int]) -> dict[int, StoredSeries]:
+        """Stored series for the given IDs, loading misses in one round trip
+
+        Series without metadata are left out, as the /timeseries join does.
+        """
+        series_ids = list(series_ids)
+        with self._lock:
+            found = {}
+            for series_id in series_ids:
+                entry = self._entries.get(series_id)
+                if entry is not None:
+                    self._entries.move_to_end(series_id)
+                    found[series_id] = entry
+            epoch = self._epoch
+
+        missing = [series_id for series_id in series_ids if series_id not in found]
+        if not missing:
+            return found
+
+        loaded = load_series(db, missing)
+        found.update(loaded)
+        with self._lock:
+            if self.enabled and epoch == self._epoch:
+                for series_id, entry in loaded.items():
+                    self._put(series_id, entry)
+        return found
+
+    def _put(self, series_id: int, entry: StoredSeries):
+        if entry.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(series_id, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[series_id] = entry
+        self._bytes += entry.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+
+def load_series(db: Session, series_ids: list[int]) -> dict[int, StoredSeries]:
+    """Full history and metadata of several series as StoredSeries"""
+    metadata = {
+        row["series_id"]: dict(row)
+        for row in db.execute(METADATA_SQL, {"series_ids": series_ids}).mappings().all()
+    }
+    if not metadata:
+        return {}
+    observed = {
+        series_id: (np.array([], dtype="datetime64[D]"), np.array([])) for series_id in metadata
+    }
+
+    rows = db.execute(OBSERVATIONS_SQL, {"series_ids": list(metadata)}).all()
+    if rows:
+        ids, dates, values = (np.asarray(column) for column in zip(*rows, strict=True))
+        dates = dates.astype("datetime64[D]")
+        # NULL values arrive as None, which becomes NaN
+        values = values.astype(np.float64)
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        ends = np.r_[starts[1:], len(ids)]
+        for start, end in zip(starts, ends, strict=True):
+            observed[int(ids[start])] = (dates[start:end], values[start:end])
+
+    return {
+        series_id: StoredSeries(series_id, metadata[series_id], *observed[series_id])
+        for series_id in metadata
+    }
+
+
+class SeriesChangeListener:
+    """Background thread applying SERIES_CHANGED_CHANNEL messages to a SeriesStore
+
+    `on_change` callbacks receive the changed series_id, or None after a
+    reconnect when any series may have changed.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        store: SeriesStore,
+        on_change: Iterable[Callable[[int | None], None]] = (),
+        poll_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.store = store
+        self.on_change = list(on_change)
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="series-change-listener")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+
+    def _notify(self, series_id: int | None):
+        for callback in self.on_change:
+            try:
+                callback(series_id)
+            except Exception as e:
+                logger.error(f"Series change callback failed: {e}", exc_info=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn, **LISTEN_CONNECT_OPTIONS)
+                conn.autocommit = True
+                conn.cursor().execute(f"LISTEN {SERIES_CHANGED_CHANNEL}")
+                # Anything stored before LISTEN may have missed a message
+                self.store.set_listening(True)
+                self._notify(None)
+                logger.info(f"Listening on {SERIES_CHANGED_CHANNEL}")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.poll_seconds) == ([], [], []):
+                        # A half-open connection never turns readable; a round
+                        # trip raises instead (and collects pending notifies)
+                        conn.cursor().execute(PROBE_SQL)
+                    else:
+                        conn.poll()
+                    while conn.notifies:
+                        payload = conn.notifies.pop(0).payload
+                        try:
+                            series_id = int(payload)
+                        except ValueError:
+                            logger.warning(f"Ignoring series change payload {payload!r}")
+                            continue
+                        self.store.invalidate(series_id)
+                        self._notify(series_id)
+            except Exception as e:
+                logger.warning(f"Series change listener disconnected: {e}")
+                self._stop.wait(self.retry_seconds)
+            finally:
+                self.store.set_listening(False)
+                if conn is not None:
+                    conn.close()
+
+
+series_store = SeriesStore(settings.series_store_max_mb * 1024 * 1024)
@@ -87,6 +87,9 @@ class Settings(BaseSettings):
 
     environment: Literal["development", "staging", "production"] = "development"
 
+    # Memory budget of the in-process hot-series store (0 disables it)
+    series_store_max_mb: int = Field(default=256, ge=0)
+
     # Project root (useful for relative paths)
     project_root: Path = Field(default_factory=lambda: Path(__file__).parent.parent.parent.parent)
 
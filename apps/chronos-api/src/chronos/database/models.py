@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, MetaData, String, Text
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -23,6 +23,10 @@ class DataCatalog(Base):
     """
 
     __tablename__ = "data_catalogs"
+    __table_args__ = (
+        # Upsert target for ingest_catalog (INSERT ... ON CONFLICT)
+        UniqueConstraint("source", "series_id", name="uq_data_catalogs_source_series_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String(50), nullable=False, index=True)  # e.g., 'statscan', 'fred'
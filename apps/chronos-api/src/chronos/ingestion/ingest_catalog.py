@@ -2,7 +2,8 @@ import os
 import re
 
 import pandas as pd
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import sessionmaker
 
 from chronos.config.settings import settings
@@ -11,6 +12,12 @@ from chronos.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Rows per INSERT statement (7 bound parameters per row, PostgreSQL allows 65535)
+UPSERT_CHUNK_SIZE = 5000
+
+# FRED short frequency codes
+FREQUENCY_CODES = {"D": "Daily", "M": "Monthly", "Q": "Quarterly", "A": "Annual"}
+
 
 def parse_markdown_catalog(file_path: str) -> pd.DataFrame:
     """Parses the StatsCan master list markdown file."""
@@ -102,49 +109,41 @@ def parse_fred_catalog(file_path: str) -> pd.DataFrame:
         },
     }
 
-    # Map CSV columns to DataCatalog model fields
-    mapped_data = []
-    for _, row in df.iterrows():
-        series_id = row["series_id"]
-
-        # Default values from CSV
-        title = row["series_name"]
-        frequency = row.get("frequency")
-        unit = None
-
-        # Apply strict mapping if present
-        if series_id in strict_mappings:
-            mapping = strict_mappings[series_id]
-            title = mapping.get("title", title)
-            frequency = mapping.get("frequency", frequency)
-            unit = mapping.get("units", unit)
-
-        # Harmonize frequency
-        if frequency == "D":
-            frequency = "Daily"
-        elif frequency == "M":
-            frequency = "Monthly"
-        elif frequency == "Q":
-            frequency = "Quarterly"
-        elif frequency == "A":
-            frequency = "Annual"
-
-        # Construct a descriptive string for context
-        description = f"Category: {row.get('category', '')} - {row.get('subcategory', '')} | Geography: {row.get('geography_name', '')} ({row.get('geography_type', '')})"
-
-        mapped_data.append(
-            {
-                "source": "fred",
-                "series_id": series_id,
-                "product_id": None,  # FRED series ID is unique enough
-                "title": title,
-                "frequency": frequency,
-                "units": unit,  # CSV doesn't have units column explicitly, but mapping might
-                "description": description,
-            }
-        )
-
-    return pd.DataFrame(mapped_data)
+    # Map CSV columns to DataCatalog model fields, one vectorized pass per column
+    def column(name: str) -> pd.Series:
+        return df[name].fillna("").astype(str) if name in df else pd.Series("", index=df.index)
+
+    # Apply strict mapping if present
+    strict = pd.DataFrame.from_dict(strict_mappings, orient="index")
+    series_ids = df["series_id"]
+    frequency = df["frequency"] if "frequency" in df else pd.Series(None, index=df.index)
+
+    mapped = pd.DataFrame(
+        {
+            "source": "fred",
+            "series_id": series_ids,
+            "product_id": None,  # FRED series ID is unique enough
+            "title": series_ids.map(strict["title"]).fillna(df["series_name"]),
+            # Harmonize frequency
+            "frequency": series_ids.map(strict["frequency"])
+            .fillna(frequency)
+            .replace(FREQUENCY_CODES),
+            # CSV doesn't have units column explicitly, but mapping might
+            "units": series_ids.map(strict["units"]),
+            # Construct a descriptive string for context
+            "description": "Category: "
+            + column("category")
+            + " - "
+            + column("subcategory")
+            + " | Geography: "
+            + column("geography_name")
+            + " ("
+            + column("geography_type")
+            + ")",
+        }
+    )
+
+    return mapped
 
 
 def ingest_catalog():
@@ -185,34 +184,34 @@ def ingest_catalog():
 
 
 def upsert_catalog_data(session, df: pd.DataFrame):
-    """Helper function to upsert catalog data."""
+    """Upsert catalog rows with set-based INSERT ... ON CONFLICT DO UPDATE statements"""
     if df.empty:
         return
 
-    for _, row in df.iterrows():
-        existing = session.execute(
-            select(DataCatalog).where(
-                DataCatalog.source == row["source"], DataCatalog.series_id == row["series_id"]
-            )
-        ).scalar_one_or_none()
-
-        if not existing:
-            catalog_entry = DataCatalog(
-                source=row["source"],
-                series_id=row["series_id"],
-                product_id=row["product_id"],
-                title=row["title"],
-                frequency=row["frequency"],
-                units=row["units"],
-                description=row["description"],
-            )
-            session.add(catalog_entry)
-        else:
-            # Update fields
-            existing.title = row["title"]
-            existing.description = row["description"]
-            existing.frequency = row["frequency"]
-            # existing.units = row['units'] # Optional update
+    columns = ["source", "series_id", "product_id", "title", "frequency", "units", "description"]
+    # A row may only be touched once per statement, so keep the last duplicate
+    df = df[columns].drop_duplicates(subset=["source", "series_id"], keep="last")
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+
+    # units are only set on insert
+    updated = ["title", "description", "frequency"]
+
+    for start in range(0, len(records), UPSERT_CHUNK_SIZE):
+        stmt = insert(DataCatalog).values(records[start : start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_data_catalogs_source_series_id",
+            set_={
+                **{column: stmt.excluded[column] for column in updated},
+                "updated_at": func.now(),
+            },
+            # Leave unchanged rows alone so updated_at means the entry changed
+            where=tuple_(*(DataCatalog.__table__.c[column] for column in updated)).is_distinct_from(
+                tuple_(*(stmt.excluded[column] for column in updated))
+            ),
+        )
+        session.execute(stmt)
+
+    logger.info(f"Upserted {len(records)} catalog entries.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+"""
+Project Chronos API: Pytest Configuration
+=========================================
+Unit tests run without a database; settings only need placeholder credentials
+"""
+
+import os
+
+for name in ("DATABASE_NAME", "DATABASE_USER", "DATABASE_PASSWORD"):
+    os.environ.setdefault(name, "chronos_test")
@@ -0,0 +1,242 @@
+"""
+Project Chronos API: Unit Tests for Correlation
+===============================================
+Purpose: Verify pairwise-complete comoments, rolling windows and result caching
+"""
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from chronos.analytics.correlation import TTLCache, comoments, rolling_comoments, transform
+from chronos.analytics.resample import AlignedSeries
+from chronos.api.dependencies import get_db
+from chronos.api.routers import economic
+
+
+def random_matrix(periods=40, columns=3, seed=0):
+    return np.random.default_rng(seed).normal(size=(periods, columns)).cumsum(axis=0)
+
+
+class TestComoments:
+    """Test comoments() against NumPy on the overlapping periods."""
+
+    def test_complete_data_matches_numpy(self):
+        values = random_matrix()
+
+        result = comoments(values)
+
+        assert np.allclose(result.correlation, np.corrcoef(values, rowvar=False))
+        assert np.allclose(result.covariance, np.cov(values, rowvar=False))
+        assert (result.n == len(values)).all()
+
+    def test_pairs_use_only_periods_both_have(self):
+        """Each pair is computed over its own overlap, not the rows all series share."""
+        values = random_matrix()
+        values[:10, 0] = np.nan
+        values[30:, 1] = np.nan
+
+        result = comoments(values)
+
+        assert result.n[0, 1] == 20
+        assert result.n[0, 2] == 30
+        assert result.n[1, 2] == 30
+        both = ~np.isnan(values[:, 0]) & ~np.isnan(values[:, 1])
+        expected = np.corrcoef(values[both, 0], values[both, 1])[0, 1]
+        assert result.correlation[0, 1] == pytest.approx(expected)
+        assert result.correlation[1, 0] == pytest.approx(expected)
+        expected = np.cov(values[~np.isnan(values[:, 0]), 0], values[10:, 2])[0, 1]
+        assert result.covariance[0, 2] == pytest.approx(expected)
+
+    def test_min_periods_boundary(self):
+        """Exactly min_periods overlapping periods is enough; one fewer is null."""
+        values = random_matrix(periods=10, columns=2)
+        values[5:, 1] = np.nan
+
+        assert np.isfinite(comoments(values, min_periods=5).correlation[0, 1])
+        assert np.isnan(comoments(values, min_periods=6).correlation[0, 1])
+        assert np.isnan(comoments(values, min_periods=6).covariance[0, 1])
+
+    def test_single_overlap_is_null_whatever_min_periods(self):
+        values = random_matrix(periods=10, columns=2)
+        values[1:, 1] = np.nan
+
+        result = comoments(values, min_periods=1)
+
+        assert result.n[0, 1] == 1
+        assert np.isnan(result.correlation[0, 1])
+
+    def test_constant_series_has_no_correlation(self):
+        values = random_matrix(columns=2)
+        values[:, 1] = 3.0
+
+        result = comoments(values)
+
+        assert np.isnan(result.correlation[0, 1])
+        assert result.covariance[0, 1] == pytest.approx(0.0)
+
+
+class TestRollingComoments:
+    """Test rolling_comoments() window by window."""
+
+    def test_each_window_matches_comoments(self):
+        values = random_matrix(periods=30)
+        values[3:9, 0] = np.nan
+        values[20, 2] = np.nan
+
+        rolling = rolling_comoments(values, window=6, min_periods=4)
+
+        assert rolling.correlation.shape == (25, 3, 3)
+        for k in range(25):
+            window = comoments(values[k : k + 6], min_periods=4)
+            assert (rolling.n[k] == window.n).all()
+            assert np.allclose(rolling.correlation[k], window.correlation, equal_nan=True)
+            assert np.allclose(rolling.covariance[k], window.covariance, equal_nan=True)
+
+    def test_fewer_periods_than_window(self):
+        rolling = rolling_comoments(random_matrix(periods=4), window=5)
+
+        assert rolling.correlation.shape == (0, 3, 3)
+
+    def test_window_below_two(self):
+        with pytest.raises(ValueError, match="at least 2"):
+            rolling_comoments(random_matrix(), window=1)
+
+
+class TestTransform:
+    """Test transform() before correlation."""
+
+    def test_pct_change_of_zero_is_missing(self):
+        values = np.array([[1.0], [0.0], [2.0], [3.0]])
+
+        changes = transform(values, "pct_change")
+
+        assert changes[0, 0] == -1.0
+        assert np.isnan(changes[1, 0])
+        assert changes[2, 0] == 0.5
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction."""
+
+    def test_entries_expire(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("chronos.analytics.correlation.time.monotonic", lambda: now[0])
+        cache = TTLCache(ttl=10)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_compute("k", compute) == 1
+        now[0] += 9
+        assert cache.get_or_compute("k", compute) == 1
+        now[0] += 2
+        assert cache.get_or_compute("k", compute) == 2
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2)
+        cache.get_or_compute("a", lambda: "a")
+        cache.get_or_compute("b", lambda: "b")
+        cache.get_or_compute("a", lambda: "stale")
+        cache.get_or_compute("c", lambda: "c")
+
+        assert cache.get_or_compute("a", lambda: "recomputed") == "a"
+        assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+
+    def test_discard_where_drops_matching_keys(self):
+        cache = TTLCache()
+        cache.get_or_compute((1, 2), lambda: "a")
+        cache.get_or_compute((3, 4), lambda: "b")
+
+        cache.discard_where(lambda key: 1 in key)
+
+        assert cache.get_or_compute((1, 2), lambda: "recomputed") == "recomputed"
+        assert cache.get_or_compute((3, 4), lambda: "recomputed") == "b"
+
+
+class FakeResample:
+    """Stands in for resample(): counts calls and returns a fixed alignment"""
+
+    def __init__(self):
+        self.call_count = 0
+        self.values = random_matrix(periods=24, columns=2)
+
+    def __call__(self, db, series_ids, frequency, how, fill, start_date, end_date):
+        self.call_count += 1
+        dates = np.arange(np.datetime64("2022-01"), np.datetime64("2024-01")).astype(
+            "datetime64[D]"
+        )
+        columns = self.values[:, : len(series_ids)]
+        return AlignedSeries(frequency, dates, list(series_ids), columns)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """The economic router without a database behind resample()"""
+    resample = FakeResample()
+    monkeypatch.setattr(economic, "resample", resample)
+    economic.correlation_cache.clear()
+
+    app = FastAPI()
+    app.include_router(economic.router)
+    app.dependency_overrides[get_db] = lambda: None
+    yield TestClient(app), resample
+    economic.correlation_cache.clear()
+
+
+class TestCorrelationCacheKey:
+    """Test which requests share a cached correlation result."""
+
+    def test_same_request_is_computed_once(self, client):
+        client, resample = client
+
+        first = client.get("/api/economic/correlation", params={"series_ids": "1,2"})
+        second = client.get("/api/economic/correlation", params={"series_ids": " 1, 2,1"})
+
+        assert first.json() == second.json()
+        assert resample.call_count == 1
+
+    def test_every_parameter_is_part_of_the_key(self, client):
+        client, resample = client
+        base = {"series_ids": "1,2"}
+        variants = [
+            {"series_ids": "2,1"},
+            {"frequency": "Q"},
+            {"transform": "diff"},
+            {"fill": "locf"},
+            {"window": 6},
+            {"min_periods": 5},
+            {"start": "2022-06-01"},
+            {"end": "2023-06-01"},
+        ]
+
+        client.get("/api/economic/correlation", params=base)
+        for variant in variants:
+            client.get("/api/economic/correlation", params={**base, **variant})
+
+        assert resample.call_count == 1 + len(variants)
+
+    def test_series_change_drops_only_results_using_it(self, client):
+        client, resample = client
+        client.get("/api/economic/correlation", params={"series_ids": "1,2"})
+        client.get("/api/economic/correlation", params={"series_ids": "3,4"})
+
+        economic.invalidate_correlations(2)
+        client.get("/api/economic/correlation", params={"series_ids": "1,2"})
+        client.get("/api/economic/correlation", params={"series_ids": "3,4"})
+        assert resample.call_count == 3
+
+        economic.invalidate_correlations(None)
+        client.get("/api/economic/correlation", params={"series_ids": "3,4"})
+        assert resample.call_count == 4
+
+    def test_errors_are_not_cached(self, client):
+        client, resample = client
+        params = {"series_ids": "1,2", "transform": "log"}
+
+        assert client.get("/api/economic/correlation", params=params).status_code == 400
+        assert client.get("/api/economic/correlation", params=params).status_code == 400
+        assert resample.call_count == 2
@@ -0,0 +1,256 @@
+"""
+Project Chronos API: Unit Tests for the FX Engine
+=================================================
+Purpose: Verify holiday filling, calendar-day changes, CAD cross conversion and publishing
+"""
+
+import time
+from contextlib import nullcontext
+
+import numpy as np
+import pytest
+
+from chronos.analytics import fx
+from chronos.analytics.fx import (
+    DELETE_RATES_SQL,
+    PUBLISH_LOCK_SQL,
+    SOURCE_SERIES_SQL,
+    FXMatrix,
+    FXRatePublisher,
+    build_matrix,
+    forward_fill,
+)
+from chronos.analytics.resample import OBSERVATIONS_SQL
+
+FRED = "FRED"
+VALET = "Bank of Canada Valet API"
+
+
+def days(*dates):
+    return np.array(dates, dtype="datetime64[D]")
+
+
+class Result:
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self._scalar = scalar
+
+    def all(self):
+        return self.rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class FakeSession:
+    """Answers the FX engine's queries from in-memory series
+
+    `series` maps (source_series_id, source_name) -> {date: value}.
+    """
+
+    def __init__(self, series, locked=True):
+        self.series_ids = {key: index for index, key in enumerate(series, start=1)}
+        self.observations = {self.series_ids[key]: values for key, values in series.items()}
+        self.locked = locked
+        self.statements = []
+        self.params = {}
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params[statement] = params
+        if statement is SOURCE_SERIES_SQL:
+            wanted = set(zip(params["source_series_ids"], params["source_names"], strict=True))
+            return Result(
+                (key[0], series_id) for key, series_id in self.series_ids.items() if key in wanted
+            )
+        if statement is OBSERVATIONS_SQL:
+            return Result(
+                (series_id, np.datetime64(day, "D"), value)
+                for series_id in sorted(params["series_ids"])
+                for day, value in sorted(self.observations[series_id].items())
+            )
+        if statement is PUBLISH_LOCK_SQL:
+            return Result(scalar=self.locked)
+        return Result()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class TestForwardFill:
+    """Test forward_fill() limits."""
+
+    def test_fills_at_most_limit_rows(self):
+        values = np.array(
+            [[1.0, np.nan], [np.nan, 2.0], [np.nan, np.nan], [np.nan, 3.0], [5.0, 4.0]]
+        )
+
+        filled, mask = forward_fill(values, limit=2)
+
+        assert filled[:, 0].tolist()[:3] == [1.0, 1.0, 1.0]
+        assert np.isnan(filled[3, 0])
+        assert mask[:, 0].tolist() == [False, True, True, False, False]
+        # Nothing to carry before the first value
+        assert np.isnan(filled[0, 1])
+        assert filled[:, 1].tolist()[1:] == [2.0, 2.0, 3.0, 4.0]
+        assert mask[:, 1].tolist() == [False, False, True, False, False]
+
+    def test_limit_counts_from_last_real_value(self):
+        """Filled cells do not restart the count."""
+        values = np.array([[1.0], [np.nan], [np.nan], [np.nan]])
+
+        filled, _ = forward_fill(values, limit=1)
+
+        assert filled[1, 0] == 1.0
+        assert np.isnan(filled[2:, 0]).all()
+
+
+class TestChange:
+    """Test FXMatrix.change() against calendar days, not rows."""
+
+    def matrix(self, dates):
+        usd = np.column_stack([np.ones(len(dates)), np.arange(1.0, len(dates) + 1)])
+        return FXMatrix(dates, ["USD", "EUR"], usd, np.zeros_like(usd, dtype=bool))
+
+    def test_lookback_lands_on_last_business_day_before_holiday(self):
+        """30 days before 2024-03-04 is Saturday 2024-02-03; Friday 2024-02-02 is
+        a holiday here, so Thursday 2024-02-01 is the comparison date."""
+        calendar = np.arange(np.datetime64("2024-01-02"), np.datetime64("2024-03-05"))
+        dates = calendar[np.is_busday(calendar) & (calendar != np.datetime64("2024-02-02"))]
+        matrix = self.matrix(dates)
+
+        row = matrix.rows("2024-03-04", "2024-03-04")
+        change = matrix.change(30, row)
+
+        past = matrix.usd[np.searchsorted(dates, np.datetime64("2024-02-01")), 1]
+        assert change[0, 1] == pytest.approx(matrix.usd[row][0, 1] / past - 1)
+        assert change[0, 0] == 0.0
+
+    def test_no_history_is_nan(self):
+        dates = days("2024-01-02", "2024-01-03", "2024-02-05")
+        change = self.matrix(dates).change(30)
+
+        assert np.isnan(change[:2]).all()
+        # 30 days before 2024-02-05 is 2024-01-06; the last print by then is 2024-01-03
+        assert change[2, 1] == pytest.approx(3.0 / 2.0 - 1)
+
+
+class TestBuildMatrix:
+    """Test source selection and CAD cross conversion in build_matrix()."""
+
+    def test_cad_quoted_rates_convert_through_usd_cad(self):
+        """FXEURCAD (CAD per EUR) x USD per CAD gives USD per EUR."""
+        db = FakeSession(
+            {
+                ("FXUSDCAD", VALET): {"2024-01-02": 1.25, "2024-01-03": 1.6},
+                ("FXEURCAD", VALET): {"2024-01-02": 1.5, "2024-01-03": 1.6, "2024-01-04": 2.0},
+            }
+        )
+
+        matrix = build_matrix(db)
+
+        cad, eur = matrix.index("CAD"), matrix.index("EUR")
+        assert matrix.usd[:, cad].tolist() == pytest.approx([0.8, 0.625, 0.625])
+        # 2024-01-04 has no USD/CAD print: the carried-forward CAD rate converts
+        assert matrix.usd[:, eur].tolist() == pytest.approx([1.2, 1.0, 1.25])
+        assert matrix.filled[:, cad].tolist() == [False, False, True]
+        assert not matrix.filled[:, eur].any()
+
+    def test_fred_is_preferred_with_bank_of_canada_fallback(self):
+        db = FakeSession(
+            {
+                ("DEXUSEU", FRED): {"2024-01-02": 1.1, "2024-01-04": 1.2},
+                ("FXEURCAD", VALET): {"2024-01-02": 9.9, "2024-01-03": 9.9, "2024-01-04": 9.9},
+                ("FXUSDCAD", VALET): {"2024-01-02": 1.0, "2024-01-03": 1.0, "2024-01-04": 1.0},
+            }
+        )
+
+        matrix = build_matrix(db)
+
+        eur = matrix.index("EUR")
+        # 2024-01-03 falls back to the Bank of Canada cross rate
+        assert matrix.usd[:, eur].tolist() == pytest.approx([1.1, 9.9, 1.2])
+
+    def test_series_from_other_sources_are_ignored(self):
+        """A DEX*/FX* ID published by another source is not an FX rate."""
+        db = FakeSession(
+            {
+                ("DEXUSEU", "Statistics Canada"): {"2024-01-02": 123.0},
+                ("FXUSDCAD", VALET): {"2024-01-02": 1.25},
+            }
+        )
+
+        matrix = build_matrix(db)
+
+        assert matrix.currencies == ["USD", "CAD"]
+
+    def test_lookup_pairs_each_prefix_with_its_source(self):
+        db = FakeSession({})
+        fx.source_series(db)
+
+        params = db.params[SOURCE_SERIES_SQL]
+        pairs = set(zip(params["source_series_ids"], params["source_names"], strict=True))
+        assert ("DEXUSEU", FRED) in pairs
+        assert ("FXEURCAD", VALET) in pairs
+        for source_series_id, source_name in pairs:
+            prefix = "DEX" if source_series_id.startswith("DEX") else "FX"
+            assert source_name in fx.SERIES_SOURCES[prefix]
+
+
+class TestFXRatePublisher:
+    """Test when analytics.fx_usd_rates is rewritten."""
+
+    def publisher(self, db, delay=0.05):
+        publisher = FXRatePublisher(lambda: nullcontext(db), delay=delay)
+        publishes = []
+        publish = publisher.publish
+
+        def counted():
+            publishes.append(1)
+            return publish()
+
+        publisher.publish = counted
+        return publisher, publishes
+
+    def test_burst_of_changes_publishes_once(self):
+        db = FakeSession({("FXUSDCAD", VALET): {"2024-01-02": 1.25}})
+        publisher, publishes = self.publisher(db)
+
+        for _ in range(5):
+            publisher.series_changed(None)
+        time.sleep(0.3)
+
+        assert len(publishes) == 1
+        assert DELETE_RATES_SQL in db.statements
+
+    def test_other_series_are_ignored_once_fx_series_are_known(self):
+        db = FakeSession({("FXUSDCAD", VALET): {"2024-01-02": 1.25}})
+        publisher, publishes = self.publisher(db)
+        publisher.publish()
+
+        publisher.series_changed(999)
+        publisher.series_changed(1)
+        time.sleep(0.3)
+
+        assert len(publishes) == 2
+
+    def test_every_series_counts_as_fx_until_first_publish(self):
+        db = FakeSession({("FXUSDCAD", VALET): {"2024-01-02": 1.25}})
+        publisher = FXRatePublisher(lambda: nullcontext(db))
+        assert publisher.is_fx_series(999)
+
+        publisher.publish()
+
+        assert publisher.is_fx_series(1)
+        assert publisher.is_fx_series(None)
+        assert not publisher.is_fx_series(999)
+
+    def test_skips_while_another_process_publishes(self):
+        db = FakeSession({("FXUSDCAD", VALET): {"2024-01-02": 1.25}}, locked=False)
+        publisher, _ = self.publisher(db)
+
+        assert publisher.publish() is None
+        assert DELETE_RATES_SQL not in db.statements
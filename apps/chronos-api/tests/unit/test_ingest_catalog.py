@@ -0,0 +1,128 @@
+"""
+Project Chronos API: Unit Tests for Catalog Ingestion
+=====================================================
+Purpose: Verify the vectorized FRED catalog parse and the set-based catalog upsert
+"""
+
+import pandas as pd
+from sqlalchemy.dialects import postgresql
+
+from chronos.ingestion import ingest_catalog
+from chronos.ingestion.ingest_catalog import parse_fred_catalog, upsert_catalog_data
+
+CATALOG_CSV = """\
+series_id,source,status,series_name,asset_class,geography_type,geography_name,frequency,category,subcategory
+GDP,FRED,Active,Gross Domestic Product,Macro,National,United States,Q,Growth,GDP
+UNRATE,FRED,Active,Unemployment Rate,Macro,National,United States,M,Labor,
+FEDFUNDS,FRED,Active,Fed Funds,Macro,National,,M,Rates,Policy
+"""
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+def catalog(tmp_path, contents=CATALOG_CSV):
+    path = tmp_path / "catalog.csv"
+    path.write_text(contents)
+    return parse_fred_catalog(str(path)).set_index("series_id")
+
+
+class TestParseFredCatalog:
+    """Test parse_fred_catalog() column mapping."""
+
+    def test_description_combines_catalog_fields(self, tmp_path):
+        parsed = catalog(tmp_path)
+
+        assert parsed.loc["GDP", "description"] == (
+            "Category: Growth - GDP | Geography: United States (National)"
+        )
+
+    def test_missing_fields_leave_the_description_intact(self, tmp_path):
+        parsed = catalog(tmp_path)
+
+        assert parsed.loc["UNRATE", "description"] == (
+            "Category: Labor -  | Geography: United States (National)"
+        )
+        assert parsed.loc["FEDFUNDS", "description"] == (
+            "Category: Rates - Policy | Geography:  (National)"
+        )
+
+    def test_missing_columns_are_blank(self, tmp_path):
+        parsed = catalog(
+            tmp_path, "series_id,series_name,frequency\nGDP,Gross Domestic Product,Q\n"
+        )
+
+        assert parsed.loc["GDP", "description"] == "Category:  -  | Geography:  ()"
+
+    def test_strict_mappings_and_frequency_codes(self, tmp_path):
+        parsed = catalog(tmp_path)
+
+        assert parsed.loc["FEDFUNDS", "title"] == "Federal Funds Effective Rate"
+        assert parsed.loc["FEDFUNDS", "units"] == "Percent"
+        assert parsed.loc["GDP", "title"] == "Gross Domestic Product"
+        assert pd.isna(parsed.loc["GDP", "units"])
+        assert parsed.loc["GDP", "frequency"] == "Quarterly"
+        assert (parsed["source"] == "fred").all()
+
+
+class TestUpsertCatalogData:
+    """Test the INSERT ... ON CONFLICT statements upsert_catalog_data() issues."""
+
+    def frame(self, series_ids):
+        return pd.DataFrame(
+            {
+                "source": "fred",
+                "series_id": series_ids,
+                "product_id": None,
+                "title": [f"Title {series_id}" for series_id in series_ids],
+                "frequency": "Monthly",
+                "units": None,
+                "description": "Category: Labor",
+            }
+        )
+
+    def test_conflicts_update_changed_rows_only(self):
+        session = FakeSession()
+
+        upsert_catalog_data(session, self.frame(["UNRATE", "GDP"]))
+
+        (statement,) = session.statements
+        sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+        assert "ON CONFLICT ON CONSTRAINT uq_data_catalogs_source_series_id DO UPDATE" in sql
+        assert "title = excluded.title" in sql
+        assert "units = excluded.units" not in sql
+        assert "updated_at = now()" in sql
+        assert (
+            "WHERE (metadata.data_catalogs.title, metadata.data_catalogs.description, "
+            "metadata.data_catalogs.frequency) "
+            "IS DISTINCT FROM (excluded.title, excluded.description, excluded.frequency)"
+        ) in sql
+
+    def test_duplicates_keep_the_last_row_and_rows_are_chunked(self, monkeypatch):
+        monkeypatch.setattr(ingest_catalog, "UPSERT_CHUNK_SIZE", 2)
+        session = FakeSession()
+        df = self.frame(["A", "B", "A", "C"])
+        df.loc[2, "title"] = "Latest A"
+
+        upsert_catalog_data(session, df)
+
+        rows = [
+            row
+            for statement in session.statements
+            for row in statement.compile(dialect=postgresql.dialect()).params.items()
+            if row[0].startswith("title")
+        ]
+        assert len(session.statements) == 2
+        assert sorted(value for _, value in rows) == ["Latest A", "Title B", "Title C"]
+
+    def test_empty_frame_issues_nothing(self):
+        session = FakeSession()
+
+        upsert_catalog_data(session, pd.DataFrame())
+
+        assert session.statements == []
@@ -0,0 +1,123 @@
+"""
+Project Chronos API: Unit Tests for Resampling
+==============================================
+Purpose: Verify period aggregation and alignment for every frequency and aggregation
+"""
+
+import numpy as np
+import pytest
+
+from chronos.analytics.resample import aggregate, align, period_starts
+
+
+def days(*dates):
+    return np.array(dates, dtype="datetime64[D]")
+
+
+DATES = days(
+    "2024-01-01",  # Monday
+    "2024-01-03",
+    "2024-01-08",
+    "2024-02-15",
+    "2024-02-20",
+    "2024-05-02",
+    "2025-03-31",  # Monday
+)
+VALUES = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+
+# Observations falling in each period, labelled by the period's first day
+PERIODS = {
+    "W": {
+        "2024-01-01": [1, 2],
+        "2024-01-08": [3],
+        "2024-02-12": [4],
+        "2024-02-19": [5],
+        "2024-04-29": [6],
+        "2025-03-31": [7],
+    },
+    "M": {"2024-01-01": [1, 2, 3], "2024-02-01": [4, 5], "2024-05-01": [6], "2025-03-01": [7]},
+    "Q": {"2024-01-01": [1, 2, 3, 4, 5], "2024-04-01": [6], "2025-01-01": [7]},
+    "A": {"2024-01-01": [1, 2, 3, 4, 5, 6], "2025-01-01": [7]},
+}
+
+REDUCERS = {
+    "last": lambda group: group[-1],
+    "first": lambda group: group[0],
+    "mean": np.mean,
+    "sum": np.sum,
+}
+
+
+class TestAggregate:
+    """Test aggregate() for each frequency and aggregation."""
+
+    @pytest.mark.parametrize("frequency", list(PERIODS))
+    @pytest.mark.parametrize("how", list(REDUCERS))
+    def test_periods_and_values(self, frequency, how):
+        keys, reduced = aggregate(DATES, VALUES, frequency, how)
+
+        expected = PERIODS[frequency]
+        assert period_starts(keys, frequency).tolist() == days(*expected).tolist()
+        assert reduced.tolist() == [REDUCERS[how](group) for group in expected.values()]
+
+    @pytest.mark.parametrize("how", list(REDUCERS))
+    def test_nan_is_missing(self, how):
+        """NaN neither poisons its period nor creates one of its own."""
+        dates = np.insert(DATES, [2, 5], days("2024-01-05", "2024-03-10"))
+        values = np.insert(VALUES, [2, 5], np.nan)
+
+        keys, reduced = aggregate(dates, values, "M", how)
+        expected_keys, expected = aggregate(DATES, VALUES, "M", how)
+
+        assert keys.tolist() == expected_keys.tolist()
+        assert reduced.tolist() == expected.tolist()
+
+    def test_empty_series(self):
+        keys, reduced = aggregate(days(), np.array([]), "Q", "mean")
+
+        assert len(keys) == 0
+        assert len(reduced) == 0
+
+    def test_unknown_aggregation(self):
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            aggregate(DATES, VALUES, "M", "median")
+
+
+class TestAlign:
+    """Test align() grids, gaps and fills."""
+
+    def test_gaps_are_nan_on_the_grid(self):
+        """Every period between the first and last is a row, empty ones NaN."""
+        aligned = align({1: (DATES, VALUES)}, "M", "sum")
+
+        assert len(aligned.dates) == 15  # 2024-01 .. 2025-03
+        assert aligned.dates[0] == np.datetime64("2024-01-01")
+        assert aligned.dates[-1] == np.datetime64("2025-03-01")
+        column = aligned.column(1)
+        assert column[:2].tolist() == [6.0, 9.0]
+        assert np.isnan(column[2:4]).all()
+        assert column[4] == 6.0
+
+    def test_locf_and_linear_fill(self):
+        aligned = align({1: (DATES, VALUES)}, "Q", "last", fill="locf")
+        assert aligned.column(1).tolist() == [5.0, 6.0, 6.0, 6.0, 7.0]
+
+        aligned = align({1: (DATES, VALUES)}, "Q", "last", fill="linear")
+        assert aligned.column(1).tolist() == pytest.approx([5.0, 6.0, 6 + 1 / 3, 6 + 2 / 3, 7.0])
+
+    def test_lower_frequency_series_on_monthly_grid(self):
+        """A quarterly value sits in the first month of its quarter."""
+        quarterly = (days("2024-01-01", "2024-04-01"), np.array([10.0, 20.0]))
+        monthly = (days("2024-01-31", "2024-02-29", "2024-06-30"), np.array([1.0, 2.0, 3.0]))
+
+        aligned = align({"gdp": quarterly, "cpi": monthly}, "M")
+
+        assert aligned.series_ids == ["gdp", "cpi"]
+        assert len(aligned.dates) == 6
+        assert np.flatnonzero(~np.isnan(aligned.column("gdp"))).tolist() == [0, 3]
+        assert np.flatnonzero(~np.isnan(aligned.column("cpi"))).tolist() == [0, 1, 5]
+
+    def test_all_series_empty(self):
+        aligned = align({1: (days(), np.array([]))}, "W")
+
+        assert aligned.values.shape == (0, 1)
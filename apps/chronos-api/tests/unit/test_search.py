@@ -0,0 +1,176 @@
+"""
+Project Chronos API: Unit Tests for Series Search
+=================================================
+Purpose: Verify lexical/hybrid ranking selection, paging and query embedding caching
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from chronos.api import embeddings
+from chronos.api.dependencies import get_db
+from chronos.api.routers import economic
+
+VECTOR = "[0.1,0.2]"
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeDB:
+    """Returns `matches` ranked rows, honouring LIMIT/OFFSET, and records the query"""
+
+    def __init__(self, matches=3):
+        self.matches = matches
+        self.sql = None
+        self.params = None
+
+    def execute(self, statement, params):
+        self.sql, self.params = str(statement), params
+        rows = [{"series_id": series_id, "score": 1.0} for series_id in range(self.matches)]
+        return Result(rows[params["offset"] :][: params["limit"]])
+
+
+@pytest.fixture
+def search(monkeypatch):
+    """GET /api/economic/search against a FakeDB; embed_query returns `embedded`"""
+    embedded = {"vector": None, "calls": 0}
+
+    def embed_query(q):
+        embedded["calls"] += 1
+        return embedded["vector"]
+
+    monkeypatch.setattr(economic, "embed_query", embed_query)
+
+    def get(db, **params):
+        app = FastAPI()
+        app.include_router(economic.router)
+        app.dependency_overrides[get_db] = lambda: db
+        return TestClient(app).get("/api/economic/search", params=params).json()
+
+    return get, embedded
+
+
+class TestSearchSeries:
+    """Test /api/economic/search ranking modes and paging."""
+
+    def test_lexical_without_a_model(self, search):
+        get, _ = search
+        db = FakeDB()
+
+        body = get(db, q="gdp")
+
+        assert body["mode"] == "lexical"
+        assert "semantic AS" not in db.sql
+        assert "embedding" not in db.params
+
+    def test_hybrid_with_a_query_embedding(self, search):
+        get, embedded = search
+        embedded["vector"] = VECTOR
+        db = FakeDB()
+
+        body = get(db, q="gdp", semantic_weight=0.25)
+
+        assert body["mode"] == "hybrid"
+        assert "FULL JOIN semantic" in db.sql
+        assert db.params["embedding"] == VECTOR
+        assert db.params["semantic_weight"] == 0.25
+
+    def test_zero_semantic_weight_skips_embedding(self, search):
+        get, embedded = search
+        embedded["vector"] = VECTOR
+
+        body = get(FakeDB(), q="gdp", semantic_weight=0)
+
+        assert body["mode"] == "lexical"
+        assert embedded["calls"] == 0
+
+    def test_has_more_pages(self, search):
+        get, _ = search
+        db = FakeDB(matches=5)
+
+        first = get(db, q="gdp", limit=2)
+        assert db.params["limit"] == 3
+        assert db.params["candidates"] == 3
+        last = get(db, q="gdp", limit=2, offset=4)
+
+        assert first["has_more"]
+        assert [row["series_id"] for row in first["results"]] == [0, 1]
+        assert not last["has_more"]
+        assert [row["series_id"] for row in last["results"]] == [4]
+
+    def test_exactly_one_page_has_no_more(self, search):
+        get, _ = search
+
+        body = get(FakeDB(matches=2), q="gdp", limit=2)
+
+        assert not body["has_more"]
+        assert len(body["results"]) == 2
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return np.array([0.5, 0.25])
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(embeddings, "get_model", lambda: fake)
+    embeddings._embed.cache_clear()
+    yield fake
+    embeddings._embed.cache_clear()
+
+
+class TestQueryEmbeddings:
+    """Test query normalization, caching and model fallback."""
+
+    def test_equivalent_queries_share_one_encoding(self, model):
+        first = embeddings.embed_query("  Housing   Starts ")
+        second = embeddings.embed_query("housing starts")
+
+        assert first == second == "[0.5,0.25]"
+        assert model.encoded == ["housing starts"]
+
+    def test_different_queries_are_encoded(self, model):
+        embeddings.embed_query("housing starts")
+        embeddings.embed_query("housing prices")
+
+        assert model.encoded == ["housing starts", "housing prices"]
+
+    def test_model_load_failure_falls_back_once(self, monkeypatch, caplog):
+        loads = []
+
+        def sentence_transformer(name):
+            loads.append(name)
+            raise OSError("We couldn't connect to huggingface.co")
+
+        module = types.ModuleType("sentence_transformers")
+        module.SentenceTransformer = sentence_transformer
+        monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+        embeddings.get_model.cache_clear()
+        try:
+            assert embeddings.get_model() is None
+            assert embeddings.get_model() is None
+        finally:
+            embeddings.get_model.cache_clear()
+
+        assert loads == [embeddings.EMBEDDING_MODEL]
+        assert "semantic search disabled" in caplog.text
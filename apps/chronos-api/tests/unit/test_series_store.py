@@ -0,0 +1,266 @@
+"""
+Project Chronos API: Unit Tests for the Series Store
+====================================================
+Purpose: Verify LRU eviction, invalidation races, dead listener detection and bucket means
+against time_bucket/AVG
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+import psycopg2
+import pytest
+
+from chronos.api import series_store
+from chronos.api.series_store import (
+    ENTRY_OVERHEAD_BYTES,
+    METADATA_SQL,
+    OBSERVATIONS_SQL,
+    PROBE_SQL,
+    SeriesChangeListener,
+    SeriesStore,
+    StoredSeries,
+)
+
+OBSERVATIONS = 10
+ENTRY_BYTES = OBSERVATIONS * 16 + ENTRY_OVERHEAD_BYTES
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Answers load_series() with OBSERVATIONS daily values per known series"""
+
+    def __init__(self, series_ids, on_load=None):
+        self.series_ids = set(series_ids)
+        self.on_load = on_load
+        self.loaded = []
+
+    def execute(self, statement, params):
+        wanted = [series_id for series_id in params["series_ids"] if series_id in self.series_ids]
+        if statement is METADATA_SQL:
+            return Result(
+                {
+                    "series_id": series_id,
+                    "series_name": f"Series {series_id}",
+                    "units": None,
+                    "unit_type": "OTHER",
+                    "display_units": None,
+                    "geography": "Canada",
+                }
+                for series_id in wanted
+            )
+        assert statement is OBSERVATIONS_SQL
+        self.loaded.extend(wanted)
+        if self.on_load is not None:
+            self.on_load()
+        start = date(2024, 1, 1)
+        return Result(
+            (series_id, start + timedelta(days=day), float(day))
+            for series_id in sorted(wanted)
+            for day in range(OBSERVATIONS)
+        )
+
+
+def listening_store(entries):
+    store = SeriesStore(entries * ENTRY_BYTES)
+    store.set_listening(True)
+    return store
+
+
+class TestSeriesStore:
+    """Test what SeriesStore keeps and for how long."""
+
+    def test_hits_do_not_reload(self):
+        store = listening_store(2)
+        db = FakeSession([1, 2])
+
+        store.get_many(db, [1, 2])
+        stored = store.get_many(db, [2, 1])
+
+        assert db.loaded == [1, 2]
+        assert stored[1].values.tolist() == [float(day) for day in range(OBSERVATIONS)]
+        assert store.stats()["bytes"] == 2 * ENTRY_BYTES
+
+    def test_least_recently_used_is_evicted(self):
+        store = listening_store(2)
+        db = FakeSession([1, 2, 3])
+
+        store.get_many(db, [1])
+        store.get_many(db, [2])
+        store.get_many(db, [1])
+        store.get_many(db, [3])
+        db.loaded.clear()
+        store.get_many(db, [1, 2, 3])
+
+        assert db.loaded == [2]
+
+    def test_series_without_metadata_are_left_out(self):
+        store = listening_store(2)
+
+        assert store.get_many(FakeSession([1]), [1, 99]).keys() == {1}
+
+    def test_invalidate_drops_series(self):
+        store = listening_store(2)
+        db = FakeSession([1, 2])
+        store.get_many(db, [1, 2])
+
+        store.invalidate(1)
+        db.loaded.clear()
+        store.get_many(db, [1, 2])
+
+        assert db.loaded == [1]
+
+    def test_load_racing_an_invalidation_is_not_stored(self):
+        """A change published while loading may not be in what was read."""
+        store = listening_store(2)
+        db = FakeSession([1], on_load=lambda: store.invalidate(1))
+
+        assert 1 in store.get_many(db, [1])
+        assert store.stats()["series"] == 0
+
+    def test_nothing_is_stored_until_listening(self):
+        store = SeriesStore(2 * ENTRY_BYTES)
+        db = FakeSession([1])
+
+        store.get_many(db, [1])
+
+        assert not store.enabled
+        assert store.stats()["series"] == 0
+
+    def test_losing_the_listener_clears_the_store(self):
+        store = listening_store(2)
+        store.get_many(FakeSession([1, 2]), [1, 2])
+
+        store.set_listening(False)
+
+        assert store.stats() == {
+            "enabled": False,
+            "series": 0,
+            "bytes": 0,
+            "max_bytes": 2 * ENTRY_BYTES,
+        }
+
+
+class HalfOpenConnection:
+    """A LISTEN connection whose peer is gone: never readable, round trips fail"""
+
+    def __init__(self, listener):
+        self.listener = listener
+        self.notifies = []
+        self.executed = []
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql):
+        self.executed.append(sql)
+        if sql == PROBE_SQL:
+            self.listener._stop.set()
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def close(self):
+        self.closed = True
+
+
+class TestSeriesChangeListener:
+    """Test that a dead LISTEN connection stops the store from being trusted."""
+
+    def test_idle_probe_failure_disables_store(self, monkeypatch):
+        store = listening_store(2)
+        changes = []
+        listener = SeriesChangeListener("dbname=chronos", store, on_change=[changes.append])
+        conn = HalfOpenConnection(listener)
+        connects = []
+
+        def connect(dsn, **options):
+            connects.append(options)
+            return conn
+
+        monkeypatch.setattr(series_store.psycopg2, "connect", connect)
+        monkeypatch.setattr(series_store.select, "select", lambda *args: ([], [], []))
+
+        listener._run()
+
+        assert connects[0]["keepalives"] == 1
+        assert conn.executed[-1] == PROBE_SQL
+        assert conn.closed
+        assert changes == [None]
+        assert not store.enabled
+
+
+def time_bucket(frequency, day):
+    """TimescaleDB's bucket start for /timeseries intervals (weeks start on Monday)"""
+    if frequency == "D":
+        return day
+    if frequency == "W":
+        return day - timedelta(days=day.weekday())
+    if frequency == "M":
+        return day.replace(day=1)
+    if frequency == "Q":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(month=1, day=1)
+
+
+def bucket_avg(dates, values, frequency, start_date=None, end_date=None):
+    """time_bucket() ... AVG(value) GROUP BY time, row by row"""
+    buckets = defaultdict(list)
+    for day, value in zip(dates.tolist(), values.tolist(), strict=True):
+        if start_date is not None and day < date.fromisoformat(start_date):
+            continue
+        if end_date is not None and day > date.fromisoformat(end_date):
+            continue
+        buckets[time_bucket(frequency, day)].append(value)
+    # AVG skips NULLs and is NULL when a bucket has none
+    means = [
+        np.mean([v for v in group if not np.isnan(v)]) if any(~np.isnan(group)) else np.nan
+        for group in buckets.values()
+    ]
+    return list(buckets), means
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    offsets = np.sort(rng.choice(np.arange(900), size=300, replace=False))
+    dates = np.datetime64("2023-01-01") + offsets
+    values = rng.normal(size=300)
+    values[rng.random(300) < 0.2] = np.nan
+    # A whole month of NULLs is still a bucket
+    values[(dates >= np.datetime64("2024-03-01")) & (dates < np.datetime64("2024-04-01"))] = np.nan
+    return StoredSeries(1, {}, dates.astype("datetime64[D]"), values)
+
+
+class TestBucketMeans:
+    """Test StoredSeries.bucket_means() against the time_bucket/AVG query."""
+
+    @pytest.mark.parametrize("frequency", ["D", "W", "M", "Q", "A"])
+    @pytest.mark.parametrize(
+        "start_date,end_date",
+        [(None, None), ("2023-05-17", None), (None, "2024-08-31"), ("2023-02-06", "2023-02-06")],
+    )
+    def test_matches_time_bucket_avg(self, series, frequency, start_date, end_date):
+        times, means = series.bucket_means(frequency, start_date, end_date)
+
+        expected_times, expected = bucket_avg(
+            series.dates, series.values, frequency, start_date, end_date
+        )
+        assert times.tolist() == expected_times
+        assert np.allclose(means, expected, equal_nan=True)
+
+    def test_range_without_observations(self, series):
+        times, means = series.bucket_means("M", "2030-01-01", "2030-12-31")
+
+        assert len(times) == 0
+        assert len(means) == 0
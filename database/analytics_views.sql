@@ -3,33 +3,41 @@
 -- ============================================================================
 
 -- View 1: Currency Strength Index
-CREATE OR REPLACE VIEW analytics.currency_strength_index AS
-WITH base_rates AS (
-    SELECT
-        observation_date,
-        source_series_id,
-        usd_per_fx,
-        -- Calculate percentage change from 30 days ago
-        LAG(usd_per_fx, 30) OVER (PARTITION BY source_series_id ORDER BY observation_date) as value_30d_ago
-    FROM analytics.fx_rates_normalized
-    WHERE source_series_id IN ('FXEURCAD', 'FXGBPCAD', 'FXJPYCAD', 'FXUSDCAD')
-)
+-- Reads analytics.fx_usd_rates (migration e5251565f8b5), which the API
+-- rewrites after FX ingestion; each rate is compared with the last business
+-- day on or before the date 30 calendar days earlier.
+DROP VIEW IF EXISTS analytics.currency_strength_index;
+
+CREATE VIEW analytics.currency_strength_index AS
 SELECT
-    observation_date,
-    source_series_id,
-    usd_per_fx as current_rate,
-    value_30d_ago,
-    ROUND(100.0 * (usd_per_fx - value_30d_ago) / NULLIF(value_30d_ago, 0), 2) as pct_change_30d,
+    r.observation_date,
+    r.currency,
+    r.usd_per_unit as current_rate,
+    past.usd_per_unit as value_30d_ago,
+    ROUND(CAST(100.0 * (r.usd_per_unit - past.usd_per_unit)
+               / NULLIF(past.usd_per_unit, 0) AS numeric), 2) as pct_change_30d,
     CASE
-        WHEN usd_per_fx > value_30d_ago THEN '📈 Strengthening'
-        WHEN usd_per_fx < value_30d_ago THEN '📉 Weakening'
+        WHEN r.usd_per_unit > past.usd_per_unit THEN '📈 Strengthening'
+        WHEN r.usd_per_unit < past.usd_per_unit THEN '📉 Weakening'
         ELSE '➡️ Stable'
-    END as trend
-FROM base_rates
-WHERE value_30d_ago IS NOT NULL;
+    END as trend,
+    r.is_filled
+FROM analytics.fx_usd_rates r
+CROSS JOIN LATERAL (
+    SELECT p.usd_per_unit
+    FROM analytics.fx_usd_rates p
+    WHERE p.currency = r.currency
+    AND p.observation_date <= r.observation_date - 30
+    ORDER BY p.observation_date DESC
+    LIMIT 1
+) past
+WHERE r.currency <> 'USD';
 
 -- View 2: FX Volatility Monitor
-CREATE OR REPLACE VIEW analytics.fx_volatility AS
+-- Defined as fx_volatility_live and materialized as fx_volatility at the end
+-- of this file (see migration 4110a305e312). It reads fx_rates_normalized_live,
+-- so its refresh never depends on another materialization being current.
+CREATE OR REPLACE VIEW analytics.fx_volatility_live AS
 WITH daily_changes AS (
     SELECT
         observation_date,
@@ -38,7 +46,7 @@ WITH daily_changes AS (
         LAG(usd_per_fx) OVER (PARTITION BY source_series_id ORDER BY observation_date) as prev_rate,
         ABS(usd_per_fx - LAG(usd_per_fx) OVER (PARTITION BY source_series_id ORDER BY observation_date))
             / NULLIF(LAG(usd_per_fx) OVER (PARTITION BY source_series_id ORDER BY observation_date), 0) as daily_change_pct
-    FROM analytics.fx_rates_normalized
+    FROM analytics.fx_rates_normalized_live
 )
 SELECT
     source_series_id,
@@ -52,3 +60,10 @@ FROM daily_changes
 WHERE observation_date >= CURRENT_DATE - INTERVAL '90 days'
   AND daily_change_pct IS NOT NULL
 GROUP BY source_series_id;
+
+-- Materialization
+CREATE MATERIALIZED VIEW IF NOT EXISTS analytics.fx_volatility AS
+SELECT * FROM analytics.fx_volatility_live;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_fx_volatility
+ON analytics.fx_volatility (source_series_id);
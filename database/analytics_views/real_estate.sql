@@ -10,9 +10,10 @@
 -- ------------------------------------------------------------------------------
 -- This view serves as a pilot for the Housing Affordability Stress Map,
 -- focusing on Cook County, IL. It joins local home price and income data
--- to calculate a time-series affordability ratio.
+-- to calculate a time-series affordability ratio. Defined as *_live and
+-- materialized under the public name (see migration 4110a305e312).
 -- ------------------------------------------------------------------------------
-CREATE OR REPLACE VIEW analytics.v_cook_county_housing_pilot AS
+CREATE OR REPLACE VIEW analytics.v_cook_county_housing_pilot_live AS
 WITH
     -- Step 1: Isolate the time-series for Cook County House Price Index
     home_price AS (
@@ -55,4 +56,10 @@ WHERE
 ORDER BY
     hp.observation_date DESC;
 
-COMMENT ON VIEW analytics.v_cook_county_housing_pilot IS 'Pilot view for housing affordability in Cook County, IL, calculating a ratio of house price index to median income.';
+COMMENT ON VIEW analytics.v_cook_county_housing_pilot_live IS 'Pilot view for housing affordability in Cook County, IL, calculating a ratio of house price index to median income.';
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS analytics.v_cook_county_housing_pilot AS
+SELECT * FROM analytics.v_cook_county_housing_pilot_live;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_v_cook_county_housing_pilot
+ON analytics.v_cook_county_housing_pilot (observation_date);
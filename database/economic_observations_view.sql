@@ -3,24 +3,40 @@
 -- ============================================================================
 -- Purpose: Provide Directus-compatible read-only access to economic_observations
 -- Reason: TimescaleDB partitioned table has composite PK which Directus cannot manage
--- Solution: View with synthetic primary key (ROW_NUMBER) for Directus compatibility
+-- Solution: View with a synthetic primary key computed from (series_id, observation_date)
+--
+-- view_id = series_id * 1000000 + (observation_date - DATE '0001-01-01')
+--
+-- The key is a pure row expression (no window function, no ORDER BY), so
+-- Postgres inlines the view and Directus filters, sorts and LIMIT/OFFSET
+-- pages are pushed down to the hypertable:
+-- - view_id lookups and sorts use idx_obs_view_id (expression index, see
+--   alembic revision eb256617afcd)
+-- - series_id / observation_date filters use the primary key index
+--
+-- Decode a key with:
+--   series_id        = view_id / 1000000
+--   observation_date = DATE '0001-01-01' + (view_id % 1000000)::int
 -- ============================================================================
 
--- Drop existing view if present
-DROP VIEW IF EXISTS analytics.economic_observations_view CASCADE;
+CREATE INDEX IF NOT EXISTS idx_obs_view_id
+ON timeseries.economic_observations (
+    (series_id::bigint * 1000000 + (observation_date - DATE '0001-01-01'))
+);
 
--- Create view with synthetic primary key
-CREATE OR REPLACE VIEW analytics.economic_observations_view AS
+DROP VIEW IF EXISTS analytics.economic_observations_view;
+
+CREATE VIEW analytics.economic_observations_view AS
 SELECT
-    -- Synthetic primary key (required by Directus)
-    ROW_NUMBER() OVER (ORDER BY eo.observation_date DESC, eo.series_id) as view_id,
-    
+    -- Synthetic primary key (required by Directus); matches idx_obs_view_id
+    eo.series_id::bigint * 1000000 + (eo.observation_date - DATE '0001-01-01') AS view_id,
+
     -- Core observation data
     eo.series_id,
     eo.observation_date,
     eo.value,
     eo.quality_flag,
-    
+
     -- Enriched metadata from series_metadata
     sm.series_name,
     sm.source_series_id,
@@ -28,26 +44,26 @@ SELECT
     sm.units,
     sm.frequency,
     sm.seasonal_adjustment,
-    
+
     -- Data source information
     ds.source_name
-    
+
 FROM timeseries.economic_observations eo
 JOIN metadata.series_metadata sm ON eo.series_id = sm.series_id
 JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
-WHERE sm.is_active = TRUE
-ORDER BY eo.observation_date DESC, eo.series_id;
+WHERE sm.is_active = TRUE;
 
 -- Add helpful comment
 COMMENT ON VIEW analytics.economic_observations_view IS
 'Read-only view of economic observations for Directus dashboard access.
 
 Features:
-- Synthetic primary key (view_id) for Directus compatibility
+- Stable synthetic primary key (view_id) derived from (series_id, observation_date)
 - Enriched with series metadata (name, geography, units, frequency)
 - Includes data source information
 - Filtered to active series only
-- Ordered by date (newest first) for dashboard performance
+- Unordered: sort in Directus (by view_id, series_id or observation_date),
+  which is pushed down to the hypertable indexes
 
 Usage:
 - Register this view in Directus as "economic_observations_view"
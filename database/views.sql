@@ -14,16 +14,42 @@ CREATE SCHEMA IF NOT EXISTS analytics;
 
 COMMENT ON SCHEMA analytics IS
 'Normalized views and analytical queries.
-Never stores data - always pulls from raw timeseries tables.
+Never stores source data - expensive views are materialized from their
+*_live definitions and refreshed after ingestion.
 All views are safe to drop and recreate without data loss.';
 
 -- ============================================================================
 -- Drop existing views to allow clean recreation
 -- ============================================================================
 
+-- fx_rates_normalized and macro_indicators_latest are materialized views over
+-- their *_live definitions (migration 4110a305e312), or plain views on
+-- databases set up before that. CASCADE also drops fx_volatility: re-run
+-- analytics_views.sql after this file.
+
+DO $$
+DECLARE
+    rel RECORD;
+BEGIN
+    FOR rel IN
+        SELECT c.relname, c.relkind
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'analytics'
+        AND c.relname IN ('macro_indicators_latest', 'fx_rates_normalized')
+        AND c.relkind IN ('v', 'm')
+    LOOP
+        EXECUTE format(
+            'DROP %s IF EXISTS analytics.%I CASCADE',
+            CASE rel.relkind WHEN 'm' THEN 'MATERIALIZED VIEW' ELSE 'VIEW' END,
+            rel.relname
+        );
+    END LOOP;
+END $$;
+
 DROP VIEW IF EXISTS analytics.data_quality_dashboard CASCADE;
-DROP VIEW IF EXISTS analytics.macro_indicators_latest CASCADE;
-DROP VIEW IF EXISTS analytics.fx_rates_normalized CASCADE;
+DROP VIEW IF EXISTS analytics.macro_indicators_latest_live CASCADE;
+DROP VIEW IF EXISTS analytics.fx_rates_normalized_live CASCADE;
 
 -- ============================================================================
 -- VIEW: FX Rates Normalized (CORRECTED with Cross-Rate Calculations)
@@ -37,7 +63,7 @@ DROP VIEW IF EXISTS analytics.fx_rates_normalized CASCADE;
 -- Key Fix: Non-USD rates now use date-aware cross-rate calculation
 -- ============================================================================
 
-CREATE OR REPLACE VIEW analytics.fx_rates_normalized AS
+CREATE OR REPLACE VIEW analytics.fx_rates_normalized_live AS
 WITH raw_fx AS (
     SELECT
         eo.observation_date,
@@ -173,7 +199,7 @@ WHERE
      OR rf.source_series_id = 'FXUSDCAD'
      OR (rf.source_series_id LIKE 'FX%' AND ucr.usd_per_cad IS NOT NULL));
 
-COMMENT ON VIEW analytics.fx_rates_normalized IS
+COMMENT ON VIEW analytics.fx_rates_normalized_live IS
 'FX rates normalized to USD per 1 unit of foreign currency.
 
 Transformation Methods:
@@ -205,7 +231,7 @@ Always query this view for cross-currency analysis, never use raw data directly.
 -- Purpose: Show latest value for each series with year-over-year growth
 -- ============================================================================
 
-CREATE VIEW analytics.macro_indicators_latest AS
+CREATE VIEW analytics.macro_indicators_latest_live AS
 WITH ranked_obs AS (
     SELECT
         sm.series_id,
@@ -261,7 +287,7 @@ SELECT
 FROM ranked_obs
 WHERE date_rank = 1;  -- Only latest observation
 
-COMMENT ON VIEW analytics.macro_indicators_latest IS
+COMMENT ON VIEW analytics.macro_indicators_latest_live IS
 'Latest observation for each active series with year-over-year calculations.
 Automatically adjusts lookback period based on frequency:
 - Daily/Business: 365/252 days
@@ -404,6 +430,31 @@ Use this view for:
 - Alerting on stale data sources
 - Data quality reporting';
 
+-- ============================================================================
+-- Materializations
+-- ============================================================================
+-- Consumers query the public names; chronos.ingestion.analytics_refresh
+-- refreshes them CONCURRENTLY (hence the unique indexes) after ingestion.
+-- ============================================================================
+
+CREATE MATERIALIZED VIEW analytics.fx_rates_normalized AS
+SELECT * FROM analytics.fx_rates_normalized_live;
+
+CREATE UNIQUE INDEX uq_fx_rates_normalized
+ON analytics.fx_rates_normalized (series_id, observation_date);
+
+COMMENT ON MATERIALIZED VIEW analytics.fx_rates_normalized IS
+'Materialized analytics.fx_rates_normalized_live (see its comment).';
+
+CREATE MATERIALIZED VIEW analytics.macro_indicators_latest AS
+SELECT * FROM analytics.macro_indicators_latest_live;
+
+CREATE UNIQUE INDEX uq_macro_indicators_latest
+ON analytics.macro_indicators_latest (source_name, source_series_id);
+
+COMMENT ON MATERIALIZED VIEW analytics.macro_indicators_latest IS
+'Materialized analytics.macro_indicators_latest_live (see its comment).';
+
 -- ============================================================================
 -- Grant permissions (optional - adjust based on your access control)
 -- ============================================================================
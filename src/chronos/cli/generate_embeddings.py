@@ -1,52 +1,194 @@
 #!/usr/bin/env python3
-"""Generate embeddings for series descriptions using sentence-transformers."""
+"""Generate embeddings for series descriptions using sentence-transformers.
+
+Each embedded row also stores a SHA-256 of the model name and the text that
+was embedded. Modes select which rows are (re-)embedded:
+
+- incremental (default): no embedding yet, or the description or model
+  changed since the stored hash
+- missing: only rows without an embedding
+- full: every row with a description
+
+Rows are streamed from a server-side cursor in pages. Each page is encoded
+with batched model.encode calls (optionally across a pool of CPU worker
+processes) and written back with a single UPDATE ... FROM unnest(...)
+statement on a separate session, committed per page.
+
+Usage:
+    python -m chronos.cli.generate_embeddings
+    python -m chronos.cli.generate_embeddings --mode full
+    python -m chronos.cli.generate_embeddings --page-size 2000 --batch-size 128 --processes 8
+"""
+
+import argparse
+import hashlib
+import time
 
-from sentence_transformers import SentenceTransformer
 from sqlalchemy import text
 
 from chronos.database.connection import get_db_session
 
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
-def generate_embeddings():
-    """Generate and store embeddings for all series."""
-    model = SentenceTransformer("all-MiniLM-L6-v2")
-
-    with get_db_session() as session:
-        # Fetch series without embeddings
-        result = session.execute(
-            text(
-                """
-            SELECT series_id, series_description
-            FROM metadata.series_metadata
-            WHERE description_embedding IS NULL
-            AND series_description IS NOT NULL
-        """
-            )
+MODES = ("incremental", "missing", "full")
+
+# Must match description_hash() below
+SQL_DESCRIPTION_HASH = (
+    "encode(sha256(convert_to("
+    "CAST(:model AS text) || E'\\n' || series_description, 'UTF8'"
+    ")), 'hex')"
+)
+
+PENDING_WHERE = {
+    "incremental": f"""
+        WHERE series_description IS NOT NULL
+        AND (
+            description_embedding IS NULL
+            OR description_embedding_hash IS DISTINCT FROM {SQL_DESCRIPTION_HASH}
         )
+    """,
+    "missing": """
+        WHERE description_embedding IS NULL
+        AND series_description IS NOT NULL
+    """,
+    "full": """
+        WHERE series_description IS NOT NULL
+    """,
+}
+
+
+def count_sql(mode: str):
+    return text(f"SELECT COUNT(*) FROM metadata.series_metadata {PENDING_WHERE[mode]}")
+
+
+def select_sql(mode: str):
+    return text(
+        f"""
+        SELECT series_id, series_description
+        FROM metadata.series_metadata
+        {PENDING_WHERE[mode]}
+        ORDER BY series_id
+    """
+    )
+
+
+UPDATE_SQL = text(
+    """
+    UPDATE metadata.series_metadata AS sm
+    SET description_embedding = CAST(v.embedding AS vector),
+        description_embedding_hash = v.content_hash,
+        description_embedding_model = CAST(:model AS text)
+    FROM unnest(
+        CAST(:series_ids AS integer[]),
+        CAST(:embeddings AS text[]),
+        CAST(:hashes AS text[])
+    ) AS v(series_id, embedding, content_hash)
+    WHERE sm.series_id = v.series_id
+"""
+)
+
 
-        series_list = result.fetchall()
-        print(f"Found {len(series_list)} series needing embeddings")
-
-        for series_id, description in series_list:
-            # Generate embedding
-            embedding = model.encode(description)
-
-            # FIXED: Use parameterized query (prevents SQL injection)
-            session.execute(
-                text(
-                    """
-                    UPDATE metadata.series_metadata
-                    SET description_embedding = :embedding::vector
-                    WHERE series_id = :series_id
-                """
-                ),
-                {"embedding": embedding.tolist(), "series_id": series_id},
+def description_hash(model_name: str, description: str) -> str:
+    """Hash identifying the embedded text and the model that embedded it"""
+    return hashlib.sha256(f"{model_name}\n{description}".encode()).hexdigest()
+
+
+def to_pgvector(embedding) -> str:
+    """Render an embedding as a pgvector text literal"""
+    return "[" + ",".join(map(repr, embedding.tolist())) + "]"
+
+
+def generate_embeddings(
+    model_name: str = DEFAULT_MODEL,
+    page_size: int = 1000,
+    batch_size: int = 64,
+    processes: int = 0,
+    mode: str = "incremental",
+):
+    """Generate and store embeddings for series selected by `mode`."""
+    # Imported here so the SQL and hashing helpers load without the model stack
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+    pool = model.start_multi_process_pool(["cpu"] * processes) if processes > 1 else None
+
+    embedded = 0
+    started = time.perf_counter()
+
+    try:
+        with get_db_session() as reader, get_db_session() as writer:
+            params = {"model": model_name}
+            total = reader.execute(count_sql(mode), params).scalar_one()
+            print(f"Found {total} series needing embeddings")
+
+            # Server-side cursor: rows arrive page by page instead of all at once
+            result = reader.execute(
+                select_sql(mode).execution_options(stream_results=True, yield_per=page_size),
+                params,
             )
-            print(f"✅ Generated embedding for series {series_id}")
 
-        session.commit()
-        print(f"\n✅ Generated {len(series_list)} embeddings")
+            for page in result.partitions(page_size):
+                series_ids = [row[0] for row in page]
+                descriptions = [row[1] for row in page]
+
+                encode_started = time.perf_counter()
+                if pool is not None:
+                    embeddings = model.encode_multi_process(
+                        descriptions, pool, batch_size=batch_size
+                    )
+                else:
+                    embeddings = model.encode(descriptions, batch_size=batch_size)
+                encode_seconds = time.perf_counter() - encode_started
+
+                writer.execute(
+                    UPDATE_SQL,
+                    {
+                        "series_ids": series_ids,
+                        "embeddings": [to_pgvector(e) for e in embeddings],
+                        "hashes": [description_hash(model_name, d) for d in descriptions],
+                        "model": model_name,
+                    },
+                )
+                writer.commit()
+
+                embedded += len(page)
+                encode_rate = len(page) / max(encode_seconds, 1e-9)
+                overall_rate = embedded / (time.perf_counter() - started)
+                print(
+                    f"✅ [{embedded}/{total}] page of {len(page)} encoded in {encode_seconds:.1f}s "
+                    f"({encode_rate:.0f}/s encode, {overall_rate:.0f}/s overall)"
+                )
+    finally:
+        if pool is not None:
+            model.stop_multi_process_pool(pool)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Generated {embedded} embeddings in {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate series description embeddings")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="sentence-transformers model")
+    parser.add_argument(
+        "--page-size", type=int, default=1000, help="Rows fetched, encoded and written per page"
+    )
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per encode batch")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Encode across this many CPU worker processes (default: in-process)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="incremental",
+        help="incremental: new or changed descriptions; missing: no embedding; full: everything",
+    )
+    args = parser.parse_args()
+
+    generate_embeddings(args.model, args.page_size, args.batch_size, args.processes, args.mode)
 
 
 if __name__ == "__main__":
-    generate_embeddings()
+    main()
@@ -0,0 +1,137 @@
+"""
+Refresh of materialized analytics views after ingestion
+
+Expensive analytics views are materialized under the names consumers query
+(the definitions live in analytics.<view>_live, see migration 4110a305e312),
+so reads no longer recompute window functions over the hypertable.
+analytics.materialized_view_dependencies maps every materialization to LIKE
+patterns over source_series_id; after a run, only the materializations
+matching a series that gained new or revised observations are refreshed. Refreshes are CONCURRENTLY, so readers keep
+seeing the previous rows until the new ones are swapped in.
+
+Usage:
+    python -m chronos.ingestion.analytics_refresh --all
+    python -m chronos.ingestion.analytics_refresh --series FXUSDCAD --series DEXUSEU
+"""
+
+import argparse
+import time
+
+from psycopg2 import sql
+
+AFFECTED_VIEWS_SQL = """
+    SELECT DISTINCT d.view_name
+    FROM analytics.materialized_view_dependencies d
+    WHERE EXISTS (
+        SELECT 1 FROM unnest(%s::text[]) AS changed(source_series_id)
+        WHERE changed.source_series_id LIKE d.source_series_pattern
+    )
+    ORDER BY d.view_name
+"""
+
+ALL_VIEWS_SQL = "SELECT view_name FROM analytics.materialized_views ORDER BY view_name"
+
+RECORD_REFRESH_SQL = """
+    UPDATE analytics.materialized_views
+    SET refreshed_at = NOW(), refresh_ms = %s
+    WHERE view_name = %s
+"""
+
+REFRESH_SQL = sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}.{}")
+
+
+def affected_views(conn, source_series_ids) -> list[str]:
+    """Materializations that depend on any of the given series"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(AFFECTED_VIEWS_SQL, (list(source_series_ids),))
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def refresh_views(conn, view_names) -> dict[str, float]:
+    """Refresh each materialization in its own transaction
+
+    A failed refresh is reported and rolled back without stopping the rest;
+    the view keeps serving its previous rows.
+
+    Returns:
+        Seconds taken per refreshed view
+    """
+    refreshed = {}
+    cursor = conn.cursor()
+    for view_name in view_names:
+        started = time.perf_counter()
+        try:
+            cursor.execute(
+                REFRESH_SQL.format(sql.Identifier("analytics"), sql.Identifier(view_name))
+            )
+            seconds = time.perf_counter() - started
+            cursor.execute(RECORD_REFRESH_SQL, (round(seconds * 1000, 3), view_name))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"    ⚠️  Could not refresh analytics.{view_name}: {e}")
+            continue
+        refreshed[view_name] = seconds
+        print(f"    ✅ analytics.{view_name} refreshed in {seconds:.1f}s")
+    cursor.close()
+    return refreshed
+
+
+def refresh_for_series(conn, source_series_ids) -> dict[str, float]:
+    """Refresh the materializations affected by the given series
+
+    Does nothing (with a warning) if the materialization tables are missing,
+    so ingestion keeps working before the migration is applied.
+    """
+    if not source_series_ids:
+        return {}
+
+    try:
+        views = affected_views(conn, source_series_ids)
+    except Exception as e:
+        conn.rollback()
+        print(f"⚠️  Analytics refresh unavailable: {e}")
+        return {}
+
+    if not views:
+        return {}
+
+    print(f"🔄 Refreshing {len(views)} analytics view(s) affected by this run")
+    return refresh_views(conn, views)
+
+
+def main():
+    # Imported here: timeseries_cli itself imports this module
+    from chronos.ingestion.timeseries_cli import get_db_connection
+
+    parser = argparse.ArgumentParser(description="Refresh materialized analytics views")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--all", action="store_true", help="Refresh every materialization")
+    target.add_argument("--view", action="append", help="Refresh this materialization")
+    target.add_argument(
+        "--series", action="append", help="Refresh what depends on this source series ID"
+    )
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        if args.series:
+            refresh_for_series(conn, args.series)
+            return
+
+        views = args.view
+        if args.all:
+            cursor = conn.cursor()
+            cursor.execute(ALL_VIEWS_SQL)
+            views = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+        refresh_views(conn, views)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
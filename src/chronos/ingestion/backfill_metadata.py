@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
 """
 Backfill metadata for existing series in the database
+
+Series are grouped by source and processed in batches: each batch is fetched
+with the plugin's batch metadata call (multi-vector requests for StatsCan,
+concurrent throttled lookups elsewhere) and written with a single
+UPDATE ... FROM (VALUES ...) statement. Sources are fetched in parallel
+since each has its own rate limit. Every updated series is announced on
+SERIES_CHANGED_CHANNEL so API processes drop their cached metadata.
 """
+import argparse
 import os
-import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import psycopg2
 from dotenv import load_dotenv
+from psycopg2.extras import execute_values
 
-from chronos.ingestion.fred import FREDPlugin
-from chronos.ingestion.statscan import StatsCanPlugin
-from chronos.ingestion.valet import ValetPlugin
+from chronos.ingestion.registry import PluginRegistry
+from chronos.ingestion.timeseries_cli import SERIES_CHANGED_CHANNEL
 
 # Load environment
 root_dir = Path(__file__).parent.parent.parent.parent
@@ -27,12 +36,38 @@ DB_CONFIG = {
     "password": os.getenv("DATABASE_PASSWORD"),
 }
 
-# Initialize plugins
-PLUGINS = {
-    "Federal Reserve Economic Data": FREDPlugin(os.getenv("FRED_API_KEY")),
-    "Bank of Canada Valet": ValetPlugin(),
-    "Statistics Canada": StatsCanPlugin(),
-}
+# Plugins are looked up by data_sources.source_name and created on first use
+PLUGINS = PluginRegistry()
+
+
+# Series per fetch-and-update batch
+BATCH_SIZE = 100
+
+SELECT_SQL = """
+    SELECT sm.series_id, sm.source_series_id, sm.series_name, ds.source_name
+    FROM metadata.series_metadata sm
+    JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
+    WHERE sm.units IS NULL OR sm.unit_type = 'OTHER'
+    ORDER BY sm.series_id;
+"""
+
+UPDATE_SQL = f"""
+    UPDATE metadata.series_metadata AS sm
+    SET
+        units = v.units,
+        unit_type = v.unit_type::metadata.unit_type_enum,
+        display_units = v.display_units,
+        seasonal_adjustment = v.seasonal_adjustment::metadata.seasonal_adjustment_enum,
+        series_description = v.series_description,
+        last_updated = NOW()
+    FROM (VALUES %s) AS v(
+        series_id, units, unit_type, display_units, seasonal_adjustment, series_description
+    )
+    WHERE sm.series_id = v.series_id
+    RETURNING pg_notify('{SERIES_CHANGED_CHANNEL}', sm.series_id::text);
+"""
+
+UPDATE_TEMPLATE = "(%s::integer, %s, %s, %s, %s, %s)"
 
 
 def get_db_connection():
@@ -40,7 +75,36 @@ def get_db_connection():
     return psycopg2.connect(**DB_CONFIG)
 
 
-def backfill_metadata():
+def fetch_batch(plugin, batch: list[tuple]) -> tuple[list[tuple], list[tuple]]:
+    """Fetch metadata for one batch of series rows
+
+    Returns:
+        (update rows for UPDATE_SQL, series rows that returned no metadata)
+    """
+    metadata = plugin.fetch_metadata_many([row[1] for row in batch])
+
+    updates = []
+    missing = []
+    for row in batch:
+        series_id, source_series_id = row[0], row[1]
+        meta = metadata.get(source_series_id)
+        if not meta:
+            missing.append(row)
+            continue
+        updates.append(
+            (
+                series_id,
+                meta.get("units"),
+                meta.get("unit_type", "OTHER"),
+                meta.get("display_units"),
+                meta.get("seasonal_adjustment"),
+                meta.get("notes"),
+            )
+        )
+    return updates, missing
+
+
+def backfill_metadata(batch_size: int = BATCH_SIZE, source: str | None = None):
     """Backfill metadata for all existing series"""
     print("\n" + "=" * 60)
     print("🔄 Backfilling Metadata for Existing Series")
@@ -50,77 +114,80 @@ def backfill_metadata():
     cursor = conn.cursor()
 
     # Get all series that need metadata updates
-    cursor.execute(
-        """
-        SELECT sm.series_id, sm.source_series_id, sm.series_name, ds.source_name
-        FROM metadata.series_metadata sm
-        JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
-        WHERE sm.units IS NULL OR sm.unit_type = 'OTHER'
-        ORDER BY sm.series_id;
-    """
-    )
-
+    cursor.execute(SELECT_SQL)
     series_list = cursor.fetchall()
     print(f"Found {len(series_list)} series to update\n")
 
     updated = 0
     skipped = 0
 
-    for i, (series_id, source_series_id, series_name, source_name) in enumerate(series_list, 1):
-        print(f"[{i}/{len(series_list)}] {source_series_id} - {series_name}")
-
-        # Get the appropriate plugin
-        plugin = PLUGINS.get(source_name)
-        if not plugin or not hasattr(plugin, "fetch_metadata"):
-            print("    ⚠️  No metadata fetcher for this source")
-            skipped += 1
+    # Group by source so each batch can use that source's batch endpoint
+    by_source = defaultdict(list)
+    for row in series_list:
+        source_name = row[3]
+        if source and PLUGINS.resolve(source_name) != PLUGINS.resolve(source):
             continue
+        by_source[source_name].append(row)
 
+    jobs = {}
+    for source_name, rows in by_source.items():
         try:
-            # Fetch metadata from API
-            metadata = plugin.fetch_metadata(source_series_id)
-            time.sleep(1)  # Rate limiting
-
-            if not metadata:
-                print("    ⚠️  No metadata returned")
-                skipped += 1
+            plugin = PLUGINS.get(source_name)
+        except ValueError as e:
+            # e.g. FRED without FRED_API_KEY; the other sources still run
+            print(f"⚠️  Could not create plugin for {source_name} ({len(rows)} series): {e}")
+            skipped += len(rows)
+            continue
+        if plugin is None:
+            print(f"⚠️  No metadata fetcher for {source_name} ({len(rows)} series)")
+            skipped += len(rows)
+            continue
+        batches = deque(
+            rows[start : start + batch_size] for start in range(0, len(rows), batch_size)
+        )
+        jobs[source_name] = (plugin, batches)
+
+    # Sources have independent rate limits and are fetched in parallel; each
+    # source has at most one batch in flight, so its batches run one by one
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+        running = {}
+
+        def submit_next(source_name: str):
+            plugin, batches = jobs[source_name]
+            if batches:
+                batch = batches.popleft()
+                running[executor.submit(fetch_batch, plugin, batch)] = (source_name, batch)
+
+        for source_name in jobs:
+            submit_next(source_name)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            source_name, batch = running.pop(future)
+            submit_next(source_name)
+            try:
+                updates, missing = future.result()
+                if updates:
+                    execute_values(
+                        cursor, UPDATE_SQL, updates, template=UPDATE_TEMPLATE, page_size=batch_size
+                    )
+                conn.commit()
+            except Exception as e:
+                print(f"❌ {source_name}: batch of {len(batch)} failed: {e}")
+                conn.rollback()
+                skipped += len(batch)
                 continue
 
-            # Update the series
-            cursor.execute(
-                """
-                UPDATE metadata.series_metadata
-                SET
-                    units = %s,
-                    unit_type = %s::metadata.unit_type_enum,
-                    display_units = %s,
-                    seasonal_adjustment = %s,
-                    series_description = %s,
-                    last_updated = NOW()
-                WHERE series_id = %s;
-            """,
-                (
-                    metadata.get("units"),
-                    metadata.get("unit_type", "OTHER"),
-                    metadata.get("display_units"),
-                    metadata.get("seasonal_adjustment"),
-                    metadata.get("notes"),
-                    series_id,
-                ),
-            )
-
-            conn.commit()
-            print(f"    ✅ Updated: {metadata.get('unit_type')} - {metadata.get('display_units')}")
-            updated += 1
-
-        except Exception as e:
-            print(f"    ❌ Error: {str(e)}")
-            conn.rollback()
-            skipped += 1
-            continue
+            for _, source_series_id, series_name, _ in missing:
+                print(f"    ⚠️  No metadata returned: {source_series_id} - {series_name}")
+            print(f"✅ {source_name}: updated {len(updates)}/{len(batch)} series")
+            updated += len(updates)
+            skipped += len(missing)
 
     cursor.close()
     conn.close()
+    PLUGINS.close()
 
     print("\n" + "=" * 60)
     print("✅ BACKFILL COMPLETE!")
@@ -131,4 +198,11 @@ def backfill_metadata():
 
 
 if __name__ == "__main__":
-    backfill_metadata()
+    parser = argparse.ArgumentParser(description="Backfill metadata for existing series")
+    parser.add_argument(
+        "--batch-size", type=int, default=BATCH_SIZE, help="Series per fetch/update batch"
+    )
+    parser.add_argument("--source", help="Only backfill this source (e.g. FRED, StatsCan)")
+    args = parser.parse_args()
+
+    backfill_metadata(args.batch_size, args.source)
@@ -2,26 +2,171 @@
 Base plugin class for economic data sources
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .batch import ObservationBatch
+from .http_cache import HTTPCache
 
 
 class DataSourcePlugin(ABC):
-    """Base class for data source plugins"""
+    """Base class for data source plugins
+
+    Every plugin shares one pooled, keep-alive requests.Session per instance,
+    so consecutive series and metadata lookups reuse the same TCP/TLS
+    connection. Rate limiting and retry/backoff are configured here via the
+    class attributes below instead of in each plugin's fetch loop.
+    """
+
+    # Minimum seconds between outgoing requests to this source
+    REQUEST_INTERVAL = 0.0
+
+    # Retry policy: connection errors and these statuses are retried with
+    # exponential backoff (honouring Retry-After on 429/503)
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 2.0
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Series a plugin can fetch in a single request (see fetch_observations_many)
+    MAX_SERIES_PER_REQUEST = 1
+
+    # Whether fetch_observations accepts a start_date for incremental fetches
+    SUPPORTS_START_DATE = False
+
+    # Concurrent metadata lookups in fetch_metadata_many (still throttled)
+    METADATA_WORKERS = 4
+
+    # Keep-alive connections held open per host
+    POOL_SIZE = 10
+
+    # Default per-request timeout in seconds
+    TIMEOUT = 30
 
     def __init__(self, api_key: str = None):
         self.api_key = api_key
+        # Optional on-disk response cache (see chronos.ingestion.http_cache)
+        self.http_cache: HTTPCache | None = None
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._throttle_lock = threading.Lock()
+        self._last_request = 0.0
+
+    # ------------------------------------------------------------------
+    # HTTP transport
+    # ------------------------------------------------------------------
+
+    @property
+    def session(self) -> requests.Session:
+        """Lazily created pooled session shared by all requests of this plugin"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            # Hand the final response back so plugins can map status codes
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Release pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _throttle(self):
+        """Block until REQUEST_INTERVAL has elapsed since the previous request"""
+        if self.REQUEST_INTERVAL <= 0:
+            return
+
+        with self._throttle_lock:
+            wait = self._last_request + self.REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        self._throttle()
+        kwargs.setdefault("timeout", self.TIMEOUT)
+        return self.session.request(method, url, **kwargs)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Issue an HTTP request, routed through the response cache if one is attached
+
+        Cache hits never touch the network and are not rate limited.
+        """
+        if self.http_cache is not None:
+            return self.http_cache.request(self._send, method, url, **kwargs)
+        return self._send(method, url, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Plugin interface
+    # ------------------------------------------------------------------
 
     @abstractmethod
-    def fetch_observations(self, series_id: str) -> list[dict[str, Any]]:
+    def fetch_observations(self, series_id: str) -> ObservationBatch:
         """
         Fetch observations for a series
 
         Returns:
-            List of dicts with 'date' and 'value' keys
+            ObservationBatch with parsed dates and values
         """
         pass
 
+    def fetch_observations_many(
+        self, series_ids: list[str], **kwargs
+    ) -> dict[str, ObservationBatch]:
+        """
+        Fetch observations for several series
+
+        Plugins whose API accepts multiple series per request override this
+        and raise MAX_SERIES_PER_REQUEST; the default fetches one at a time.
+
+        Returns:
+            Dict of series_id -> ObservationBatch (empty for missing series)
+        """
+        return {series_id: self.fetch_observations(series_id, **kwargs) for series_id in series_ids}
+
+    def fetch_metadata_many(self, series_ids: list[str]) -> dict[str, dict]:
+        """
+        Fetch metadata for several series
+
+        Plugins with a batch metadata endpoint override this; the default
+        overlaps up to METADATA_WORKERS fetch_metadata calls, which still
+        share the plugin's throttle and connection pool.
+
+        Returns:
+            Dict of series_id -> metadata dict (empty if unavailable)
+        """
+        fetch_metadata = getattr(self, "fetch_metadata", None)
+        if fetch_metadata is None:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.METADATA_WORKERS) as executor:
+            return dict(zip(series_ids, executor.map(fetch_metadata, series_ids), strict=True))
+
     @abstractmethod
     def get_source_id(self) -> int:
         """Return database source_id for this plugin"""
@@ -31,3 +176,12 @@ class DataSourcePlugin(ABC):
     def get_source_name(self) -> str:
         """Return human-readable source name"""
         pass
+
+    def next_release(self, series_id: str, after: date) -> date | None:
+        """First scheduled release on or after `after`, if the source publishes a calendar
+
+        The ingestion scheduler uses this to defer series until their next
+        release. Sources without a calendar return None and are scheduled
+        from their frequency alone.
+        """
+        return None
@@ -0,0 +1,110 @@
+"""
+Columnar observation batches produced by ingestion plugins
+
+An ObservationBatch holds one series' observations as parallel NumPy arrays
+(datetime64[D] dates, float64 values, optional quality flags) instead of a
+list of {'date': str, 'value': str} dicts. Plugins build batches with a
+single vectorized parse, and the loader streams them straight into COPY.
+"""
+
+import io
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ObservationBatch:
+    """Sorted, de-duplicated observations for a single series"""
+
+    series_id: str
+    dates: np.ndarray  # datetime64[D]
+    values: np.ndarray  # float64
+    flags: np.ndarray | None = None  # str, aligned with dates
+    skipped: int = 0  # raw rows dropped as unparsable or missing
+    parse_seconds: float = 0.0  # time spent in from_strings
+
+    @classmethod
+    def empty(cls, series_id: str) -> "ObservationBatch":
+        return cls(
+            series_id,
+            np.array([], dtype="datetime64[D]"),
+            np.array([], dtype=np.float64),
+        )
+
+    @classmethod
+    def from_strings(
+        cls, series_id: str, dates: Sequence[Any], values: Sequence[Any]
+    ) -> "ObservationBatch":
+        """Parse raw date and value columns in one vectorized pass
+
+        Dates may be full ISO dates or truncated periods ('YYYY-MM', 'YYYY'),
+        which resolve to the first day of the period. Values that are missing
+        or not numeric (FRED uses '.') are dropped. Duplicate dates keep the
+        last occurrence.
+        """
+        if len(dates) != len(values):
+            raise ValueError(f"{series_id}: {len(dates)} dates but {len(values)} values")
+
+        if not len(dates):
+            return cls.empty(series_id)
+
+        started = time.perf_counter()
+        try:
+            parsed_dates = np.array(dates, dtype="datetime64[D]")
+        except ValueError:
+            parsed_dates = (
+                pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce", format="mixed")
+                .to_numpy(dtype="datetime64[ns]")
+                .astype("datetime64[D]")
+            )
+
+        parsed_values = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+
+        valid = ~np.isnat(parsed_dates) & np.isfinite(parsed_values)
+        parsed_dates = parsed_dates[valid]
+        parsed_values = parsed_values[valid]
+
+        # Stable sort keeps input order within a date, so the last duplicate wins
+        order = np.argsort(parsed_dates, kind="stable")
+        parsed_dates = parsed_dates[order]
+        parsed_values = parsed_values[order]
+        keep = np.append(parsed_dates[1:] != parsed_dates[:-1], True)
+
+        return cls(
+            series_id,
+            parsed_dates[keep],
+            parsed_values[keep],
+            skipped=int(len(valid) - valid.sum()),
+            parse_seconds=time.perf_counter() - started,
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def start(self) -> np.datetime64 | None:
+        return self.dates[0] if len(self) else None
+
+    @property
+    def end(self) -> np.datetime64 | None:
+        return self.dates[-1] if len(self) else None
+
+    def to_copy_buffer(self, default_flag: str = "good") -> io.StringIO:
+        """Render (observation_date, value, quality_flag) rows as CSV for COPY"""
+        date_strings = np.datetime_as_string(self.dates, unit="D")
+        # float64 -> str gives the shortest round-trip representation
+        value_strings = self.values.astype(str)
+        flags = self.flags if self.flags is not None else np.full(len(self), default_flag)
+
+        buffer = io.StringIO()
+        rows = zip(date_strings, value_strings, flags, strict=True)
+        buffer.write("\n".join(map(",".join, rows)))
+        buffer.seek(0)
+        return buffer
@@ -2,12 +2,96 @@
 Bank of England API plugin
 """
 
-import time
-from typing import Any
+from collections import defaultdict
+from collections.abc import Iterable
+from xml.etree.ElementTree import XMLPullParser  # nosec B405 - trusted BoE endpoint
 
 import requests
 
 from .base import DataSourcePlugin
+from .batch import ObservationBatch
+
+# Series key concepts that carry the series code in SDMX generic responses
+SDMX_SERIES_CONCEPTS = frozenset({"SCODE", "SERIES_CODE", "SERIES"})
+
+
+def _local(tag: str) -> str:
+    """Strip the '{namespace}' prefix from an element tag"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _discard(elem, parent):
+    """Drop a consumed element entirely, not just its contents"""
+    elem.clear()
+    if parent is not None:
+        parent.remove(elem)
+
+
+def parse_iadb_xml(chunks: Iterable[bytes], series_ids: list[str]) -> dict[str, tuple[list, list]]:
+    """Incrementally parse an IADB XML response into per-series date/value columns
+
+    Handles both the native IADB layout (<Cube SCODE=..> wrapping
+    <Cube TIME=.. OBS_VALUE=..>) and SDMX generic <Series>/<Obs> documents,
+    regardless of namespace. Observation elements are removed from their
+    parent once consumed and finished series are cleared from the root, so
+    the parsed tree never holds more than the element being read; memory
+    grows only with the extracted date/value columns. SDMX series without a
+    code in their key are matched to `series_ids` by position.
+    """
+    columns = defaultdict(lambda: ([], []))
+    parser = XMLPullParser(events=("start", "end"))  # nosec B314 - trusted BoE endpoint
+
+    root = None
+    open_elements = []  # ancestors of the element being parsed
+    current = None  # series code the following observations belong to
+    sdmx_series_seen = 0
+    obs_time = obs_value = None
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            tag = _local(elem.tag)
+
+            if event == "start":
+                open_elements.append(elem)
+                if root is None:
+                    root = elem
+                if tag == "Cube" and "SCODE" in elem.attrib:
+                    current = elem.get("SCODE")
+                elif tag == "Series":
+                    position = min(sdmx_series_seen, len(series_ids) - 1)
+                    current = series_ids[position] if series_ids else None
+                    sdmx_series_seen += 1
+                continue
+
+            # end events
+            open_elements.pop()
+            parent = open_elements[-1] if open_elements else None
+
+            if tag == "Cube" and "TIME" in elem.attrib:
+                dates, values = columns[current]
+                dates.append(elem.get("TIME"))
+                values.append(elem.get("OBS_VALUE"))
+                _discard(elem, parent)
+            elif tag == "Value" and elem.get("concept") in SDMX_SERIES_CONCEPTS:
+                current = elem.get("value")
+            elif tag == "Time":
+                obs_time = elem.text
+            elif tag == "ObsValue":
+                obs_value = elem.get("value")
+            elif tag == "Obs":
+                if obs_time is not None and obs_value is not None:
+                    dates, values = columns[current]
+                    dates.append(obs_time)
+                    values.append(obs_value)
+                obs_time = obs_value = None
+                _discard(elem, parent)
+            elif tag in ("Cube", "Series") and root is not None:
+                # Finished series: drop everything parsed so far
+                root.clear()
+
+    parser.close()
+    return dict(columns)
 
 
 class BOEPlugin(DataSourcePlugin):
@@ -15,20 +99,34 @@ class BOEPlugin(DataSourcePlugin):
 
     BASE_URL = "https://www.bankofengland.co.uk/boeapps/database/_iadb-fromshowcolumns.asp"
 
+    # The IADB blocks aggressive clients; keep well under one request per second
+    REQUEST_INTERVAL = 1.0
+
+    # SeriesCodes accepts a comma-separated list; keep URLs a sensible length
+    MAX_SERIES_PER_REQUEST = 20
+
+    # Bytes handed to the XML parser at a time
+    CHUNK_SIZE = 64 * 1024
+
     def get_source_id(self) -> int:
         return 3
 
     def get_source_name(self) -> str:
         return "Bank of England"
 
-    def fetch_observations(self, series_id: str, max_retries: int = 3) -> list[dict[str, Any]]:
+    def fetch_observations(self, series_id: str) -> ObservationBatch:
         """Fetch observations from BoE API"""
+        return self.fetch_observations_many([series_id])[series_id]
+
+    def fetch_observations_many(self, series_ids: list[str]) -> dict[str, ObservationBatch]:
+        """Fetch several series in one request and split the response per series"""
+        requested = ",".join(series_ids)
         params = {
             "CodeVer": "new",
             "xml.x": "yes",
             "Datefrom": "01/Jan/2020",  # Shorter timeframe
             "Dateto": "now",
-            "SeriesCodes": series_id,
+            "SeriesCodes": requested,
         }
 
         headers = {
@@ -36,53 +134,29 @@ class BOEPlugin(DataSourcePlugin):
             "Accept": "application/xml, text/xml",
         }
 
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    time.sleep(5)
-
-                response = requests.get(self.BASE_URL, params=params, headers=headers, timeout=30)
-                response.raise_for_status()
-
-                # BoE returns XML - parse it
-                import xml.etree.ElementTree as ElementTree
-
-                root = ElementTree.fromstring(response.content)  # nosec B314 - prototype code
-
-                valid_obs = []
-                for cube in root.findall(
-                    ".//{http://www.SDMX.org/resources/SDMXML/schemas/v1_0/generic}Obs"
-                ):
-                    date_elem = cube.find(
-                        ".//{http://www.SDMX.org/resources/SDMXML/schemas/v1_0/generic}ObsValue"
-                    )
-                    time_elem = cube.find(
-                        ".//{http://www.SDMX.org/resources/SDMXML/schemas/v1_0/generic}Time"
-                    )
-
-                    if date_elem is not None and time_elem is not None:
-                        value = date_elem.get("value")
-                        date = time_elem.text
-
-                        if value and value != "":
-                            valid_obs.append({"date": date, "value": value})
-
-                return valid_obs
-
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 403:
-                    raise ValueError(
-                        f"BoE blocked request for {series_id} - may need authentication"
-                    ) from e
-                elif e.response.status_code == 404:
-                    raise ValueError(f"Series {series_id} not found in BoE") from e
-                else:
-                    raise
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                    continue
-                else:
-                    raise ValueError(f"Error fetching {series_id}: {str(e)}") from e
-
-        return []
+        try:
+            response = self._request(
+                "GET", self.BASE_URL, params=params, headers=headers, stream=True
+            )
+            response.raise_for_status()
+
+            # BoE returns XML - parse it as it arrives
+            columns = parse_iadb_xml(response.iter_content(self.CHUNK_SIZE), series_ids)
+
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 403:
+                raise ValueError(
+                    f"BoE blocked request for {requested} - may need authentication"
+                ) from e
+            elif e.response.status_code == 404:
+                raise ValueError(f"Series {requested} not found in BoE") from e
+            else:
+                raise
+        except Exception as e:
+            raise ValueError(f"Error fetching {requested}: {str(e)}") from e
+
+        batches = {}
+        for series_id in series_ids:
+            dates, values = columns.get(series_id, ([], []))
+            batches[series_id] = ObservationBatch.from_strings(series_id, dates, values)
+        return batches
@@ -0,0 +1,96 @@
+"""
+Update cadence rules for the ingestion scheduler
+
+Maps a series' frequency and latest observation date to the earliest time a
+new observation can plausibly be published, so the scheduler only fetches
+series that are actually due.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+
+@dataclass(frozen=True)
+class Cadence:
+    """How often a frequency produces data and how often to poll once it is due"""
+
+    period: relativedelta
+    # Poll interval once the next observation is overdue
+    recheck: timedelta
+    # Monthly/quarterly/annual observations are dated at the start of the
+    # period, so the next value cannot exist until the following period ends
+    dated_at_period_start: bool
+
+
+CADENCES = {
+    "daily": Cadence(relativedelta(days=1), timedelta(hours=6), False),
+    "weekly": Cadence(relativedelta(weeks=1), timedelta(hours=12), False),
+    "biweekly": Cadence(relativedelta(weeks=2), timedelta(days=1), False),
+    "monthly": Cadence(relativedelta(months=1), timedelta(days=1), True),
+    "quarterly": Cadence(relativedelta(months=3), timedelta(days=1), True),
+    "semiannual": Cadence(relativedelta(months=6), timedelta(days=2), True),
+    "annual": Cadence(relativedelta(years=1), timedelta(days=3), True),
+}
+
+# Series with unknown or irregular frequency are polled on this interval
+DEFAULT_RECHECK = timedelta(days=1)
+
+FREQUENCY_ALIASES = {
+    "d": "daily",
+    "w": "weekly",
+    "bw": "biweekly",
+    "m": "monthly",
+    "q": "quarterly",
+    "sa": "semiannual",
+    "semiannually": "semiannual",
+    "a": "annual",
+    "annually": "annual",
+    "yearly": "annual",
+}
+
+
+def normalize_frequency(frequency: str | None) -> str | None:
+    """Reduce catalog and API frequency labels to a CADENCES key
+
+    Handles catalog values ('Monthly'), FRED labels ('Weekly, Ending Friday',
+    'Daily, Close') and FRED short codes ('M', 'Q'). Returns None for
+    irregular or unrecognised frequencies.
+    """
+    if not frequency:
+        return None
+
+    label = frequency.split(",")[0].strip().lower().replace("-", "")
+    label = FREQUENCY_ALIASES.get(label, label)
+    return label if label in CADENCES else None
+
+
+def next_due(
+    frequency: str | None,
+    last_observation: date | None,
+    last_checked: datetime | None = None,
+) -> datetime:
+    """Earliest UTC time at which a series should be fetched again
+
+    A series with no observations is due immediately. Otherwise it becomes
+    due once the period after its latest observation has elapsed, and is then
+    re-polled every `recheck` until new data appears.
+    """
+    epoch = datetime.min.replace(tzinfo=UTC)
+    cadence = CADENCES.get(normalize_frequency(frequency))
+
+    if last_observation is None:
+        return epoch
+
+    if cadence is None:
+        return last_checked + DEFAULT_RECHECK if last_checked else epoch
+
+    expected = last_observation + cadence.period
+    if cadence.dated_at_period_start:
+        expected += cadence.period
+    due = datetime.combine(expected, time.min, tzinfo=UTC)
+
+    if last_checked is not None:
+        due = max(due, last_checked + cadence.recheck)
+    return due
@@ -0,0 +1,212 @@
+"""
+Run checkpoints for resumable ingestion
+
+Every timeseries_cli run is identified by a run_id. metadata.ingestion_log
+holds one run row (source_series_id NULL) and one row per processed series
+with its status, observation watermark, write counts, per-stage timings and
+the number of observations each quality check flagged.
+A run started with `--resume <run_id>` skips every series that already has
+a successful row for that run.
+"""
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+START_RUN_SQL = """
+    INSERT INTO metadata.ingestion_log (
+        run_id, series_count, ingestion_start, status, quality_flags
+    )
+    VALUES (%s, %s, %s, 'running', '{}')
+"""
+
+RESUME_RUN_SQL = """
+    UPDATE metadata.ingestion_log
+    SET status = 'running', ingestion_end = NULL
+    WHERE run_id = %s AND source_series_id IS NULL
+"""
+
+COMPLETED_SQL = """
+    SELECT DISTINCT source_id, source_series_id
+    FROM metadata.ingestion_log
+    WHERE run_id = %s AND status = 'success' AND source_series_id IS NOT NULL
+"""
+
+SERIES_SQL = """
+    INSERT INTO metadata.ingestion_log (
+        run_id, source_id, series_id, source_series_id, ingestion_start, ingestion_end,
+        status, error_message, watermark, records_fetched, records_inserted,
+        records_updated, records_unchanged, fetch_ms, parse_ms, write_ms, quality_flags
+    )
+    SELECT %s, %s, sm.series_id, %s, %s, NOW(), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        CAST(%s AS jsonb)
+    FROM (SELECT 1) AS one
+    LEFT JOIN metadata.series_metadata sm
+        ON sm.source_id = %s AND sm.source_series_id = %s
+"""
+
+# Totals are summed from the run's series rows, so they also cover earlier
+# attempts that crashed before reaching FINISH_RUN_SQL. quality_flags sums
+# each check's count across the series rows' JSON objects
+FINISH_RUN_SQL = """
+    UPDATE metadata.ingestion_log run
+    SET status = %s, ingestion_end = NOW(),
+        records_inserted = totals.inserted,
+        records_updated = totals.updated,
+        quality_flags = flags.quality_flags,
+        error_message = %s
+    FROM (
+        SELECT
+            COALESCE(SUM(records_inserted), 0) AS inserted,
+            COALESCE(SUM(records_updated), 0) AS updated
+        FROM metadata.ingestion_log
+        WHERE run_id = %s AND source_series_id IS NOT NULL
+    ) totals,
+    (
+        SELECT COALESCE(jsonb_object_agg(flag, observations), '{}') AS quality_flags
+        FROM (
+            SELECT q.flag, SUM(q.observations::bigint) AS observations
+            FROM metadata.ingestion_log s
+            CROSS JOIN LATERAL jsonb_each_text(s.quality_flags) AS q(flag, observations)
+            WHERE s.run_id = %s AND s.source_series_id IS NOT NULL
+            GROUP BY q.flag
+        ) per_flag
+    ) flags
+    WHERE run.run_id = %s AND run.source_series_id IS NULL
+"""
+
+
+class RunCheckpoint:
+    """Writes run and per-series checkpoint rows to metadata.ingestion_log"""
+
+    def __init__(self, run_id: str, completed: set | None = None, enabled: bool = True):
+        self.run_id = run_id
+        self.completed = completed or set()
+        self.enabled = enabled
+
+    @classmethod
+    def start(cls, conn, series_count: int, resume_run_id: str | None = None):
+        """Open a new run, or reopen `resume_run_id` and load its completed series
+
+        Returns a disabled checkpoint if ingestion_log lacks the checkpoint
+        columns, so ingestion keeps working before the migration is applied.
+        """
+        if resume_run_id:
+            try:
+                uuid.UUID(resume_run_id)
+            except ValueError:
+                raise ValueError(f"No ingestion run with run_id {resume_run_id}") from None
+
+        run_id = resume_run_id or str(uuid.uuid4())
+        cursor = conn.cursor()
+        try:
+            if resume_run_id:
+                cursor.execute(RESUME_RUN_SQL, (run_id,))
+                if cursor.rowcount == 0:
+                    raise ValueError(f"No ingestion run with run_id {run_id}")
+                cursor.execute(COMPLETED_SQL, (run_id,))
+                completed = set(cursor.fetchall())
+            else:
+                cursor.execute(START_RUN_SQL, (run_id, series_count, datetime.now(UTC)))
+                completed = set()
+            conn.commit()
+        except ValueError:
+            conn.rollback()
+            raise
+        except Exception as e:
+            conn.rollback()
+            if resume_run_id:
+                raise
+            print(f"⚠️  Run checkpoints unavailable, this run cannot be resumed: {e}")
+            return cls(run_id, enabled=False)
+        finally:
+            cursor.close()
+
+        return cls(run_id, completed)
+
+    def is_complete(self, source_id: int, series_id: str) -> bool:
+        return (source_id, series_id) in self.completed
+
+    def record(
+        self,
+        conn,
+        source_id: int,
+        series_id: str,
+        started: datetime,
+        counts: dict | None = None,
+        error: str | None = None,
+    ):
+        """Write one series checkpoint row and commit it
+
+        Checkpointing is best effort: a failed write is reported and rolled
+        back, and only means the series is re-run on resume.
+        """
+        if not self.enabled:
+            return
+
+        counts = counts or {}
+        timings = counts.get("timings", {})
+        ms = {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()}
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                SERIES_SQL,
+                (
+                    self.run_id,
+                    source_id,
+                    series_id,
+                    started,
+                    "failed" if error else "success",
+                    error,
+                    counts.get("last_observation"),
+                    counts.get("fetched"),
+                    counts.get("inserted"),
+                    counts.get("revised"),
+                    counts.get("unchanged"),
+                    ms.get("fetch"),
+                    ms.get("parse"),
+                    ms.get("write"),
+                    json.dumps(dict(counts.get("quality") or {})) if counts else None,
+                    source_id,
+                    series_id,
+                ),
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"    ⚠️  Could not write checkpoint for {series_id}: {e}")
+        finally:
+            cursor.close()
+
+    def finish(self, conn, summary: dict):
+        """Close the run row with this attempt's status and the run's totals
+
+        Totals, including the quality summary, are summed from the run's
+        series rows rather than taken from `summary`, which only covers this
+        attempt of a resumed run.
+        """
+        if not self.enabled:
+            return
+
+        failed = len(summary["failed"])
+        if not failed:
+            status = "success"
+        elif summary["successful"]:
+            status = "partial"
+        else:
+            status = "failed"
+
+        cursor = conn.cursor()
+        cursor.execute(
+            FINISH_RUN_SQL,
+            (
+                status,
+                f"{failed} series failed" if failed else None,
+                self.run_id,
+                self.run_id,
+                self.run_id,
+            ),
+        )
+        cursor.close()
+        conn.commit()
@@ -0,0 +1,79 @@
+"""
+Compression-aware writes to timeseries.economic_observations
+
+The hypertable is compressed segmented by series_id and ordered by
+observation_date once a chunk is older than the revision window (see
+migration c3ab145994ab). Most revisions land inside that window, but
+benchmark revisions can rewrite decades of history.
+
+Since TimescaleDB 2.11 (the image pins 2.17) INSERT ... ON CONFLICT works on
+compressed chunks directly: only the compressed batches of the conflicting
+series_id segment are decompressed into the chunk's uncompressed part, and
+the policy recompresses them on its next run. decompress_chunk() would
+instead rewrite every series in the chunk, so the loader never calls it.
+Before merging a batch it only drops staged rows that already match what is
+stored in compressed chunks, so unchanged history decompresses nothing.
+"""
+
+from datetime import date
+
+HYPERTABLE_SCHEMA = "timeseries"
+HYPERTABLE_NAME = "economic_observations"
+
+# Chunks whose whole range is older than this are compressed by the policy
+REVISION_WINDOW = "3 years"
+
+COMPRESSED_CHUNKS_SQL = """
+    SELECT format('%%I.%%I', chunk_schema, chunk_name), range_start::date, range_end::date
+    FROM timescaledb_information.chunks
+    WHERE hypertable_schema = %s AND hypertable_name = %s
+    AND is_compressed
+    AND range_start <= %s AND range_end > %s
+    ORDER BY range_start
+"""
+
+# Staged rows identical to the stored row need no write at all
+DROP_UNCHANGED_SQL = """
+    DELETE FROM staging_observations s
+    USING timeseries.economic_observations eo
+    WHERE eo.series_id = %s
+    AND eo.observation_date = s.observation_date
+    AND eo.observation_date >= %s AND eo.observation_date < %s
+    -- Compare at the column's precision; the staged double would never match
+    AND eo.value IS NOT DISTINCT FROM s.value::numeric(20, 6)
+    -- Same rule as the MERGE guard: a stored 'revision' flag outlives 'good'
+    AND (
+        eo.quality_flag IS NOT DISTINCT FROM s.quality_flag
+        OR (eo.quality_flag = 'revision' AND s.quality_flag = 'good')
+    )
+"""
+
+STAGED_IN_RANGE_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM staging_observations
+        WHERE observation_date >= %s AND observation_date < %s
+    )
+"""
+
+# Whole-chunk decompression, for compression_cli only
+DECOMPRESS_CHUNK_SQL = "SELECT decompress_chunk(%s::regclass, if_not_compressed => TRUE)"
+
+
+def compressed_chunks(cursor, start: date, end: date) -> list[tuple[str, date, date]]:
+    """Compressed chunks overlapping [start, end] as (name, range_start, range_end)"""
+    cursor.execute(COMPRESSED_CHUNKS_SQL, (HYPERTABLE_SCHEMA, HYPERTABLE_NAME, end, start))
+    return cursor.fetchall()
+
+
+def prepare_staged_merge(cursor, series_id: int, start: date, end: date) -> int:
+    """Drop staged rows for `series_id` that compressed chunks already hold
+
+    Returns:
+        Number of compressed chunks that still receive new or revised rows
+    """
+    written = 0
+    for _chunk, range_start, range_end in compressed_chunks(cursor, start, end):
+        cursor.execute(DROP_UNCHANGED_SQL, (series_id, range_start, range_end))
+        cursor.execute(STAGED_IN_RANGE_SQL, (range_start, range_end))
+        written += cursor.fetchone()[0]
+    return written
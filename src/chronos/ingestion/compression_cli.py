@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Project Chronos: Observation Compression Management
+====================================================
+Inspect and manage TimescaleDB compression of timeseries.economic_observations
+
+Usage:
+    python -m chronos.ingestion.compression_cli status
+    python -m chronos.ingestion.compression_cli compress --older-than "3 years"
+    python -m chronos.ingestion.compression_cli decompress --start 2015-01-01 --end 2016-12-31
+    python -m chronos.ingestion.compression_cli policy --compress-after "5 years"
+"""
+
+import argparse
+from datetime import date
+
+from chronos.ingestion.compression import (
+    DECOMPRESS_CHUNK_SQL,
+    HYPERTABLE_NAME,
+    HYPERTABLE_SCHEMA,
+    REVISION_WINDOW,
+    compressed_chunks,
+)
+from chronos.ingestion.timeseries_cli import get_db_connection
+
+HYPERTABLE = f"{HYPERTABLE_SCHEMA}.{HYPERTABLE_NAME}"
+
+STATUS_SQL = """
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE is_compressed),
+        MIN(range_start::date) FILTER (WHERE is_compressed),
+        MAX(range_end::date) FILTER (WHERE is_compressed)
+    FROM timescaledb_information.chunks
+    WHERE hypertable_schema = %s AND hypertable_name = %s
+"""
+
+STATS_SQL = """
+    SELECT
+        pg_size_pretty(before_compression_total_bytes),
+        pg_size_pretty(after_compression_total_bytes),
+        ROUND(before_compression_total_bytes::numeric
+              / NULLIF(after_compression_total_bytes, 0), 1)
+    FROM hypertable_compression_stats(%s)
+"""
+
+# Same eligibility as the policy: the chunk's whole range is older than the interval
+UNCOMPRESSED_CHUNKS_SQL = """
+    SELECT format('%%I.%%I', chunk_schema, chunk_name)
+    FROM timescaledb_information.chunks
+    WHERE hypertable_schema = %s AND hypertable_name = %s
+    AND NOT is_compressed
+    AND range_end <= NOW() - %s::interval
+    ORDER BY range_start
+"""
+
+COMPRESS_CHUNK_SQL = "SELECT compress_chunk(%s::regclass, if_not_compressed => TRUE)"
+
+
+def show_status(conn):
+    cursor = conn.cursor()
+    cursor.execute(STATUS_SQL, (HYPERTABLE_SCHEMA, HYPERTABLE_NAME))
+    total, compressed, first, last = cursor.fetchone()
+    print(f"📦 {HYPERTABLE}: {compressed}/{total} chunks compressed")
+    if compressed:
+        print(f"    Compressed range: {first} → {last}")
+        cursor.execute(STATS_SQL, (HYPERTABLE,))
+        stats = cursor.fetchone()
+        if stats and stats[0]:
+            print(f"    Size: {stats[0]} → {stats[1]} ({stats[2]}x)")
+    cursor.close()
+
+
+def compress(conn, older_than: str):
+    """Compress every uncompressed chunk older than `older_than`, one per transaction"""
+    cursor = conn.cursor()
+    cursor.execute(UNCOMPRESSED_CHUNKS_SQL, (HYPERTABLE_SCHEMA, HYPERTABLE_NAME, older_than))
+    chunks = [row[0] for row in cursor.fetchall()]
+    print(f"🗜️  Compressing {len(chunks)} chunk(s) older than {older_than}")
+
+    for chunk in chunks:
+        cursor.execute(COMPRESS_CHUNK_SQL, (chunk,))
+        conn.commit()
+        print(f"    ✅ {chunk}")
+    cursor.close()
+
+
+def decompress(conn, start: date, end: date):
+    """Decompress the chunks overlapping [start, end], e.g. before a bulk rewrite"""
+    cursor = conn.cursor()
+    chunks = compressed_chunks(cursor, start, end)
+    print(f"📂 Decompressing {len(chunks)} chunk(s) between {start} and {end}")
+
+    for chunk, range_start, range_end in chunks:
+        cursor.execute(DECOMPRESS_CHUNK_SQL, (chunk,))
+        conn.commit()
+        print(f"    ✅ {chunk} ({range_start} → {range_end})")
+    cursor.close()
+
+
+def set_policy(conn, compress_after: str | None):
+    """Replace the compression policy, or remove it when `compress_after` is None"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT remove_compression_policy(%s, if_exists => TRUE)", (HYPERTABLE,))
+    if compress_after:
+        cursor.execute(
+            "SELECT add_compression_policy(%s, compress_after => %s::interval)",
+            (HYPERTABLE, compress_after),
+        )
+        print(f"✅ Chunks will be compressed once older than {compress_after}")
+    else:
+        print("✅ Compression policy removed")
+    conn.commit()
+    cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage economic_observations compression")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="Show compressed chunks and compression ratio")
+
+    compress_parser = commands.add_parser("compress", help="Compress old chunks now")
+    compress_parser.add_argument(
+        "--older-than",
+        default=REVISION_WINDOW,
+        help=f"PostgreSQL interval (default: {REVISION_WINDOW})",
+    )
+
+    decompress_parser = commands.add_parser("decompress", help="Decompress chunks in a range")
+    decompress_parser.add_argument("--start", type=date.fromisoformat, required=True)
+    decompress_parser.add_argument("--end", type=date.fromisoformat, default=date.max)
+
+    policy_parser = commands.add_parser("policy", help="Change the compression policy")
+    policy_group = policy_parser.add_mutually_exclusive_group(required=True)
+    policy_group.add_argument("--compress-after", help="PostgreSQL interval, e.g. '3 years'")
+    policy_group.add_argument("--remove", action="store_true", help="Remove the policy")
+
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        if args.command == "status":
+            show_status(conn)
+        elif args.command == "compress":
+            compress(conn, args.older_than)
+        elif args.command == "decompress":
+            decompress(conn, args.start, args.end)
+        else:
+            set_policy(conn, None if args.remove else args.compress_after)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
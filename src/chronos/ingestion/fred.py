@@ -2,12 +2,14 @@
 FRED (Federal Reserve Economic Data) plugin
 """
 
-import time
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import requests
 
 from .base import DataSourcePlugin
+from .batch import ObservationBatch
 
 
 class FREDPlugin(DataSourcePlugin):
@@ -15,11 +17,26 @@ class FREDPlugin(DataSourcePlugin):
 
     BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
     METADATA_URL = "https://api.stlouisfed.org/fred/series"
+    RELEASE_URL = "https://api.stlouisfed.org/fred/series/release"
+    RELEASE_DATES_URL = "https://api.stlouisfed.org/fred/release/dates"
+    UPDATES_URL = "https://api.stlouisfed.org/fred/series/updates"
+
+    # fred/series/updates only covers recent revisions and pages 1000 at a time
+    UPDATES_WINDOW = timedelta(days=14)
+    UPDATES_PAGE_SIZE = 1000
+    # FRED interprets start_time/end_time in US Central time
+    FRED_TIMEZONE = ZoneInfo("America/Chicago")
+
+    # FRED allows 120 requests per minute per API key
+    REQUEST_INTERVAL = 0.5
+    SUPPORTS_START_DATE = True
 
     def __init__(self, api_key: str):
         super().__init__(api_key)
         if not api_key:
             raise ValueError("FRED API key required")
+        # series_id -> FRED release_id, resolved once per series
+        self._release_ids: dict[str, int] = {}
 
     def get_source_id(self) -> int:
         return 1
@@ -36,8 +53,7 @@ class FREDPlugin(DataSourcePlugin):
         }
 
         try:
-            time.sleep(1)  # Rate limiting
-            response = requests.get(self.METADATA_URL, params=params, timeout=30)
+            response = self._request("GET", self.METADATA_URL, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -69,6 +85,73 @@ class FREDPlugin(DataSourcePlugin):
             print(f"Warning: Could not fetch metadata for {series_id}: {e}")
             return {}
 
+    def fetch_updated_series(
+        self, since: datetime, until: datetime | None = None
+    ) -> set[str] | None:
+        """IDs of all FRED series updated between `since` and `until` (default: now)
+
+        Pages through fred/series/updates. Returns None when `since` is older
+        than the window FRED reports on, since absence from the list would
+        then not prove a series is unchanged.
+        """
+        until = until or datetime.now(UTC)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        if until - since > self.UPDATES_WINDOW:
+            return None
+
+        params = {
+            "api_key": self.api_key,
+            "file_type": "json",
+            "filter_value": "all",
+            "start_time": since.astimezone(self.FRED_TIMEZONE).strftime("%Y%m%d%H%M"),
+            "end_time": until.astimezone(self.FRED_TIMEZONE).strftime("%Y%m%d%H%M"),
+            "limit": self.UPDATES_PAGE_SIZE,
+        }
+
+        updated = set()
+        offset = 0
+        while True:
+            response = self._request("GET", self.UPDATES_URL, params={**params, "offset": offset})
+            response.raise_for_status()
+            data = response.json()
+
+            page = data.get("seriess", [])
+            updated.update(series["id"] for series in page)
+
+            offset += len(page)
+            if not page or offset >= data.get("count", 0):
+                return updated
+
+    def next_release(self, series_id: str, after: date) -> date | None:
+        """Next FRED release date for the release that publishes this series"""
+        release_id = self._release_ids.get(series_id)
+        if release_id is None:
+            params = {"series_id": series_id, "api_key": self.api_key, "file_type": "json"}
+            response = self._request("GET", self.RELEASE_URL, params=params)
+            response.raise_for_status()
+            releases = response.json().get("releases", [])
+            if not releases:
+                return None
+            release_id = self._release_ids[series_id] = releases[0]["id"]
+
+        response = self._request(
+            "GET",
+            self.RELEASE_DATES_URL,
+            params={
+                "release_id": release_id,
+                "api_key": self.api_key,
+                "file_type": "json",
+                "realtime_start": after.isoformat(),
+                "include_release_dates_with_no_data": "true",
+                "sort_order": "asc",
+                "limit": 1,
+            },
+        )
+        response.raise_for_status()
+        release_dates = response.json().get("release_dates", [])
+        return date.fromisoformat(release_dates[0]["date"]) if release_dates else None
+
     def _infer_unit_type(self, units: str, _series_id: str) -> str:
         """Infer unit_type enum from FRED units string"""
         units_lower = units.lower()
@@ -117,9 +200,7 @@ class FREDPlugin(DataSourcePlugin):
 
         return "NA"
 
-    def fetch_observations(
-        self, series_id: str, start_date: str | None = None, max_retries: int = 3
-    ) -> list[dict[str, Any]]:
+    def fetch_observations(self, series_id: str, start_date: str | None = None) -> ObservationBatch:
         """Fetch observations from FRED API"""
         params = {
             "series_id": series_id,
@@ -129,37 +210,20 @@ class FREDPlugin(DataSourcePlugin):
         if start_date:
             params["observation_start"] = start_date
 
-        for attempt in range(max_retries):
-            try:
-                time.sleep(2 + attempt)  # Rate limiting
-
-                response = requests.get(self.BASE_URL, params=params, timeout=30)
-                response.raise_for_status()
-
-                data = response.json()
-                observations = data.get("observations", [])
-
-                # Filter out missing values
-                valid_obs = []
-                for obs in observations:
-                    if obs.get("value") != ".":
-                        valid_obs.append({"date": obs["date"], "value": obs["value"]})
-
-                return valid_obs
-
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 400:
-                    raise ValueError(f"Series {series_id} not found in FRED") from e
-                elif e.response.status_code == 429:
-                    wait_time = (attempt + 1) * 10
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except requests.exceptions.RequestException:
-                if attempt < max_retries - 1:
-                    continue
-                else:
-                    raise
-
-        return []
+        response = self._request("GET", self.BASE_URL, params=params)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 400:
+                raise ValueError(f"Series {series_id} not found in FRED") from e
+            raise
+
+        data = response.json()
+        observations = data.get("observations", [])
+
+        # Missing values ('.') are dropped by the vectorized parse
+        return ObservationBatch.from_strings(
+            series_id,
+            [obs["date"] for obs in observations],
+            [obs.get("value") for obs in observations],
+        )
@@ -0,0 +1,269 @@
+"""
+Persistent on-disk HTTP response cache for ingestion plugins
+
+Responses are keyed by method, URL, query parameters and request body, and
+stored as a small JSON metadata file plus a gzip-compressed body. Three modes
+are supported:
+
+- cache:  serve entries younger than max_age without touching the network,
+          otherwise revalidate with If-None-Match / If-Modified-Since and
+          reuse the stored body on 304 Not Modified
+- record: always hit the network and (re)write every successful response
+- replay: never hit the network; a missing entry raises HTTPCacheMissError
+
+Replay mode makes ingestion runs, tests and benchmarks deterministic and
+offline once a recording exists.
+
+Streamed requests (stream=True) stay streamed: a downloaded body is copied
+to disk chunk by chunk as the caller reads it, and stored bodies are read
+back from disk the same way, so neither is ever held in memory whole.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from chronos.utils.exceptions import HTTPCacheMissError
+
+MODES = ("cache", "record", "replay")
+
+# Query parameters that never influence the response body and must not leak
+# into cache keys or stored URLs (so recordings can be replayed and shared
+# without credentials).
+IGNORED_PARAMS = frozenset({"api_key"})
+
+# Response headers worth keeping alongside the body
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+
+class _StoredBody:
+    """Raw stream over a stored body, decompressed as it is read"""
+
+    def __init__(self, path: Path):
+        # Closed once read to the end, or by Response.close()
+        self._file = gzip.open(path, "rb")  # noqa: SIM115
+
+    def read(self, amt: int | None = None, **kwargs) -> bytes:
+        if self._file.closed:
+            return b""
+        chunk = self._file.read(-1 if amt is None else amt)
+        if not chunk:
+            self._file.close()
+        return chunk
+
+    def close(self):
+        self._file.close()
+
+
+class _RecordingBody:
+    """Raw stream that copies each chunk the caller reads into the cache
+
+    The copy goes to a temporary file that only replaces the stored body once
+    the response has been read to the end, so a download that is abandoned or
+    fails part way is never stored.
+    """
+
+    def __init__(self, raw, body_path: Path, on_complete: Callable[[], None]):
+        self._raw = raw
+        self._body_path = body_path
+        self._partial = body_path.with_name(f"{body_path.name}.{uuid.uuid4().hex}.partial")
+        self._file = gzip.open(self._partial, "wb")  # noqa: SIM115
+        self._on_complete = on_complete
+
+    def read(self, amt: int | None = None, **kwargs) -> bytes:
+        chunk = self._raw.read(amt, decode_content=True)
+        if self._file is None:
+            return chunk
+
+        if chunk:
+            self._file.write(chunk)
+        else:
+            self._file.close()
+            self._file = None
+            os.replace(self._partial, self._body_path)
+            self._on_complete()
+        return chunk
+
+    def close(self):
+        self._raw.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._partial.unlink(missing_ok=True)
+
+
+class HTTPCache:
+    """Disk-backed cache wrapped around a plugin's HTTP transport"""
+
+    def __init__(self, cache_dir: str | Path, mode: str = "cache", max_age: float = 0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown HTTP cache mode: {mode} (expected one of {MODES})")
+
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.max_age = max_age
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "HTTPCache | None":
+        """Build a cache from CHRONOS_HTTP_CACHE_* variables, or None if unset"""
+        cache_dir = os.getenv("CHRONOS_HTTP_CACHE_DIR")
+        if not cache_dir:
+            return None
+
+        return cls(
+            cache_dir,
+            mode=os.getenv("CHRONOS_HTTP_CACHE_MODE", "cache"),
+            max_age=float(os.getenv("CHRONOS_HTTP_CACHE_MAX_AGE", "0")),
+        )
+
+    # ------------------------------------------------------------------
+    # Keys and storage
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key(method: str, url: str, params: dict | None = None, **kwargs) -> str:
+        """Return the cache key for a request"""
+        params = {k: v for k, v in (params or {}).items() if k not in IGNORED_PARAMS}
+        material = {
+            "method": method.upper(),
+            "url": url,
+            "params": sorted((str(k), str(v)) for k, v in params.items()),
+            "json": kwargs.get("json"),
+            "data": kwargs.get("data"),
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.json", directory / f"{key}.body.gz"
+
+    def _load_meta(self, key: str) -> dict[str, Any] | None:
+        meta_path, body_path = self._paths(key)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def load(self, key: str) -> tuple[dict[str, Any], bytes] | None:
+        """Return (metadata, body) for a stored response, or None"""
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+
+        _, body_path = self._paths(key)
+        return meta, gzip.decompress(body_path.read_bytes())
+
+    @staticmethod
+    def _response_meta(response: requests.Response) -> dict[str, Any]:
+        parts = urlsplit(response.url or "")
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k not in IGNORED_PARAMS]
+        return {
+            "url": urlunsplit(parts._replace(query=urlencode(query))),
+            "status_code": response.status_code,
+            "encoding": response.encoding,
+            "headers": {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+            "stored_at": time.time(),
+        }
+
+    def _write_meta(self, key: str, meta: dict[str, Any]):
+        meta_path, _ = self._paths(key)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def store(self, key: str, response: requests.Response):
+        """Write a successful response to disk"""
+        _, body_path = self._paths(key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write the body first so a metadata file never points at a missing body
+        body_path.write_bytes(gzip.compress(response.content))
+        self._write_meta(key, self._response_meta(response))
+
+    def _record_stream(self, key: str, response: requests.Response):
+        """Store a streamed response as the caller reads it"""
+        _, body_path = self._paths(key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = self._response_meta(response)
+        response.raw = _RecordingBody(response.raw, body_path, lambda: self._write_meta(key, meta))
+
+    def _touch(self, key: str, meta: dict[str, Any]):
+        meta["stored_at"] = time.time()
+        self._write_meta(key, meta)
+
+    def _build_response(self, key: str, meta: dict[str, Any], stream: bool) -> requests.Response:
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.reason = "OK"
+        response.url = meta["url"]
+        response.encoding = meta.get("encoding")
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+
+        _, body_path = self._paths(key)
+        if stream:
+            response.raw = _StoredBody(body_path)
+        else:
+            response._content = gzip.decompress(body_path.read_bytes())
+        return response
+
+    # ------------------------------------------------------------------
+    # Request path
+    # ------------------------------------------------------------------
+
+    def request(
+        self, send: Callable[..., requests.Response], method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Serve a request from the cache, falling back to send() as the mode allows"""
+        key = self.key(method, url, **kwargs)
+        stream = kwargs.get("stream", False)
+        meta = self._load_meta(key)
+
+        if self.mode == "replay":
+            if meta is None:
+                raise HTTPCacheMissError(f"No recorded response for {method} {url}")
+            self.hits += 1
+            return self._build_response(key, meta, stream)
+
+        if self.mode == "cache" and meta is not None:
+            if time.time() - meta["stored_at"] < self.max_age:
+                self.hits += 1
+                return self._build_response(key, meta, stream)
+
+            # Conditional revalidation where the source supports validators
+            headers = dict(kwargs.pop("headers", None) or {})
+            if "ETag" in meta["headers"]:
+                headers["If-None-Match"] = meta["headers"]["ETag"]
+            if "Last-Modified" in meta["headers"]:
+                headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+            kwargs["headers"] = headers
+
+            response = send(method, url, **kwargs)
+            if response.status_code == 304:
+                if stream:
+                    # Release the connection; the unread 304 body is empty
+                    response.close()
+                self.revalidated += 1
+                self._touch(key, meta)
+                return self._build_response(key, meta, stream)
+        else:
+            response = send(method, url, **kwargs)
+
+        self.misses += 1
+        if response.status_code == 200:
+            if stream:
+                self._record_stream(key, response)
+            else:
+                self.store(key, response)
+        return response
@@ -0,0 +1,180 @@
+"""
+Conditional refresh cache for series metadata enrichment
+
+Each row in metadata.series_metadata_cache remembers when a series' metadata
+was last checked against the source API, the source-reported last_updated
+value, a content hash of what was written to series_metadata, and a hash of
+the catalog fields alone. The ingestion CLI uses it to skip the metadata API
+call while an entry is within its TTL and its catalog fields are unchanged,
+and to skip the UPSERT when a refreshed payload hashes the same.
+"""
+
+import hashlib
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+# Fields that describe the series itself. Volatile values such as the
+# source's last_updated timestamp are stored separately and not hashed, so a
+# data revision upstream does not force a metadata rewrite.
+HASHED_CATALOG_FIELDS = ("series_name", "frequency", "category", "geography_name")
+HASHED_API_FIELDS = (
+    "units",
+    "unit_type",
+    "display_units",
+    "seasonal_adjustment",
+    "frequency",
+    "notes",
+)
+
+DEFAULT_TTL = timedelta(hours=24)
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def metadata_digest(series_data: dict[str, Any], api_metadata: dict[str, Any]) -> str:
+    """Return a stable SHA-256 hex digest of the metadata written for a series"""
+    return _digest(
+        {
+            "catalog": {field: series_data.get(field) for field in HASHED_CATALOG_FIELDS},
+            "api": {field: api_metadata.get(field) for field in HASHED_API_FIELDS},
+        }
+    )
+
+
+def catalog_digest(series_data: dict[str, Any]) -> str:
+    """Return a stable SHA-256 hex digest of a series' catalog fields
+
+    Computed without an API call, so a catalog-side rename or frequency change
+    is noticed even while the entry is within its TTL.
+    """
+    return _digest({field: series_data.get(field) for field in HASHED_CATALOG_FIELDS})
+
+
+class MetadataCache:
+    """In-memory view of metadata.series_metadata_cache for one ingestion run"""
+
+    def __init__(
+        self,
+        entries: dict[tuple[int, str], dict[str, Any]] | None = None,
+        ttl: timedelta = DEFAULT_TTL,
+        force_refresh: bool = False,
+        enabled: bool = True,
+    ):
+        self.entries = entries or {}
+        self.ttl = ttl
+        self.force_refresh = force_refresh or not enabled
+        self.enabled = enabled
+        self.api_calls_skipped = 0
+        self.upserts_skipped = 0
+
+    @classmethod
+    def load(cls, conn, ttl: timedelta = DEFAULT_TTL, force_refresh: bool = False):
+        """Load all cache entries in a single query
+
+        Returns a disabled (empty, never-fresh) cache if the table has not been
+        created yet, so ingestion keeps working before the migration is applied.
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT source_id, source_series_id, source_last_updated,
+                       content_hash, catalog_hash, checked_at
+                FROM metadata.series_metadata_cache
+                """
+            )
+            rows = cursor.fetchall()
+        except Exception as e:
+            conn.rollback()
+            print(f"⚠️  Metadata cache unavailable, refreshing all metadata: {e}")
+            return cls(ttl=ttl, enabled=False)
+        finally:
+            cursor.close()
+
+        entries = {
+            (source_id, source_series_id): {
+                "source_last_updated": source_last_updated,
+                "content_hash": content_hash,
+                "catalog_hash": catalog_hash,
+                "checked_at": checked_at,
+            }
+            for (
+                source_id,
+                source_series_id,
+                source_last_updated,
+                content_hash,
+                catalog_hash,
+                checked_at,
+            ) in rows
+        }
+        return cls(entries, ttl=ttl, force_refresh=force_refresh)
+
+    def is_fresh(
+        self, source_id: int, series_id: str, catalog_hash: str, now: datetime | None = None
+    ) -> bool:
+        """True if the series was checked within the TTL and may skip the API call
+
+        An entry whose catalog fields changed since it was written is never
+        fresh: the TTL only stands in for the API side of the metadata.
+        """
+        if self.force_refresh:
+            return False
+
+        entry = self.entries.get((source_id, series_id))
+        if not entry or entry["checked_at"] is None:
+            return False
+        if entry.get("catalog_hash") != catalog_hash:
+            return False
+
+        now = now or datetime.now(UTC)
+        return now - entry["checked_at"] < self.ttl
+
+    def is_unchanged(self, source_id: int, series_id: str, digest: str) -> bool:
+        """True if the freshly fetched metadata hashes the same as the stored copy"""
+        if self.force_refresh:
+            return False
+
+        entry = self.entries.get((source_id, series_id))
+        return entry is not None and entry["content_hash"] == digest
+
+    def record(
+        self,
+        conn,
+        source_id: int,
+        series_id: str,
+        digest: str,
+        catalog_hash: str,
+        source_last_updated: str | None = None,
+    ):
+        """Upsert the cache row for a series (caller commits)"""
+        if not self.enabled:
+            return
+
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO metadata.series_metadata_cache (
+                source_id, source_series_id, source_last_updated, content_hash,
+                catalog_hash, checked_at
+            ) VALUES (%s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (source_id, source_series_id)
+            DO UPDATE SET
+                source_last_updated = EXCLUDED.source_last_updated,
+                content_hash = EXCLUDED.content_hash,
+                catalog_hash = EXCLUDED.catalog_hash,
+                checked_at = EXCLUDED.checked_at
+            """,
+            (source_id, series_id, source_last_updated or None, digest, catalog_hash),
+        )
+        cursor.close()
+
+        self.entries[(source_id, series_id)] = {
+            "source_last_updated": source_last_updated or None,
+            "content_hash": digest,
+            "catalog_hash": catalog_hash,
+            "checked_at": datetime.now(UTC),
+        }
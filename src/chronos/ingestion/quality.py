@@ -0,0 +1,204 @@
+"""
+Vectorized data-quality flags for observation batches
+
+assess() runs every check over a batch's NumPy arrays at once and stores one
+quality_flag per observation on batch.flags, which the loader COPYs along
+with the values. When several checks fire for the same observation the most
+severe flag wins (FLAG_PRECEDENCE). Checks:
+
+- spike: robust z-score of the move into (and back out of) an observation,
+  measured against the median and MAD of all moves in the batch
+- sign_flip: sign change in a series that is otherwise almost always one sign
+- gap: spacing to the previous observation exceeds what the frequency allows
+- stale: value repeated more times in a row than the frequency makes plausible
+
+Revisions are compared against the stored value inside the staging merge
+(REVISION_FLAG_SQL). The spike and sign checks need MIN_OBSERVATIONS values
+to mean anything, which an --incremental window often lacks, so short
+batches are assessed behind the latest stored observations (HISTORY_SQL, a
+keyed LIMIT probe); only the batch's own observations are flagged.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+from .batch import ObservationBatch
+from .cadence import normalize_frequency
+
+GOOD = "good"
+
+# Most severe first; also the order of the per-run summary
+FLAG_PRECEDENCE = ("spike", "sign_flip", "revision", "gap", "stale")
+
+# |robust z| above this marks a move as anomalous (~6 sigma for normal data)
+SPIKE_Z = 6.0
+# Robust statistics need a few moves to mean anything
+MIN_OBSERVATIONS = 8
+# Batches shorter than this are assessed behind stored observations
+CONTEXT_OBSERVATIONS = 60
+# Fraction of nonzero values sharing one sign for a sign change to be suspect
+SIGN_DOMINANCE = 0.95
+# Relative change against the stored value that counts as a notable revision
+REVISION_THRESHOLD = 0.05
+
+# Largest plausible spacing between consecutive observations, in days
+# (daily series skip weekends and holidays, monthly ones span 28-31 days, ...)
+MAX_SPACING_DAYS = {
+    "daily": 5,
+    "weekly": 10,
+    "biweekly": 20,
+    "monthly": 45,
+    "quarterly": 135,
+    "semiannual": 270,
+    "annual": 540,
+}
+
+# Repeats of the same value (after the first) tolerated before flagging
+MAX_REPEATS = {
+    "daily": 5,
+    "weekly": 4,
+    "biweekly": 4,
+    "monthly": 6,
+    "quarterly": 4,
+    "semiannual": 3,
+    "annual": 3,
+}
+
+REVISION_FLAG_SQL = """
+    UPDATE staging_observations s
+    SET quality_flag = 'revision'
+    FROM timeseries.economic_observations eo
+    WHERE eo.series_id = %s
+    AND eo.observation_date = s.observation_date
+    AND s.quality_flag IN ('good', 'gap', 'stale')
+    AND ABS(s.value - eo.value) > %s * GREATEST(ABS(eo.value), 1e-9)
+"""
+
+# Latest stored observations before a batch, newest first
+HISTORY_SQL = """
+    SELECT eo.observation_date, eo.value::double precision
+    FROM timeseries.economic_observations eo
+    JOIN metadata.series_metadata sm ON sm.series_id = eo.series_id
+    WHERE sm.source_id = %s AND sm.source_series_id = %s
+    AND eo.observation_date < %s
+    AND eo.value IS NOT NULL
+    ORDER BY eo.observation_date DESC
+    LIMIT %s
+"""
+
+
+def spike_mask(values: np.ndarray) -> np.ndarray:
+    """Observations reached by an outsized move that is reversed by the next move
+
+    The latest observation has no next move, so a single outsized move into
+    it is enough: a bad latest print is the one most likely to reach a chart.
+    """
+    mask = np.zeros(len(values), dtype=bool)
+    if len(values) < MIN_OBSERVATIONS:
+        return mask
+
+    moves = np.diff(values)
+    deviation = moves - np.median(moves)
+    # 1.4826 * MAD estimates sigma; fall back to the mean absolute deviation
+    # for series that barely move
+    scale = 1.4826 * np.median(np.abs(deviation))
+    if scale == 0:
+        scale = 1.2533 * np.mean(np.abs(deviation))
+    if scale == 0:
+        return mask
+
+    z = deviation / scale
+    outsized = np.abs(z) > SPIKE_Z
+    # Move into observation i is moves[i - 1], move out of it is moves[i]
+    reversed_out = outsized[1:] & (np.sign(z[1:]) == -np.sign(z[:-1]))
+    mask[1:-1] = outsized[:-1] & reversed_out
+    # Unless that move is the return from a spike just before it
+    mask[-1] = outsized[-1] & ~mask[-2]
+    return mask
+
+
+def sign_flip_mask(values: np.ndarray) -> np.ndarray:
+    """Observations whose sign differs from a series that is almost never that sign"""
+    mask = np.zeros(len(values), dtype=bool)
+    signs = np.sign(values)
+    nonzero = signs != 0
+    if nonzero.sum() < MIN_OBSERVATIONS:
+        return mask
+
+    positive_share = (signs > 0).sum() / nonzero.sum()
+    if positive_share >= SIGN_DOMINANCE:
+        mask = signs < 0
+    elif positive_share <= 1 - SIGN_DOMINANCE:
+        mask = signs > 0
+    return mask
+
+
+def gap_mask(dates: np.ndarray, frequency: str | None) -> np.ndarray:
+    """Observations that follow a longer gap than the frequency allows"""
+    mask = np.zeros(len(dates), dtype=bool)
+    max_spacing = MAX_SPACING_DAYS.get(frequency)
+    if max_spacing is None or len(dates) < 2:
+        return mask
+
+    spacing = np.diff(dates).astype(np.int64)
+    mask[1:] = spacing > max_spacing
+    return mask
+
+
+def stale_mask(values: np.ndarray, frequency: str | None) -> np.ndarray:
+    """Repeats of a value beyond the number the frequency makes plausible"""
+    mask = np.zeros(len(values), dtype=bool)
+    max_repeats = MAX_REPEATS.get(frequency)
+    if max_repeats is None or len(values) < 2:
+        return mask
+
+    # Index of the first observation of each run of identical values
+    run_start = np.r_[True, values[1:] != values[:-1]]
+    start_index = np.maximum.accumulate(np.where(run_start, np.arange(len(values)), 0))
+    repeats = np.arange(len(values)) - start_index
+    return repeats > max_repeats
+
+
+def assess(
+    batch: ObservationBatch,
+    frequency: str | None = None,
+    history: ObservationBatch | None = None,
+) -> Counter:
+    """Flag every observation in `batch` in place and count each check that fired
+
+    Args:
+        batch: Observations to flag
+        frequency: Catalog frequency, selects the gap and stale limits
+        history: Stored observations just before the batch; checked as context
+            but never flagged themselves
+
+    Returns:
+        Counter of flag name -> observations hit (an observation can count
+        under several checks; its stored flag is the most severe)
+    """
+    if not len(batch):
+        return Counter()
+
+    frequency = normalize_frequency(frequency)
+    dates, values = batch.dates, batch.values
+    if history is not None and len(history):
+        dates = np.concatenate([history.dates, dates])
+        values = np.concatenate([history.values, values])
+
+    own = slice(len(dates) - len(batch), None)
+    masks = {
+        "spike": spike_mask(values)[own],
+        "sign_flip": sign_flip_mask(values)[own],
+        "gap": gap_mask(dates, frequency)[own],
+        "stale": stale_mask(values, frequency)[own],
+    }
+
+    flags = np.full(len(batch), GOOD, dtype=object)
+    # Least severe first, so more severe flags overwrite
+    for name in reversed(FLAG_PRECEDENCE):
+        if name in masks:
+            flags[masks[name]] = name
+    batch.flags = flags
+
+    return Counter({name: int(mask.sum()) for name, mask in masks.items() if mask.any()})
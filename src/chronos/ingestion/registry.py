@@ -0,0 +1,159 @@
+"""
+Lazy registry of data source plugins
+
+Plugins are listed by import path and only imported and instantiated the
+first time a source is actually requested, so a `--source Valet` run never
+imports the FRED plugin or needs FRED_API_KEY.
+
+Built-in plugins are declared in BUILTIN_PLUGINS. Third-party packages can
+add sources without touching the CLI by exposing an entry point in the
+"chronos.ingestion.plugins" group, named after the catalog source:
+
+    [tool.poetry.plugins."chronos.ingestion.plugins"]
+    ECB = "chronos_ecb.plugin:ECBPlugin"
+
+Entry-point plugins receive `api_key` from <SOURCE>_API_KEY when it is set.
+"""
+
+import importlib
+import os
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+
+from .base import DataSourcePlugin
+
+ENTRY_POINT_GROUP = "chronos.ingestion.plugins"
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """How to import and configure one source's plugin"""
+
+    # Catalog source name (time-series_catalog.csv 'source' column)
+    name: str
+    # "package.module:ClassName"
+    target: str
+    # Other names the source goes by, e.g. metadata.data_sources.source_name
+    aliases: tuple[str, ...] = ()
+    # Returns constructor kwargs; called at instantiation, not at import
+    config: Callable[[], dict] = field(default=dict, compare=False)
+
+    def load(self) -> type[DataSourcePlugin]:
+        module_name, _, class_name = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+def _api_key_from_env(variable: str) -> Callable[[], dict]:
+    return lambda: {"api_key": os.getenv(variable)}
+
+
+def _optional_api_key(variable: str) -> Callable[[], dict]:
+    return lambda: {"api_key": os.environ[variable]} if os.getenv(variable) else {}
+
+
+BUILTIN_PLUGINS = (
+    PluginSpec(
+        "FRED",
+        "chronos.ingestion.fred:FREDPlugin",
+        aliases=("Federal Reserve Economic Data",),
+        config=_api_key_from_env("FRED_API_KEY"),
+    ),
+    PluginSpec(
+        "Valet",
+        "chronos.ingestion.valet:ValetPlugin",
+        aliases=("Bank of Canada Valet API", "Bank of Canada Valet"),
+    ),
+    PluginSpec(
+        "StatsCan",
+        "chronos.ingestion.statscan:StatsCanPlugin",
+        aliases=("Statistics Canada",),
+    ),
+    PluginSpec(
+        "BOE",
+        "chronos.ingestion.boe:BOEPlugin",
+        aliases=("Bank of England",),
+    ),
+)
+
+
+class PluginRegistry(Mapping):
+    """Plugins keyed by catalog source name, instantiated on first access
+
+    Lookups also accept aliases (the data_sources.source_name a plugin
+    reports). Membership tests and iteration never import a plugin; only
+    indexing does. Attributes set with set_attribute() are applied to
+    loaded plugins and to any loaded later.
+    """
+
+    def __init__(self, specs=BUILTIN_PLUGINS, load_entry_points: bool = True):
+        self._specs: dict[str, PluginSpec] = {}
+        self._aliases: dict[str, str] = {}
+        self._instances: dict[str, DataSourcePlugin] = {}
+        self._attributes: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+        for spec in specs:
+            self.register(spec)
+        if load_entry_points:
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                name = entry_point.name
+                self.register(
+                    PluginSpec(
+                        name,
+                        entry_point.value,
+                        config=_optional_api_key(f"{name.upper()}_API_KEY"),
+                    )
+                )
+
+    def register(self, spec: PluginSpec):
+        """Add or replace a source"""
+        self._specs[spec.name] = spec
+        for alias in (spec.name, *spec.aliases):
+            self._aliases[alias.lower()] = spec.name
+
+    def resolve(self, name: str) -> str | None:
+        """Canonical source name for a source name or alias"""
+        return self._aliases.get(name.lower()) if name else None
+
+    def __getitem__(self, name: str) -> DataSourcePlugin:
+        canonical = self.resolve(name)
+        if canonical is None:
+            raise KeyError(name)
+
+        plugin = self._instances.get(canonical)
+        if plugin is None:
+            with self._lock:
+                plugin = self._instances.get(canonical)
+                if plugin is None:
+                    spec = self._specs[canonical]
+                    plugin = spec.load()(**spec.config())
+                    for attribute, value in self._attributes.items():
+                        setattr(plugin, attribute, value)
+                    self._instances[canonical] = plugin
+        return plugin
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and self.resolve(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def loaded(self) -> dict[str, DataSourcePlugin]:
+        """Plugins instantiated so far"""
+        return dict(self._instances)
+
+    def set_attribute(self, attribute: str, value):
+        """Set an attribute (e.g. http_cache) on current and future plugins"""
+        self._attributes[attribute] = value
+        for plugin in self._instances.values():
+            setattr(plugin, attribute, value)
+
+    def close(self):
+        """Release the HTTP sessions of every loaded plugin"""
+        for plugin in self._instances.values():
+            plugin.close()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Project Chronos: Frequency-Aware Ingestion Scheduler
+====================================================
+Long-running alternative to one-shot timeseries_cli runs.
+
+Every poll interval the scheduler works out which Active catalog series are
+due (see chronos.ingestion.cadence), optionally defers them to the source's
+next scheduled release, and ingests only those through the plugin layer
+with a bounded number of concurrent fetches.
+
+Usage:
+    python -m chronos.ingestion.scheduler                 # run as a daemon
+    python -m chronos.ingestion.scheduler --once          # one pass, then exit
+    python -m chronos.ingestion.scheduler --dry-run --once
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+from psycopg2.pool import ThreadedConnectionPool
+
+from chronos.ingestion.analytics_refresh import refresh_for_series
+from chronos.ingestion.cadence import next_due
+from chronos.ingestion.metadata_cache import MetadataCache
+from chronos.ingestion.timeseries_cli import (
+    DB_CONFIG,
+    DEFAULT_CATALOG_PATH,
+    PLUGINS,
+    ensure_data_source,
+    ingest_series,
+    load_catalog,
+)
+from chronos.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Latest observation per series via a primary-key probe, so a poll never
+# aggregates over the whole hypertable (or decompresses old chunks)
+STATE_QUERY = """
+    SELECT ds.source_name, sm.source_series_id, sm.frequency, latest.observation_date
+    FROM metadata.series_metadata sm
+    JOIN metadata.data_sources ds ON ds.source_id = sm.source_id
+    LEFT JOIN LATERAL (
+        SELECT eo.observation_date
+        FROM timeseries.economic_observations eo
+        WHERE eo.series_id = sm.series_id
+        ORDER BY eo.observation_date DESC
+        LIMIT 1
+    ) latest ON TRUE
+"""
+
+
+@dataclass
+class ScheduledSeries:
+    """Scheduling state for one catalog series"""
+
+    series: dict
+    frequency: str | None = None
+    last_observation: date | None = None
+    last_checked: datetime | None = None
+    # Next release from the source calendar, once looked up
+    release_date: date | None = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.series["source"], self.series["series_id"]
+
+    def due_at(self) -> datetime:
+        due = next_due(self.frequency, self.last_observation, self.last_checked)
+        if self.release_date is not None:
+            due = max(due, datetime.combine(self.release_date, datetime.min.time(), tzinfo=UTC))
+        return due
+
+
+class IngestionScheduler:
+    """Polls the catalog and ingests series as they come due"""
+
+    def __init__(self, series_list: list[dict], concurrency: int = 4, metadata_ttl_hours=24.0):
+        self.concurrency = concurrency
+        self.metadata_ttl = timedelta(hours=metadata_ttl_hours)
+        self.pool = ThreadedConnectionPool(1, concurrency, **DB_CONFIG)
+
+        # Catalog frequency is the fallback until series_metadata has one
+        self.state = {
+            (s["source"], s["series_id"]): ScheduledSeries(s, frequency=s.get("frequency"))
+            for s in series_list
+        }
+
+        conn = self.pool.getconn()
+        try:
+            self.source_id_map = {
+                source: ensure_data_source(conn, PLUGINS[source])
+                for source in {s["source"] for s in series_list}
+                if source in PLUGINS
+            }
+        finally:
+            self.pool.putconn(conn)
+
+    def refresh_state(self):
+        """Load each series' stored frequency and latest observation date"""
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(STATE_QUERY)
+                rows = cursor.fetchall()
+            conn.commit()
+        finally:
+            self.pool.putconn(conn)
+
+        for source_name, series_id, frequency, last_observation in rows:
+            entry = self.state.get((PLUGINS.resolve(source_name), series_id))
+            if entry is None:
+                continue
+            entry.frequency = frequency or entry.frequency
+            entry.last_observation = last_observation
+
+    def due(self, now: datetime) -> list[ScheduledSeries]:
+        """Series due at `now`, after consulting source release calendars"""
+        due = []
+        for entry in self.state.values():
+            if entry.due_at() > now:
+                continue
+
+            source = entry.series["source"]
+            if source in PLUGINS and entry.last_observation is not None:
+                plugin = PLUGINS[source]
+                # Any release since the last check means new data may be out
+                if entry.last_checked is not None:
+                    since = entry.last_checked.date()
+                else:
+                    since = entry.last_observation + timedelta(days=1)
+                try:
+                    release = plugin.next_release(entry.series["series_id"], since)
+                except Exception as e:
+                    logger.warning("release_calendar_failed", series_id=entry.key[1], error=str(e))
+                    release = None
+                if release is not None and release > now.date():
+                    entry.release_date = release
+                    continue
+
+            due.append(entry)
+        return due
+
+    def _ingest(self, entry: ScheduledSeries, metadata_cache: MetadataCache) -> dict | None:
+        conn = self.pool.getconn()
+        try:
+            return ingest_series(conn, entry.series, self.source_id_map, metadata_cache)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    def run_once(self, dry_run: bool = False) -> int:
+        """Ingest every series that is due now; returns the number attempted"""
+        now = datetime.now(UTC)
+        self.refresh_state()
+        due = self.due(now)
+
+        logger.info("scheduler_pass", due=len(due), tracked=len(self.state))
+        if dry_run or not due:
+            for entry in due:
+                logger.info("series_due", source=entry.key[0], series_id=entry.key[1])
+            return len(due)
+
+        conn = self.pool.getconn()
+        try:
+            metadata_cache = MetadataCache.load(conn, ttl=self.metadata_ttl)
+        finally:
+            self.pool.putconn(conn)
+
+        changed = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {executor.submit(self._ingest, entry, metadata_cache): entry for entry in due}
+            for future in as_completed(futures):
+                entry = futures[future]
+                entry.last_checked = now
+                entry.release_date = None
+                try:
+                    counts = future.result()
+                except Exception as e:
+                    logger.error("series_failed", series_id=entry.key[1], error=str(e))
+                    continue
+
+                if counts is None:
+                    logger.warning("series_empty", series_id=entry.key[1])
+                    continue
+
+                entry.last_observation = counts["last_observation"]
+                if counts["inserted"] or counts["revised"]:
+                    changed.append(entry.key[1])
+                logger.info(
+                    "series_ingested",
+                    series_id=entry.key[1],
+                    inserted=counts["inserted"],
+                    revised=counts["revised"],
+                    unchanged=counts["unchanged"],
+                )
+
+        if changed:
+            conn = self.pool.getconn()
+            try:
+                refreshed = refresh_for_series(conn, changed)
+            finally:
+                self.pool.putconn(conn)
+            logger.info("analytics_refreshed", views=sorted(refreshed))
+
+        return len(due)
+
+    def run_forever(self, poll_interval: float):
+        while True:
+            # A transient database or network error skips this pass, not the daemon
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error("scheduler_pass_failed", error=str(e), exc_info=True)
+            time.sleep(poll_interval)
+
+    def close(self):
+        self.pool.closeall()
+        PLUGINS.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project Chronos: Ingestion Scheduler")
+    parser.add_argument("--catalog", help="Path to custom time-series catalog CSV")
+    parser.add_argument("--source", help="Only schedule series from this source")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("SCHEDULER_CONCURRENCY", "4")),
+        help="Maximum series ingested at once (default: 4)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=float(os.getenv("SCHEDULER_POLL_SECONDS", "900")),
+        help="Seconds between scheduling passes (default: 900)",
+    )
+    parser.add_argument(
+        "--metadata-ttl-hours",
+        type=float,
+        default=float(os.getenv("METADATA_CACHE_TTL_HOURS", "24")),
+        help="Skip metadata API calls for series checked within this many hours (default: 24)",
+    )
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument("--dry-run", action="store_true", help="Log due series without fetching")
+    args = parser.parse_args()
+
+    catalog_path = Path(args.catalog) if args.catalog else DEFAULT_CATALOG_PATH
+    series_list = [
+        s for s in load_catalog(catalog_path) if not args.source or s["source"] == args.source
+    ]
+
+    scheduler = IngestionScheduler(series_list, args.concurrency, args.metadata_ttl_hours)
+    try:
+        if args.once:
+            scheduler.run_once(dry_run=args.dry_run)
+        else:
+            scheduler.run_forever(args.poll_interval)
+    except KeyboardInterrupt:
+        logger.info("scheduler_stopped")
+    finally:
+        scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,10 @@
 Statistics Canada WDS API plugin
 """
 
-import time
 from typing import Any
 
-import requests
-
 from .base import DataSourcePlugin
+from .batch import ObservationBatch
 
 
 class StatsCanPlugin(DataSourcePlugin):
@@ -15,6 +13,12 @@ class StatsCanPlugin(DataSourcePlugin):
 
     BASE_URL = "https://www150.statcan.gc.ca/t1/wds/rest"
 
+    # WDS allows 25 requests per second per IP
+    REQUEST_INTERVAL = 0.1
+
+    # Vectors per multi-vector WDS request
+    MAX_VECTORS_PER_REQUEST = 300
+
     # Common UOM codes from StatsCan
     UOM_CODES = {
         239: ("Percent", "%", "PERCENTAGE"),
@@ -46,7 +50,7 @@ class StatsCanPlugin(DataSourcePlugin):
     def get_source_name(self) -> str:
         return "Statistics Canada"
 
-    def fetch_observations(self, series_id: str, max_retries: int = 3) -> list[dict[str, Any]]:
+    def fetch_observations(self, series_id: str) -> ObservationBatch:
         """
         Fetch observations from StatsCan WDS API
         series_id is the vector ID (e.g., 'V12345' or 'v12345')
@@ -58,112 +62,101 @@ class StatsCanPlugin(DataSourcePlugin):
 
         # Request a large number of latest periods to cover historical data
         payload = [{"vectorId": int(vector_num), "latestN": 1000}]
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
 
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    time.sleep(5)
-
-                headers = {"Content-Type": "application/json", "Accept": "application/json"}
-
-                print(f"    → Requesting vector {vector_num} (latest 1000 periods)")
-                response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+        print(f"    → Requesting vector {vector_num} (latest 1000 periods)")
+        response = self._request("POST", endpoint, json=payload, headers=headers)
 
-                if response.status_code != 200:
-                    print(f"    → Response status: {response.status_code}")
-                    print(f"    → Response body: {response.text[:300]}")
+        if response.status_code != 200:
+            print(f"    → Response status: {response.status_code}")
+            print(f"    → Response body: {response.text[:300]}")
 
-                response.raise_for_status()
+        response.raise_for_status()
 
-                results = response.json()
-                if not results or results[0].get("status") != "SUCCESS":
-                    error_status = results[0].get("status") if results else "Empty"
-                    print(f"    ⚠️ StatsCan API returned non-success status: {error_status}")
-                    return []
+        results = response.json()
+        if not results or results[0].get("status") != "SUCCESS":
+            error_status = results[0].get("status") if results else "Empty"
+            print(f"    ⚠️ StatsCan API returned non-success status: {error_status}")
+            return ObservationBatch.empty(series_id)
 
-                vector_data = results[0].get("object", {}).get("vectorDataPoint", [])
+        vector_data = results[0].get("object", {}).get("vectorDataPoint", [])
 
-                valid_obs = []
-                for pt in vector_data:
-                    ref_period = pt.get("refPer")  # format varies: YYYY-MM-DD or YYYY-MM
-                    value = pt.get("value")
+        # refPer format varies (YYYY-MM-DD or YYYY-MM); monthly periods parse
+        # to the first of the month. The batch is returned sorted by date.
+        return ObservationBatch.from_strings(
+            series_id,
+            [pt.get("refPer") for pt in vector_data],
+            [pt.get("value") for pt in vector_data],
+        )
 
-                    if ref_period and value is not None:
-                        # Normalize date
-                        date_str = ref_period
-                        if len(date_str) == 7:  # YYYY-MM
-                            date_str += "-01"
+    def fetch_metadata(self, series_id: str) -> dict[str, Any]:
+        """Fetch series metadata from StatsCan WDS API"""
+        return self.fetch_metadata_many([series_id]).get(series_id, {})
 
-                        valid_obs.append({"date": date_str, "value": str(value)})
+    def fetch_metadata_many(self, series_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch metadata for many vectors with multi-vector getSeriesInfoFromVector calls"""
+        endpoint = f"{self.BASE_URL}/getSeriesInfoFromVector"
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
 
-                # Sort by date
-                valid_obs.sort(key=lambda x: x["date"])
+        # Vector IDs are numeric, strip 'V' or 'v'
+        by_vector = {int(series_id.lstrip("Vv")): series_id for series_id in series_ids}
+        vectors = list(by_vector)
 
-                return valid_obs
+        metadata = {}
+        for start in range(0, len(vectors), self.MAX_VECTORS_PER_REQUEST):
+            chunk = vectors[start : start + self.MAX_VECTORS_PER_REQUEST]
+            payload = [{"vectorId": vector} for vector in chunk]
 
+            try:
+                response = self._request("POST", endpoint, json=payload, headers=headers)
+                response.raise_for_status()
+                results = response.json()
             except Exception as e:
-                print(f"    ⚠️ StatsCan Fetch Attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    continue
-                else:
-                    raise
-
-        return []
+                print(f"Warning: Could not fetch metadata for StatsCan vectors {chunk}: {e}")
+                continue
 
-    def fetch_metadata(self, series_id: str) -> dict[str, Any]:
-        """Fetch series metadata from StatsCan WDS API"""
-        # Vector IDs are numeric, strip 'V' or 'v'
-        vector_num = int(series_id.lstrip("Vv"))
-
-        endpoint = f"{self.BASE_URL}/getSeriesInfoFromVector"
-        payload = [{"vectorId": vector_num}]
-
-        try:
-            time.sleep(0.5)  # Rate limiting
-            headers = {"Content-Type": "application/json", "Accept": "application/json"}
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            results = response.json()
-            if not results or results[0].get("status") != "SUCCESS":
-                return {}
-
-            data = results[0].get("object", {})
-
-            # Get UOM info
-            uom_code = data.get("memberUomCode")
-            uom_info = self.UOM_CODES.get(uom_code, ("", "", "OTHER"))
-
-            # Get frequency
-            freq_code = data.get("frequencyCode")
-            frequency = self.FREQUENCY_MAP.get(freq_code, "Unknown")
-
-            # Get table/product ID for source_table_id
-            product_id = str(data.get("productId", ""))
-
-            # Series title (English)
-            series_title = data.get("SeriesTitleEn", "")
-
-            # Determine seasonal adjustment from title
-            seasonal_adj = "NA"
-            title_lower = series_title.lower()
-            if "seasonally adjusted" in title_lower:
-                seasonal_adj = "SA"
-            elif "not seasonally adjusted" in title_lower or "unadjusted" in title_lower:
-                seasonal_adj = "NSA"
-
-            return {
-                "units": uom_info[0],
-                "units_short": uom_info[1],
-                "unit_type": uom_info[2],
-                "display_units": uom_info[1],
-                "seasonal_adjustment": seasonal_adj,
-                "frequency": frequency,
-                "notes": series_title,  # Full series title as documentation
-                "source_table_id": product_id,
-                "last_updated": None,
-            }
-
-        except Exception as e:
-            print(f"Warning: Could not fetch metadata for StatsCan vector {vector_num}: {e}")
-            return {}
+            for result in results or []:
+                if result.get("status") != "SUCCESS":
+                    continue
+                data = result.get("object", {})
+                series_id = by_vector.get(data.get("vectorId"))
+                if series_id is not None:
+                    metadata[series_id] = self._parse_series_info(data)
+
+        return metadata
+
+    def _parse_series_info(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Map a getSeriesInfoFromVector object onto the metadata dict"""
+        # Get UOM info
+        uom_code = data.get("memberUomCode")
+        uom_info = self.UOM_CODES.get(uom_code, ("", "", "OTHER"))
+
+        # Get frequency
+        freq_code = data.get("frequencyCode")
+        frequency = self.FREQUENCY_MAP.get(freq_code, "Unknown")
+
+        # Get table/product ID for source_table_id
+        product_id = str(data.get("productId", ""))
+
+        # Series title (English)
+        series_title = data.get("SeriesTitleEn", "")
+
+        # Determine seasonal adjustment from title
+        seasonal_adj = "NA"
+        title_lower = series_title.lower()
+        if "seasonally adjusted" in title_lower:
+            seasonal_adj = "SA"
+        elif "not seasonally adjusted" in title_lower or "unadjusted" in title_lower:
+            seasonal_adj = "NSA"
+
+        return {
+            "units": uom_info[0],
+            "units_short": uom_info[1],
+            "unit_type": uom_info[2],
+            "display_units": uom_info[1],
+            "seasonal_adjustment": seasonal_adj,
+            "frequency": frequency,
+            "notes": series_title,  # Full series title as documentation
+            "source_table_id": product_id,
+            "last_updated": data.get("releaseTime"),
+        }
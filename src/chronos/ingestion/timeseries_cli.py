@@ -7,23 +7,41 @@ Plugin-based architecture for extensibility
 Supported sources:
 - FRED (Federal Reserve)
 - Valet (Bank of Canada)
-- Future: BOE, ECB, BOJ, etc.
+- StatsCan (Statistics Canada)
+- BOE (Bank of England)
+- Third-party sources (ECB, BOJ, ...) via the chronos.ingestion.plugins entry point group
 """
 import argparse
 import csv
+import multiprocessing
 import os
 import sys
 import time
-from datetime import UTC, datetime
+import zlib
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import psycopg2
 from dotenv import load_dotenv
 
-# Import plugins
-from chronos.ingestion.fred import FREDPlugin
-from chronos.ingestion.statscan import StatsCanPlugin
-from chronos.ingestion.valet import ValetPlugin
+from chronos.ingestion.analytics_refresh import refresh_for_series
+from chronos.ingestion.batch import ObservationBatch
+from chronos.ingestion.checkpoint import RunCheckpoint
+from chronos.ingestion.compression import prepare_staged_merge
+from chronos.ingestion.http_cache import MODES as HTTP_CACHE_MODES
+from chronos.ingestion.http_cache import HTTPCache
+from chronos.ingestion.metadata_cache import MetadataCache, catalog_digest, metadata_digest
+from chronos.ingestion.quality import (
+    CONTEXT_OBSERVATIONS,
+    FLAG_PRECEDENCE,
+    HISTORY_SQL,
+    REVISION_FLAG_SQL,
+    REVISION_THRESHOLD,
+    assess,
+)
+from chronos.ingestion.registry import PluginRegistry
 
 # Load environment
 # Load environment (look in project root)
@@ -40,16 +58,11 @@ DB_CONFIG = {
     "password": os.getenv("DATABASE_PASSWORD"),
 }
 
-# Initialize plugins
-PLUGINS = {
-    "FRED": FREDPlugin(os.getenv("FRED_API_KEY")),
-    "Valet": ValetPlugin(),
-    "StatsCan": StatsCanPlugin(),
-    # Add future plugins here:
-    # "BOE": BOEPlugin(os.getenv("BOE_API_KEY")),
-    # "ECB": ECBPlugin(),
-    # "BOJ": BOJPlugin(os.getenv("BOJ_API_KEY")),
-}
+# Default catalog (go up 4 levels: file -> ingestion -> chronos -> src -> project root)
+DEFAULT_CATALOG_PATH = root_dir / "database" / "seeds" / "time-series_catalog.csv"
+
+# Plugins are imported and instantiated on first use (see chronos.ingestion.registry)
+PLUGINS = PluginRegistry()
 
 
 def get_db_connection():
@@ -103,18 +116,55 @@ def ensure_data_source(conn, plugin):
     return source_id
 
 
-def insert_series_metadata(conn, source_id: int, series_id: str, series_data: dict, plugin=None):
-    """Insert or update series metadata with enhanced metadata from API"""
-    cursor = conn.cursor()
+# Processes caching series (the chronos-api series store) LISTEN on this
+# channel; the payload is the internal series_id of a series whose metadata or
+# observations were written. Delivered on commit.
+SERIES_CHANGED_CHANNEL = "chronos_series_changed"
+NOTIFY_CHANGED_SQL = "SELECT pg_notify(%s, %s)"
+
+
+def insert_series_metadata(
+    conn,
+    source_id: int,
+    series_id: str,
+    series_data: dict,
+    plugin=None,
+    metadata_cache: MetadataCache | None = None,
+) -> bool:
+    """Insert or update series metadata with enhanced metadata from API
+
+    Returns True if series_metadata was written, False if the metadata cache
+    allowed the API call and/or the UPSERT to be skipped.
+    """
+    catalog_hash = catalog_digest(series_data)
+    if metadata_cache and metadata_cache.is_fresh(source_id, series_id, catalog_hash):
+        metadata_cache.api_calls_skipped += 1
+        metadata_cache.upserts_skipped += 1
+        return False
 
     # Fetch additional metadata from API if plugin supports it
     api_metadata = {}
-    if plugin and hasattr(plugin, "fetch_metadata"):
+    supports_metadata = plugin is not None and hasattr(plugin, "fetch_metadata")
+    if supports_metadata:
         try:
             api_metadata = plugin.fetch_metadata(series_id)
         except Exception as e:
             print(f"    ⚠️  Could not fetch metadata from API: {e}")
 
+    # Only cache payloads we actually received, so failed lookups are retried
+    cacheable = metadata_cache is not None and (api_metadata or not supports_metadata)
+    digest = metadata_digest(series_data, api_metadata)
+
+    if cacheable and metadata_cache.is_unchanged(source_id, series_id, digest):
+        metadata_cache.record(
+            conn, source_id, series_id, digest, catalog_hash, api_metadata.get("last_updated")
+        )
+        conn.commit()
+        metadata_cache.upserts_skipped += 1
+        return False
+
+    cursor = conn.cursor()
+
     query = """
     INSERT INTO metadata.series_metadata (
         source_id, source_series_id, series_name,
@@ -129,7 +179,8 @@ def insert_series_metadata(conn, source_id: int, series_id: str, series_data: di
         display_units = EXCLUDED.display_units,
         seasonal_adjustment = EXCLUDED.seasonal_adjustment,
         series_description = EXCLUDED.series_description,
-        last_updated = NOW();
+        last_updated = NOW()
+    RETURNING series_id;
     """
 
     cursor.execute(
@@ -148,13 +199,82 @@ def insert_series_metadata(conn, source_id: int, series_id: str, series_data: di
             api_metadata.get("notes"),
         ),
     )
+    internal_series_id = cursor.fetchone()[0]
+    cursor.execute(NOTIFY_CHANGED_SQL, (SERIES_CHANGED_CHANNEL, str(internal_series_id)))
+    cursor.close()
+
+    if cacheable:
+        metadata_cache.record(
+            conn, source_id, series_id, digest, catalog_hash, api_metadata.get("last_updated")
+        )
 
     conn.commit()
+    return True
+
+
+# Batches are COPYed into a session-local staging table, then merged in one
+# statement. Only new or revised observations are written: the DO UPDATE is
+# guarded by IS DISTINCT FROM on value and quality_flag, so identical rows are
+# neither rewritten nor fire the updated_at trigger, while a re-assessed flag
+# is still stored. A 'revision' flag stays until the value changes again
+# rather than reverting to 'good' on the next identical fetch. RETURNING
+# (xmax = 0) distinguishes inserts from updates. Batches reaching
+# into compressed chunks drop unchanged rows first (see chronos.ingestion.compression).
+CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS staging_observations (
+        observation_date DATE NOT NULL,
+        value DOUBLE PRECISION NOT NULL,
+        quality_flag TEXT
+    ) ON COMMIT DELETE ROWS
+"""
+
+COPY_STAGING_SQL = """
+    COPY staging_observations (observation_date, value, quality_flag)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+MERGE_STAGING_SQL = """
+    WITH written AS (
+        INSERT INTO timeseries.economic_observations AS eo
+        (series_id, observation_date, value, quality_flag)
+        SELECT %s, observation_date, value, quality_flag
+        FROM staging_observations
+        ON CONFLICT (series_id, observation_date)
+        DO UPDATE SET value = EXCLUDED.value, quality_flag = EXCLUDED.quality_flag
+        WHERE (eo.value, eo.quality_flag) IS DISTINCT FROM (EXCLUDED.value, EXCLUDED.quality_flag)
+        AND NOT (
+            eo.value = EXCLUDED.value
+            AND eo.quality_flag = 'revision' AND EXCLUDED.quality_flag = 'good'
+        )
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT
+        COUNT(*) FILTER (WHERE inserted),
+        COUNT(*) FILTER (WHERE NOT inserted)
+    FROM written
+"""
+
+
+def stored_history(conn, source_id: int, series_id: str, before, limit: int) -> ObservationBatch:
+    """Up to `limit` stored observations of a series before `before`"""
+    cursor = conn.cursor()
+    cursor.execute(HISTORY_SQL, (source_id, series_id, before, limit))
+    rows = cursor.fetchall()
     cursor.close()
+    return ObservationBatch.from_strings(
+        series_id, [row[0] for row in rows], [row[1] for row in rows]
+    )
+
 
+def insert_observations(
+    conn, series_id: str, observations: ObservationBatch, source_id: int
+) -> dict:
+    """COPY a batch into staging and merge new and revised observations
 
-def insert_observations(conn, series_id: str, observations: list, source_id: int):
-    """Insert observations with batch processing"""
+    Returns:
+        Dict with 'inserted', 'revised', 'unchanged', 'skipped',
+        'compressed_chunks' (written into) and 'revision_flags' counts
+    """
     cursor = conn.cursor()
 
     # Get internal series_id
@@ -173,53 +293,447 @@ def insert_observations(conn, series_id: str, observations: list, source_id: int
 
     internal_series_id = result[0]
 
-    inserted = 0
-    skipped = 0
-    batch = []
+    cursor.execute(CREATE_STAGING_SQL)
+    cursor.copy_expert(COPY_STAGING_SQL, observations.to_copy_buffer())
+    cursor.execute(REVISION_FLAG_SQL, (internal_series_id, REVISION_THRESHOLD))
+    revision_flags = cursor.rowcount
+    compressed_chunks = 0
+    if len(observations):
+        compressed_chunks = prepare_staged_merge(
+            cursor,
+            internal_series_id,
+            observations.start.item(),
+            observations.end.item(),
+        )
+    cursor.execute(MERGE_STAGING_SQL, (internal_series_id,))
+    inserted, revised = cursor.fetchone()
+    if inserted or revised:
+        cursor.execute(NOTIFY_CHANGED_SQL, (SERIES_CHANGED_CHANNEL, str(internal_series_id)))
+
+    # Commit also empties the staging table (ON COMMIT DELETE ROWS)
+    conn.commit()
+    cursor.close()
+
+    return {
+        "inserted": inserted,
+        "revised": revised,
+        "unchanged": len(observations) - inserted - revised,
+        "skipped": observations.skipped,
+        "compressed_chunks": compressed_chunks,
+        "revision_flags": revision_flags,
+    }
+
+
+def filter_fred_updates(conn, series_list: list[dict], source_id: int, since: datetime):
+    """Drop FRED series that have not been updated since `since`
+
+    Series not yet in series_metadata are always kept so new catalog entries
+    get their initial load. Returns the list unchanged if FRED cannot report
+    that far back.
+    """
+    updated = PLUGINS["FRED"].fetch_updated_series(since)
+    if updated is None:
+        print(f"⚠️  FRED update feed does not reach back to {since:%Y-%m-%d %H:%M}; fetching all")
+        return series_list
+
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT source_series_id FROM metadata.series_metadata WHERE source_id = %s",
+        (source_id,),
+    )
+    loaded = {row[0] for row in cursor.fetchall()}
+    cursor.close()
+
+    kept = [
+        s
+        for s in series_list
+        if s["source"] != "FRED" or s["series_id"] in updated or s["series_id"] not in loaded
+    ]
+    print(
+        f"🔎 FRED reports {len(updated):,} series updated since {since:%Y-%m-%d %H:%M}; "
+        f"skipping {len(series_list) - len(kept)} unchanged\n"
+    )
+    return kept
+
+
+def new_summary() -> dict:
+    """Empty run summary; per-shard summaries are merged key by key"""
+    return {
+        "total": 0,
+        "successful": 0,
+        "failed": [],
+        "written": 0,
+        "revised": 0,
+        "unchanged": 0,
+        "metadata_api_skipped": 0,
+        "metadata_upserts_skipped": 0,
+        "http_hits": 0,
+        "http_revalidated": 0,
+        "http_misses": 0,
+        "fetch_seconds": 0.0,
+        "parse_seconds": 0.0,
+        "write_seconds": 0.0,
+        # Source series IDs that gained new or revised observations
+        "changed_series": [],
+        # Observations hit by each quality check (see chronos.ingestion.quality)
+        "quality": Counter(),
+    }
+
+
+def format_quality(quality: Counter) -> str:
+    """'3 spike, 12 stale' in FLAG_PRECEDENCE order"""
+    return ", ".join(f"{quality[name]} {name}" for name in FLAG_PRECEDENCE if quality[name])
+
+
+def merge_summaries(summaries) -> dict:
+    """Combine per-shard summaries into one end-of-run summary"""
+    merged = new_summary()
+    for summary in summaries:
+        for key, value in summary.items():
+            merged[key] += value
+    return merged
+
+
+def shard_series(series_list: list[dict], workers: int) -> list[list[dict]]:
+    """Split series across workers, dealing each source's series round-robin
+
+    Every shard that hits a source gets an equal share of its rate limit, so
+    each source is spread as evenly as possible: shard sizes per source differ
+    by at most one. Within a source, series are dealt in order of a stable
+    hash of source and series ID, so the same list always shards the same
+    way. Each shard keeps catalog order. Empty shards are dropped.
+    """
+    by_source = defaultdict(list)
+    for position, series in enumerate(series_list):
+        by_source[series["source"]].append((position, series))
+
+    shards = [[] for _ in range(workers)]
+    dealt = 0
+    for source_series in by_source.values():
+        source_series.sort(
+            key=lambda item: zlib.crc32(f"{item[1]['source']}:{item[1]['series_id']}".encode())
+        )
+        for item in source_series:
+            # Carry on from the previous source so small sources don't pile onto shard 1
+            shards[dealt % workers].append(item)
+            dealt += 1
+    return [
+        [series for _, series in sorted(shard, key=lambda item: item[0])]
+        for shard in shards
+        if shard
+    ]
+
+
+class ObservationPrefetcher:
+    """Fetches observations in multi-series requests for plugins that support it
+
+    Series are handed out in catalog order. On the first request for a
+    series, the plugin fetches it together with the next series of the same
+    source, up to MAX_SERIES_PER_REQUEST, and the rest are held until asked
+    for.
+
+    One unknown or retired ID fails a whole multi-series request. When a
+    chunk fails, the requested series is fetched on its own, the rest of the
+    chunk goes back to the queue and the source's next chunk is half the
+    size. Chunks start at the requested series, so the bad ID is soon the
+    one requested: its single fetch fails (only that series fails) and chunks
+    return to full size. A chunk that succeeds also restores the full size.
+
+    With a start_date, plugins that support it only return observations from
+    that date onward.
+    """
+
+    def __init__(self, series_list: list[dict], start_date: str | None = None):
+        self.start_date = start_date
+        self.pending = defaultdict(list)
+        for series in series_list:
+            self.pending[series["source"]].append(series["series_id"])
+        self.batches: dict[tuple[str, str], ObservationBatch] = {}
+        # Reduced chunk size per source after a failed multi-series request
+        self.chunk_sizes: dict[str, int] = {}
+
+    def _fetch_kwargs(self, plugin) -> dict:
+        if self.start_date and plugin.SUPPORTS_START_DATE:
+            return {"start_date": self.start_date}
+        return {}
+
+    def get(self, source: str, series_id: str) -> ObservationBatch | None:
+        """Return the prefetched batch for a series, or None to fetch it alone"""
+        key = (source, series_id)
+        if key in self.batches:
+            return self.batches.pop(key)
+
+        queue = self.pending[source]
+        if source not in PLUGINS or series_id not in queue:
+            return None
+
+        plugin = PLUGINS[source]
+        # A reduced size applies to one chunk; success keeps the full size
+        chunk_size = self.chunk_sizes.pop(source, plugin.MAX_SERIES_PER_REQUEST)
+        if chunk_size <= 1:
+            queue.remove(series_id)
+            return None
+
+        start = queue.index(series_id)
+        chunk = queue[start : start + chunk_size]
+        del queue[start : start + len(chunk)]
 
-    for obs in observations:
         try:
-            batch.append((internal_series_id, obs["date"], float(obs["value"]), "good"))
-
-            if len(batch) >= 100:
-                cursor.executemany(
-                    """
-                    INSERT INTO timeseries.economic_observations
-                    (series_id, observation_date, value, quality_flag)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (series_id, observation_date)
-                    DO UPDATE SET value = EXCLUDED.value
-                """,
-                    batch,
-                )
-                inserted += len(batch)
-                batch = []
+            fetched = plugin.fetch_observations_many(chunk, **self._fetch_kwargs(plugin))
+        except Exception as e:
+            queue[start:start] = [chunk_id for chunk_id in chunk if chunk_id != series_id]
+            self.chunk_sizes[source] = len(chunk) // 2
+            print(
+                f"    ⚠️  Request for {len(chunk)} {source} series failed ({e}); "
+                f"fetching {series_id} alone"
+            )
+            return None
+
+        for chunk_id in chunk:
+            self.batches[(source, chunk_id)] = fetched.get(chunk_id) or ObservationBatch.empty(
+                chunk_id
+            )
+        return self.batches.pop(key)
 
+    def fetch(self, plugin, source: str, series_id: str) -> ObservationBatch:
+        """Prefetched batch if available, otherwise a single-series fetch"""
+        observations = self.get(source, series_id)
+        if observations is not None:
+            return observations
+        try:
+            return plugin.fetch_observations(series_id, **self._fetch_kwargs(plugin))
         except Exception:
-            skipped += 1
-            continue
+            # Failing on its own marks the bad ID: resume full-size chunks
+            self.chunk_sizes.pop(source, None)
+            raise
+
+
+def ingest_series(
+    conn,
+    series: dict,
+    source_id_map: dict,
+    metadata_cache: MetadataCache | None = None,
+    prefetcher: ObservationPrefetcher | None = None,
+) -> dict | None:
+    """Fetch one catalog series through its plugin and load it
+
+    Returns:
+        insert_observations() counts plus 'fetched', 'metadata_written',
+        'last_observation' and per-stage 'timings' in seconds, or None if the
+        source returned no data
+    """
+    series_id = series["series_id"]
+    source = series["source"]
+
+    if source not in PLUGINS:
+        raise ValueError(f"No plugin for source: {source}")
+
+    plugin = PLUGINS[source]
+    actual_source_id = source_id_map[source]
+
+    # Rate limiting and retries are handled by the plugin's HTTP session
+    started = time.perf_counter()
+    if prefetcher is not None:
+        observations = prefetcher.fetch(plugin, source, series_id)
+    else:
+        observations = plugin.fetch_observations(series_id)
+    fetched = time.perf_counter()
+    if not observations:
+        return None
+
+    # Short (incremental) batches are checked behind the latest stored values
+    history = None
+    if len(observations) < CONTEXT_OBSERVATIONS:
+        history = stored_history(
+            conn,
+            actual_source_id,
+            series_id,
+            observations.start.item(),
+            CONTEXT_OBSERVATIONS - len(observations),
+        )
+    quality = assess(observations, series.get("frequency"), history)
+    assessed = time.perf_counter()
+
+    # Insert metadata with API metadata enrichment
+    metadata_written = insert_series_metadata(
+        conn, actual_source_id, series_id, series, plugin, metadata_cache
+    )
+
+    counts = insert_observations(conn, series_id, observations, actual_source_id)
+    if counts["revision_flags"]:
+        quality["revision"] = counts["revision_flags"]
+    counts["quality"] = quality
+    counts["fetched"] = len(observations)
+    counts["metadata_written"] = metadata_written
+    counts["last_observation"] = observations.end.item()
+    # Parsing happens inside the plugin call; a multi-series request is
+    # charged to the series that triggered it. Quality checks count as parsing.
+    counts["timings"] = {
+        "fetch": fetched - started - observations.parse_seconds,
+        "parse": observations.parse_seconds + assessed - fetched,
+        "write": time.perf_counter() - assessed,
+    }
+    return counts
+
+
+def run_ingestion(
+    conn, series_list, source_id_map, args, label: str = "", run_id: str | None = None
+) -> dict:
+    """Fetch and load each series on one connection and return a run summary
+
+    With a run_id, a checkpoint row is written to ingestion_log per series.
+    """
+    checkpoint = RunCheckpoint(run_id, enabled=run_id is not None)
+    http_cache = None
+    if args.http_cache:
+        http_cache = HTTPCache(
+            args.http_cache, mode=args.http_cache_mode, max_age=args.http_cache_max_age
+        )
+        PLUGINS.set_attribute("http_cache", http_cache)
+
+    metadata_cache = MetadataCache.load(
+        conn,
+        ttl=timedelta(hours=args.metadata_ttl_hours),
+        force_refresh=args.refresh_metadata,
+    )
+
+    start_date = None
+    if args.incremental:
+        since = datetime.now(UTC).date() - timedelta(days=args.incremental)
+        start_date = since.isoformat()
+    prefetcher = ObservationPrefetcher(series_list, start_date)
+
+    summary = new_summary()
+    summary["total"] = len(series_list)
+    prefix = f"{label} " if label else ""
+
+    for i, series in enumerate(series_list, 1):
+        series_id = series["series_id"]
+        source = series["source"]
+        name = series["series_name"]
+
+        print(f"{prefix}[{i}/{len(series_list)}] {series_id} ({source})")
+        print(f"    Name: {name}")
+        started = datetime.now(UTC)
 
-    # Insert remaining
-    if batch:
         try:
-            cursor.executemany(
-                """
-                INSERT INTO timeseries.economic_observations
-                (series_id, observation_date, value, quality_flag)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (series_id, observation_date)
-                DO UPDATE SET value = EXCLUDED.value
-            """,
-                batch,
+            counts = ingest_series(conn, series, source_id_map, metadata_cache, prefetcher)
+
+            if counts is None and start_date:
+                print(f"    ✅ No observations since {start_date}")
+                checkpoint.record(conn, source_id_map[source], series_id, started)
+                summary["successful"] += 1
+                continue
+
+            if counts is None:
+                print("    ⚠️  No data returned")
+                checkpoint.record(conn, source_id_map[source], series_id, started, error="No data")
+                summary["failed"].append((series_id, "No data"))
+                continue
+
+            print(f"    ✅ Fetched {counts['fetched']} observations")
+            if not counts["metadata_written"]:
+                print("    ✅ Metadata unchanged (cached)")
+            print(
+                f"    ✅ {counts['inserted']} new, {counts['revised']} revised, "
+                f"{counts['unchanged']} unchanged (skipped {counts['skipped']})"
             )
-            inserted += len(batch)
-        except Exception:
-            skipped += len(batch)
+            if counts["quality"]:
+                print(f"    🚩 Quality flags: {format_quality(counts['quality'])}")
+            if counts["compressed_chunks"]:
+                print(f"    🗜️  Revised {counts['compressed_chunks']} compressed chunk(s)")
+
+            summary["written"] += counts["inserted"] + counts["revised"]
+            if counts["inserted"] or counts["revised"]:
+                summary["changed_series"].append(series_id)
+            summary["revised"] += counts["revised"]
+            summary["unchanged"] += counts["unchanged"]
+            summary["quality"] += counts["quality"]
+            summary["successful"] += 1
+            for stage, seconds in counts["timings"].items():
+                summary[f"{stage}_seconds"] += seconds
+
+            checkpoint.record(conn, source_id_map[source], series_id, started, counts)
+
+        except ValueError as e:
+            print(f"    ❌ {str(e)}")
+            summary["failed"].append((series_id, str(e)))
+            conn.rollback()
+            checkpoint.record(conn, source_id_map.get(source), series_id, started, error=str(e))
+        except Exception as e:
+            print(f"    ❌ Error: {str(e)}")
+            summary["failed"].append((series_id, str(e)))
+            conn.rollback()
+            checkpoint.record(conn, source_id_map.get(source), series_id, started, error=str(e))
+
+        print()
+
+    PLUGINS.close()
+
+    summary["metadata_api_skipped"] = metadata_cache.api_calls_skipped
+    summary["metadata_upserts_skipped"] = metadata_cache.upserts_skipped
+    if http_cache:
+        summary["http_hits"] = http_cache.hits
+        summary["http_revalidated"] = http_cache.revalidated
+        summary["http_misses"] = http_cache.misses
+
+    return summary
 
-    conn.commit()
-    cursor.close()
 
-    return inserted, skipped
+def ingest_shard(series_list, source_id_map, args, rate_shares, label, run_id=None) -> dict:
+    """Process-pool entry point: ingest one shard on its own DB connection
+
+    Each source's request budget is split across the shards that hit it, so
+    N workers together stay within the single-process rate limit.
+    """
+    for source in {s["source"] for s in series_list}:
+        if source in PLUGINS:
+            plugin = PLUGINS[source]
+            plugin.REQUEST_INTERVAL = type(plugin).REQUEST_INTERVAL * rate_shares[source]
+
+    conn = get_db_connection()
+    try:
+        return run_ingestion(conn, series_list, source_id_map, args, label, run_id)
+    finally:
+        conn.close()
+
+
+def run_sharded(series_list, source_id_map, args, run_id: str | None = None) -> dict:
+    """Run shards of the series list in a process pool and merge their summaries"""
+    shards = shard_series(series_list, args.workers)
+    rate_shares = Counter(source for shard in shards for source in {s["source"] for s in shard})
+
+    print(f"🧵 Sharding {len(series_list)} series across {len(shards)} workers\n")
+
+    summaries = []
+    # spawn, not fork: the parent's plugin sessions and locks must not leak into workers
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = {
+            pool.submit(
+                ingest_shard,
+                shard,
+                source_id_map,
+                args,
+                dict(rate_shares),
+                f"[w{index}]",
+                run_id,
+            ): shard
+            for index, shard in enumerate(shards, 1)
+        }
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                # A crashed worker fails its whole shard without losing the others
+                summary = new_summary()
+                summary["total"] = len(shard)
+                summary["failed"] = [(s["series_id"], f"Worker failed: {e}") for s in shard]
+                summaries.append(summary)
+
+    return merge_summaries(summaries)
 
 
 def main():
@@ -236,6 +750,62 @@ def main():
     parser.add_argument(
         "--category", help="Filter by category (e.g., Growth, Employment, Inflation)"
     )
+    parser.add_argument(
+        "--refresh-metadata",
+        action="store_true",
+        help="Ignore the metadata cache and re-fetch series metadata from every source",
+    )
+    parser.add_argument(
+        "--metadata-ttl-hours",
+        type=float,
+        default=float(os.getenv("METADATA_CACHE_TTL_HOURS", "24")),
+        help="Skip metadata API calls for series checked within this many hours (default: 24)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        default=os.getenv("CHRONOS_HTTP_CACHE_DIR"),
+        help="Directory for the on-disk HTTP response cache (default: disabled)",
+    )
+    parser.add_argument(
+        "--http-cache-mode",
+        choices=HTTP_CACHE_MODES,
+        default=os.getenv("CHRONOS_HTTP_CACHE_MODE", "cache"),
+        help="cache: revalidate and reuse; record: refresh all entries; replay: offline only",
+    )
+    parser.add_argument(
+        "--http-cache-max-age",
+        type=float,
+        default=float(os.getenv("CHRONOS_HTTP_CACHE_MAX_AGE", "0")),
+        help="Serve cached responses younger than this many seconds without revalidating",
+    )
+    parser.add_argument(
+        "--fred-updated-within",
+        type=float,
+        metavar="HOURS",
+        help="Only fetch FRED series that FRED reports as updated in the last HOURS (max 336)",
+    )
+    parser.add_argument(
+        "--incremental",
+        type=int,
+        metavar="DAYS",
+        help="Only fetch the last DAYS days of observations from sources that support it",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume an interrupted run, skipping series it already completed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("INGEST_WORKERS", "1")),
+        help="Shard series across this many worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--no-refresh",
+        action="store_true",
+        help="Do not refresh materialized analytics views affected by this run",
+    )
     args = parser.parse_args()
 
     print("\n" + "=" * 60)
@@ -245,16 +815,7 @@ def main():
     start_time = datetime.now(UTC)
 
     # Locate catalog
-    if args.catalog:
-        catalog_path = Path(args.catalog)
-    else:
-        # Default catalog (go up 4 levels: file -> ingestion -> chronos -> src -> project root)
-        catalog_path = (
-            Path(__file__).parent.parent.parent.parent
-            / "database"
-            / "seeds"
-            / "time-series_catalog.csv"
-        )
+    catalog_path = Path(args.catalog) if args.catalog else DEFAULT_CATALOG_PATH
 
     if not catalog_path.exists():
         print(f"❌ Catalog not found: {catalog_path}")
@@ -286,65 +847,54 @@ def main():
     conn = get_db_connection()
     print("✅ Connected to database\n")
 
-    # Ensure all sources exist and store actual source_ids
+    # Ensure the requested sources exist and store actual source_ids
+    # (only these plugins are imported and initialized)
     source_id_map = {}
-    for source_name, plugin in PLUGINS.items():
-        actual_source_id = ensure_data_source(conn, plugin)
-        source_id_map[source_name] = actual_source_id
-
-    # Process each series
-    total_observations = 0
-    successful = 0
-    failed = []
-
-    for i, series in enumerate(series_list, 1):
-        series_id = series["series_id"]
-        source = series["source"]
-        name = series["series_name"]
-
-        print(f"[{i}/{len(series_list)}] {series_id} ({source})")
-        print(f"    Name: {name}")
-
-        try:
-            # Get plugin for this source
-            if source not in PLUGINS:
-                raise ValueError(f"No plugin for source: {source}")
-
-            plugin = PLUGINS[source]
-            actual_source_id = source_id_map[source]
-
-            # Fetch observations
-            observations = plugin.fetch_observations(series_id)
-            time.sleep(1)  # Rate limiting between series
-
-            if not observations:
-                print("    ⚠️  No data returned")
-                failed.append((series_id, "No data"))
-                continue
-
-            print(f"    ✅ Fetched {len(observations)} observations")
-
-            # Insert metadata with API metadata enrichment
-            insert_series_metadata(conn, actual_source_id, series_id, series, plugin)
-
-            # Insert observations
-            inserted, skipped = insert_observations(conn, series_id, observations, actual_source_id)
-
-            print(f"    ✅ Inserted {inserted} observations (skipped {skipped})")
-
-            total_observations += inserted
-            successful += 1
-
-        except ValueError as e:
-            print(f"    ❌ {str(e)}")
-            failed.append((series_id, str(e)))
-        except Exception as e:
-            print(f"    ❌ Error: {str(e)}")
-            failed.append((series_id, str(e)))
-            conn.rollback()
-
-        print()
+    for source_name in sorted({s["source"] for s in series_list}):
+        if source_name in PLUGINS:
+            source_id_map[source_name] = ensure_data_source(conn, PLUGINS[source_name])
+
+    if args.fred_updated_within and "FRED" in source_id_map:
+        since = datetime.now(UTC) - timedelta(hours=args.fred_updated_within)
+        series_list = filter_fred_updates(conn, series_list, source_id_map["FRED"], since)
+        if not series_list:
+            print("✅ Nothing to update")
+            conn.close()
+            sys.exit(0)
+
+    try:
+        checkpoint = RunCheckpoint.start(conn, len(series_list), args.resume)
+    except ValueError as e:
+        conn.close()
+        parser.error(str(e))
+    if checkpoint.enabled:
+        print(f"🧾 Run ID: {checkpoint.run_id} (resume with --resume {checkpoint.run_id})\n")
+    if checkpoint.completed:
+        remaining = [
+            s
+            for s in series_list
+            if not checkpoint.is_complete(source_id_map.get(s["source"]), s["series_id"])
+        ]
+        print(f"⏭️  Skipping {len(series_list) - len(remaining)} series completed in this run\n")
+        series_list = remaining
+        if not series_list:
+            checkpoint.finish(conn, new_summary())
+            conn.close()
+            print("✅ Nothing left to resume")
+            sys.exit(0)
+    run_id = checkpoint.run_id if checkpoint.enabled else None
+
+    if args.http_cache:
+        print(f"🗄️  HTTP cache: {args.http_cache} (mode: {args.http_cache_mode})\n")
+
+    if args.workers > 1:
+        summary = run_sharded(series_list, source_id_map, args, run_id)
+    else:
+        summary = run_ingestion(conn, series_list, source_id_map, args, run_id=run_id)
 
+    checkpoint.finish(conn, summary)
+    if not args.no_refresh:
+        refresh_for_series(conn, summary["changed_series"])
     conn.close()
 
     # Summary
@@ -354,16 +904,32 @@ def main():
     print("✅ INGESTION COMPLETE!")
     print("=" * 60)
     print("\n📊 Summary:")
-    print(f"  Total series processed: {len(series_list)}")
-    print(f"  Successful: {successful}")
-    print(f"  Failed: {len(failed)}")
-    print(f"  Total observations loaded: {total_observations:,}")
+    print(f"  Total series processed: {summary['total']}")
+    print(f"  Successful: {summary['successful']}")
+    print(f"  Failed: {len(summary['failed'])}")
+    print(f"  Total observations written: {summary['written']:,}")
+    print(f"    of which revised: {summary['revised']:,}")
+    print(f"  Unchanged observations skipped: {summary['unchanged']:,}")
+    print(f"  Quality flags: {format_quality(summary['quality']) or 'none'}")
+    print(f"  Metadata API calls skipped: {summary['metadata_api_skipped']}")
+    print(f"  Metadata upserts skipped: {summary['metadata_upserts_skipped']}")
+    if args.http_cache:
+        print(
+            f"  HTTP cache: {summary['http_hits']} hits, "
+            f"{summary['http_revalidated']} revalidated, {summary['http_misses']} fetched"
+        )
+    print(
+        f"  Stage time: fetch {summary['fetch_seconds']:.1f}s, "
+        f"parse {summary['parse_seconds']:.1f}s, write {summary['write_seconds']:.1f}s"
+    )
+    if args.workers > 1:
+        print(f"  Workers: {args.workers}")
     print(f"  Duration: {duration}")
-    print(f"  Success rate: {successful/len(series_list)*100:.1f}%")
+    print(f"  Success rate: {summary['successful']/summary['total']*100:.1f}%")
 
-    if failed:
+    if summary["failed"]:
         print("\n⚠️  Failed series:")
-        for series_id, error in failed:
+        for series_id, error in summary["failed"]:
             error_short = error[:80] + "..." if len(error) > 80 else error
             print(f"    - {series_id}: {error_short}")
 
@@ -2,12 +2,10 @@
 Bank of Canada Valet API plugin
 """
 
-import time
-from typing import Any
-
 import requests
 
 from .base import DataSourcePlugin
+from .batch import ObservationBatch
 
 
 class ValetPlugin(DataSourcePlugin):
@@ -15,55 +13,80 @@ class ValetPlugin(DataSourcePlugin):
 
     BASE_URL = "https://www.bankofcanada.ca/valet/observations"
 
+    # Valet publishes no hard limit; stay polite
+    REQUEST_INTERVAL = 0.2
+
+    # Valet accepts comma-separated series lists in the observations path. A
+    # retired series 404s the whole list; ObservationPrefetcher narrows failed
+    # chunks down so that only the retired series fails
+    MAX_SERIES_PER_REQUEST = 30
+    SUPPORTS_START_DATE = True
+
     def get_source_id(self) -> int:
         return 2
 
     def get_source_name(self) -> str:
         return "Bank of Canada Valet API"
 
-    def fetch_observations(self, series_id: str, max_retries: int = 3) -> list[dict[str, Any]]:
+    def fetch_observations(self, series_id: str, start_date: str | None = None) -> ObservationBatch:
         """Fetch observations from Valet API"""
-        url = f"{self.BASE_URL}/{series_id}/json"
-
-        for attempt in range(max_retries):
-            try:
-                # Gentle rate limiting: 1 second between requests
-                if attempt > 0:
-                    time.sleep(3)  # Only sleep on retries
-
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                data = response.json()
-                observations = data.get("observations", [])
-
-                # Convert Valet format to standard format
-                valid_obs = []
-                for obs in observations:
-                    # Valet uses dynamic keys: obs[series_id]['v'] for value
-                    if series_id in obs and obs[series_id] is not None:
-                        series_data = obs[series_id]
-                        if isinstance(series_data, dict) and "v" in series_data:
-                            value = series_data["v"]
-                            if value is not None:
-                                valid_obs.append({"date": obs.get("d"), "value": str(value)})
-
-                return valid_obs
-
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    raise ValueError(f"Series {series_id} not found in Valet") from e
-                elif e.response.status_code == 429:
-                    # Rate limited - wait longer
-                    time.sleep(10 * (attempt + 1))
-                    continue
-                else:
-                    raise
-            except requests.exceptions.RequestException:
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                    continue
-                else:
-                    raise
-
-        return []
+        return self.fetch_observations_many([series_id], start_date)[series_id]
+
+    def fetch_observations_many(
+        self, series_ids: list[str], start_date: str | None = None, recent: int | None = None
+    ) -> dict[str, ObservationBatch]:
+        """Fetch several series in one request and split the response per series
+
+        Args:
+            series_ids: Valet series names
+            start_date: Only return observations on or after this date (YYYY-MM-DD)
+            recent: Only return the latest N observations of each series
+        """
+        requested = ",".join(series_ids)
+        data = self._get(f"{self.BASE_URL}/{requested}/json", requested, start_date, recent)
+        return self._split(data, series_ids)
+
+    def fetch_group(
+        self, group: str, start_date: str | None = None, recent: int | None = None
+    ) -> dict[str, ObservationBatch]:
+        """Fetch every series in a Valet group (e.g. FX_RATES_DAILY) in one request"""
+        data = self._get(f"{self.BASE_URL}/group/{group}/json", group, start_date, recent)
+        return self._split(data, list(data.get("seriesDetail", {})))
+
+    def _get(self, url: str, label: str, start_date: str | None, recent: int | None) -> dict:
+        params = {}
+        if start_date:
+            params["start_date"] = start_date
+        if recent:
+            params["recent"] = recent
+
+        response = self._request("GET", url, params=params)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404:
+                raise ValueError(f"Series {label} not found in Valet") from e
+            raise
+
+        return response.json()
+
+    @staticmethod
+    def _split(data: dict, series_ids: list[str]) -> dict[str, ObservationBatch]:
+        """Split one observations payload into a batch per series
+
+        Each observation row only carries the series published on that date,
+        so a series' batch is built from the rows that name it. Only cells
+        that are present but unparsable count as skipped.
+        """
+        observations = data.get("observations", [])
+
+        batches = {}
+        for series_id in series_ids:
+            # Valet uses dynamic keys: obs[series_id]['v'] for value
+            cells = [(obs.get("d"), obs[series_id]) for obs in observations if series_id in obs]
+            batches[series_id] = ObservationBatch.from_strings(
+                series_id,
+                [date for date, _ in cells],
+                [(cell or {}).get("v") for _, cell in cells],
+            )
+        return batches
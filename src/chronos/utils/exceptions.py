@@ -43,3 +43,9 @@ class RateLimitError(APIError):
     """Raised when API rate limit is exceeded."""
 
     pass
+
+
+class HTTPCacheMissError(IngestionError):
+    """Raised when a replay-mode HTTP cache has no recorded response."""
+
+    pass
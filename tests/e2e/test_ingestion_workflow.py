@@ -3,6 +3,9 @@ Project Chronos: End-to-End Ingestion Workflow Tests
 ====================================================
 Purpose: Test complete data pipeline from API ingestion to analytics views
 Pattern: Integration tests that validate multi-layer functionality
+
+Views are read through their *_live definitions: the public names are
+materialized and only refreshed by the ingestion CLI, not by these tests.
 """
 
 from datetime import UTC, datetime, timedelta
@@ -87,7 +90,7 @@ class TestFREDCompleteWorkflow:
                     frequency,
                     geography,
                     latest_date
-                FROM analytics.macro_indicators_latest
+                FROM analytics.macro_indicators_latest_live
                 WHERE source_series_id = 'FEDFUNDS'
             """
                 )
@@ -133,7 +136,7 @@ class TestFREDCompleteWorkflow:
                     transformation_type,
                     rate_description,
                     usd_per_fx
-                FROM analytics.fx_rates_normalized
+                FROM analytics.fx_rates_normalized_live
                 WHERE source_series_id = 'DEXUSEU'
                 ORDER BY observation_date DESC
                 LIMIT 1
@@ -197,7 +200,7 @@ class TestValetCompleteWorkflow:
                     transformation_type,
                     usd_per_fx,
                     observation_date
-                FROM analytics.fx_rates_normalized
+                FROM analytics.fx_rates_normalized_live
                 WHERE source_series_id = 'FXUSDCAD'
                 ORDER BY observation_date DESC
                 LIMIT 1
@@ -229,7 +232,7 @@ class TestCrossSourceConsistency:
                         source_series_id,
                         usd_per_fx,
                         observation_date
-                    FROM analytics.fx_rates_normalized
+                    FROM analytics.fx_rates_normalized_live
                     WHERE source_series_id IN ('DEXCAUS', 'FXUSDCAD')
                     ORDER BY source_series_id, observation_date DESC
                 )
@@ -0,0 +1,20 @@
+"""
+Shared fixtures for integration tests
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from chronos.ingestion.http_cache import HTTPCache
+
+# Recorded upstream responses the plugin tests replay offline
+RECORDINGS_DIR = Path(__file__).parent.parent / "fixtures" / "http"
+
+
+@pytest.fixture
+def http_cache():
+    """Replay recorded responses; CHRONOS_HTTP_RECORD=1 re-records them from upstream"""
+    mode = "record" if os.getenv("CHRONOS_HTTP_RECORD") else "replay"
+    return HTTPCache(RECORDINGS_DIR, mode=mode)
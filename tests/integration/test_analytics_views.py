@@ -8,12 +8,12 @@ import pytest
 from sqlalchemy import text
 
 from chronos.database.connection import get_db_session
+from chronos.ingestion.analytics_refresh import refresh_for_series
 
 # NOTE: All tests in this module require a seeded database with data
 # We use the seed_test_database fixture to ensure data exists
 
 
-
 class TestFXRatesNormalized:
     """Test FX rate normalization logic."""
 
@@ -197,6 +197,25 @@ class TestDataQualityDashboard:
             assert len(invalid_pcts) == 0, f"Invalid null percentages: {invalid_pcts}"
 
 
+class TestMaterializedViews:
+    """Test that the public names serve refreshed rows, not initdb snapshots."""
+
+    @pytest.mark.parametrize("view_name", ["fx_rates_normalized", "macro_indicators_latest"])
+    def test_public_name_matches_live_view_after_refresh(self, seed_test_database, view_name):
+        with get_db_session() as session:
+            refreshed = refresh_for_series(session.connection().connection, ["DEXUSEU"])
+            assert view_name in refreshed, f"{view_name} is not registered for refresh"
+
+            materialized = session.execute(
+                text(f"SELECT COUNT(*) FROM analytics.{view_name}")
+            ).scalar()
+            live = session.execute(
+                text(f"SELECT COUNT(*) FROM analytics.{view_name}_live")
+            ).scalar()
+            assert materialized > 0
+            assert materialized == live
+
+
 class TestViewPerformance:
     """Test that views perform acceptably."""
 
@@ -150,9 +150,9 @@ class TestDatabaseSchema:
             result = session.execute(
                 text(
                     """
-                SELECT table_name
-                FROM information_schema.views
-                WHERE table_schema = 'analytics'
+                SELECT viewname FROM pg_views WHERE schemaname = 'analytics'
+                UNION ALL
+                SELECT matviewname FROM pg_matviews WHERE schemaname = 'analytics'
             """
                 )
             )
@@ -0,0 +1,97 @@
+"""
+Project Chronos: Embedding Hash Integration Tests
+=================================================
+Purpose: Validate that PostgreSQL computes the same description hash as Python, so
+incremental embedding only picks up new, changed or re-modelled descriptions
+"""
+
+import pytest
+from sqlalchemy import text
+
+from chronos.cli.generate_embeddings import PENDING_WHERE, SQL_DESCRIPTION_HASH, description_hash
+
+MODEL = "all-MiniLM-L6-v2"
+
+DESCRIPTIONS = [
+    "Real Gross Domestic Product",
+    "Indice des prix à la consommation (IPC) — 2002=100",
+    "Line one\nLine two\ttabbed",
+    "Quote ' and backslash \\ survive",
+    "",
+]
+
+
+class TestDescriptionHash:
+    """Test SQL_DESCRIPTION_HASH against description_hash()."""
+
+    @pytest.mark.parametrize("description", DESCRIPTIONS)
+    def test_sql_hash_matches_python(self, test_session, description):
+        sql_hash = test_session.execute(
+            text(
+                f"""
+                SELECT {SQL_DESCRIPTION_HASH}
+                FROM (SELECT CAST(:description AS text) AS series_description) d
+                """
+            ),
+            {"model": MODEL, "description": description},
+        ).scalar()
+
+        assert sql_hash == description_hash(MODEL, description)
+
+
+class TestIncrementalSelection:
+    """Test which rows PENDING_WHERE['incremental'] re-embeds."""
+
+    def test_new_changed_and_remodelled_rows_are_pending(self, test_session):
+        test_session.execute(
+            text(
+                """
+                CREATE TEMP TABLE series_metadata (
+                    series_id integer,
+                    series_description text,
+                    description_embedding vector(2),
+                    description_embedding_hash text
+                ) ON COMMIT DROP
+                """
+            )
+        )
+        rows = [
+            # Embedded with the current model: up to date
+            (1, "Real GDP", "[1,0]", description_hash(MODEL, "Real GDP")),
+            # Embedded with another model
+            (2, "Real GDP", "[1,0]", description_hash("paraphrase-MiniLM-L3-v2", "Real GDP")),
+            # Description edited since it was embedded
+            (3, "CPI, all items", "[1,0]", description_hash(MODEL, "CPI")),
+            # Never embedded
+            (4, "Housing starts", None, None),
+            # Nothing to embed
+            (5, None, None, None),
+        ]
+        for series_id, description, embedding, content_hash in rows:
+            test_session.execute(
+                text(
+                    """
+                    INSERT INTO pg_temp.series_metadata
+                    VALUES (:series_id, :description, CAST(:embedding AS vector), :content_hash)
+                    """
+                ),
+                {
+                    "series_id": series_id,
+                    "description": description,
+                    "embedding": embedding,
+                    "content_hash": content_hash,
+                },
+            )
+
+        pending = test_session.execute(
+            text(
+                f"""
+                SELECT series_id FROM pg_temp.series_metadata
+                {PENDING_WHERE["incremental"]}
+                ORDER BY series_id
+                """
+            ),
+            {"model": MODEL},
+        ).scalars()
+
+        assert list(pending) == [2, 3, 4]
@@ -1,181 +1,68 @@
 """
 Project Chronos: FRED Ingestion Integration Tests
 =================================================
-Purpose: Validate FRED API ingestion pipeline
+Purpose: Validate FRED plugin parsing against recorded API responses (replayed
+offline; set CHRONOS_HTTP_RECORD=1 and FRED_API_KEY to re-record) and FRED
+data stored in the database
 """
 
-from datetime import date, datetime
+import os
 
 import pytest
+from sqlalchemy import text
 
-# NOTE: Tests need refactoring for new Plugin interface - see CHRONOS-164
-# Imports commented out to prevent collection errors
-pytestmark = pytest.mark.skip(reason="Plugin interface changed - needs test refactoring")
-
-# from sqlalchemy import text
-# from chronos.database.connection import get_db_session
-# from chronos.ingestion.fred import FREDPlugin
+from chronos.database.connection import get_db_session
+from chronos.ingestion.fred import FREDPlugin
+from chronos.utils.exceptions import HTTPCacheMissError
 
 
 class TestFREDPlugin:
     """Test FRED data ingestion functionality."""
 
     @pytest.fixture
-    def ingestor(self):
-        """Provide FREDPlugin instance."""
-        with get_db_session() as session:
-            yield FREDPlugin(session)
-
-    def test_ingestor_initialization(self, ingestor):
-        """Ensure FREDPlugin initializes correctly."""
-        assert ingestor is not None
-        assert ingestor.source_id is not None
-        assert ingestor.source_id > 0
-
-    def test_fetch_series_metadata_single_series(self, ingestor):
-        """Test fetching metadata for a single known series."""
-        metadata = ingestor.fetch_series_metadata(["GDP"])
-
-        assert len(metadata) == 1
-        assert metadata[0]["source_series_id"] == "GDP"
-        assert "series_name" in metadata[0]
-        assert "frequency" in metadata[0]
-        assert metadata[0]["frequency"] in ["Q", "A", "M"]  # GDP is quarterly
-
-    def test_fetch_series_metadata_multiple_series(self, ingestor):
-        """Test fetching metadata for multiple series."""
-        series_ids = ["GDP", "UNRATE", "CPIAUCSL"]
-        metadata = ingestor.fetch_series_metadata(series_ids)
-
-        assert len(metadata) == 3
-        retrieved_ids = {m["source_series_id"] for m in metadata}
-        assert retrieved_ids == set(series_ids)
-
-    def test_fetch_series_metadata_invalid_series(self, ingestor):
-        """Test handling of invalid series ID."""
-        # FRED API should handle gracefully or raise exception
-        metadata = ingestor.fetch_series_metadata(["INVALID_SERIES_XYZ_123"])
-
-        # Should return empty list for invalid series
-        assert metadata == [] or len(metadata) == 0
-
-    def test_fetch_observations_with_data(self, ingestor):
-        """Test fetching observations for a series with known data."""
-        observations = ingestor.fetch_observations(
-            "FEDFUNDS", start_date=datetime(2020, 1, 1), end_date=datetime(2020, 12, 31)
-        )
-
-        assert len(observations) > 0
-        assert all("date" in obs for obs in observations)
-        assert all("value" in obs for obs in observations)
-
-        # Verify dates are in range
-        for obs in observations:
-            obs_date = (
-                obs["date"]
-                if isinstance(obs["date"], date)
-                else datetime.strptime(obs["date"], "%Y-%m-%d").date()
-            )
-            assert date(2020, 1, 1) <= obs_date <= date(2020, 12, 31)
-
-    def test_fetch_observations_date_ordering(self, ingestor):
+    def plugin(self, http_cache):
+        """FREDPlugin reading from the recorded responses."""
+        # api_key is not part of the cache key, so any key replays
+        plugin = FREDPlugin(os.getenv("FRED_API_KEY", "replay"))
+        plugin.http_cache = http_cache
+        yield plugin
+        plugin.close()
+
+    def test_fetch_metadata(self, plugin):
+        """Series metadata maps onto the series_metadata columns."""
+        metadata = plugin.fetch_metadata("GDP")
+
+        assert metadata["frequency"] == "Quarterly"
+        assert metadata["units"] == "Billions of Dollars"
+        assert metadata["display_units"] == "Bil. of $"
+        assert metadata["seasonal_adjustment"] == "SAAR"
+        assert metadata["notes"].startswith("BEA Account Code")
+
+    def test_fetch_observations_drops_missing_values(self, plugin):
+        """FRED's '.' placeholders (e.g. market holidays) are not observations."""
+        batch = plugin.fetch_observations("DGS10", start_date="2024-01-01")
+
+        assert batch.dates.astype(str).tolist() == [
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+            "2024-01-05",
+        ]
+        assert batch.values.tolist() == [3.95, 3.91, 3.99, 4.05]
+
+    def test_observations_are_chronological(self, plugin):
         """Ensure observations are returned in chronological order."""
-        observations = ingestor.fetch_observations(
-            "GDP", start_date=datetime(2020, 1, 1), end_date=datetime(2023, 12, 31)
-        )
-
-        dates = [obs["date"] for obs in observations]
-        assert dates == sorted(dates), "Observations should be chronologically ordered"
-
-    def test_register_series_creates_metadata(self, ingestor):
-        """Test that registering a series creates metadata entry."""
-        with get_db_session() as session:
-            ingestor_with_session = FREDPlugin(session)
-
-            # Fetch real metadata
-            metadata_list = ingestor_with_session.fetch_series_metadata(["DGS10"])
-            assert len(metadata_list) == 1
-
-            metadata = metadata_list[0]
-
-            # Register series (idempotent - should work multiple times)
-            series_id = ingestor_with_session.register_series(metadata)
-
-            assert series_id is not None
-
-            # Verify series exists in database
-            result = session.execute(
-                text(
-                    """
-                    SELECT series_id, source_series_id, series_name
-                    FROM metadata.series_metadata
-                    WHERE source_series_id = 'DGS10'
-                """
-                )
-            )
-            row = result.fetchone()
-
-            assert row is not None
-            assert row[1] == "DGS10"
-            assert "10" in row[2] or "Treasury" in row[2]
+        batch = plugin.fetch_observations("DGS10", start_date="2024-01-01")
 
-    def test_store_observations_inserts_data(self, ingestor):
-        """Test that storing observations inserts data correctly."""
-        with get_db_session() as session:
-            ingestor_with_session = FREDPlugin(session)
+        assert (batch.dates[1:] > batch.dates[:-1]).all()
 
-            # Get series ID for DGS10
-            result = session.execute(
-                text(
-                    """
-                    SELECT series_id FROM metadata.series_metadata
-                    WHERE source_series_id = 'DGS10'
-                    LIMIT 1
-                """
-                )
-            )
-            row = result.fetchone()
+    def test_unrecorded_request_never_reaches_the_network(self, plugin, http_cache):
+        """Replay mode fails instead of falling back to the live API."""
+        if http_cache.mode != "replay":
+            pytest.skip("Recording from upstream")
 
-            if not row:
-                pytest.skip("DGS10 not in database yet")
-
-            series_id = row[0]
-
-            # Count existing observations
-            result = session.execute(
-                text(
-                    """
-                    SELECT COUNT(*) FROM timeseries.economic_observations
-                    WHERE series_id = :series_id
-                """
-                ),
-                {"series_id": series_id},
-            )
-            count_before = result.scalar()
-
-            # Fetch new observations (should be idempotent if recent)
-            observations = ingestor_with_session.fetch_observations(
-                "DGS10", start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31)
-            )
-
-            if observations:
-                _ = ingestor_with_session.store_observations(series_id, observations)
-
-                session.commit()
-
-                # Verify increase (or same if data already existed)
-                result = session.execute(
-                    text(
-                        """
-                        SELECT COUNT(*) FROM timeseries.economic_observations
-                        WHERE series_id = :series_id
-                    """
-                    ),
-                    {"series_id": series_id},
-                )
-                count_after = result.scalar()
-
-                assert count_after >= count_before
+        with pytest.raises(HTTPCacheMissError):
+            plugin.fetch_observations("UNRECORDED")
 
 
 class TestFREDDataQuality:
@@ -254,19 +141,10 @@ class TestFREDDataQuality:
             assert len(invalid_values) == 0, f"Found invalid interest rate values: {invalid_values}"
 
 
-@pytest.mark.slow
 class TestFREDAPILimits:
-    """Test FRED API rate limiting and error handling."""
+    """Test FRED API rate limiting."""
 
     def test_rate_limiting_respected(self):
         """Ensure we don't exceed FRED API rate limits."""
-        # FRED allows 120 requests per minute
-        # Our ingestion should batch appropriately
-        # This is more of a documentation test
-        with get_db_session() as session:
-            _ = FREDPlugin(session)
-
-            # Verify rate limit is configured
-            from chronos.config.settings import settings
-
-            assert settings.fred_rate_limit <= 120
+        # FRED allows 120 requests per minute per API key
+        assert FREDPlugin.REQUEST_INTERVAL >= 60 / 120
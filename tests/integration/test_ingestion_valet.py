@@ -1,69 +1,39 @@
 """
 Project Chronos: Bank of Canada Valet Ingestion Tests
 =====================================================
+Purpose: Validate Valet plugin parsing against recorded API responses (replayed
+offline; set CHRONOS_HTTP_RECORD=1 to re-record)
 """
 
-from datetime import datetime
-
 import pytest
 
-# NOTE: Tests need refactoring for new Plugin interface - see CHRONOS-164
-# Imports commented out to prevent collection errors
-pytestmark = pytest.mark.skip(reason="Plugin interface changed - needs test refactoring")
-
-# from sqlalchemy import text
-# from chronos.database.connection import get_db_session
-# from chronos.ingestion.valet import ValetPlugin
+from chronos.ingestion.valet import ValetPlugin
 
 
 class TestValetPlugin:
     """Test Bank of Canada Valet data ingestion."""
 
     @pytest.fixture
-    def ingestor(self):
-        """Provide ValetPlugin instance."""
-        with get_db_session() as session:
-            yield ValetPlugin(session)
-
-    def test_ingestor_initialization(self, ingestor):
-        """Ensure ValetPlugin initializes correctly."""
-        assert ingestor is not None
-        assert ingestor.source_id is not None
-
-    def test_fetch_fx_series_metadata(self, ingestor):
-        """Test fetching FX series metadata."""
-        metadata = ingestor.fetch_series_metadata(["FXUSDCAD"])
-
-        assert len(metadata) == 1
-        assert metadata[0]["source_series_id"] == "FXUSDCAD"
-        assert "USD" in metadata[0]["series_name"] or "CAD" in metadata[0]["series_name"]
-
-    def test_fetch_observations_fxusdcad(self, ingestor):
-        """Test fetching USD/CAD observations."""
-        observations = ingestor.fetch_observations(
-            "FXUSDCAD", start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31)
-        )
-
-        assert len(observations) > 0
-
-        # Verify reasonable FX rate values (USD/CAD typically 1.2-1.4)
-        for obs in observations:
-            assert 0.5 < obs["value"] < 2.0, f"Unrealistic FX rate: {obs['value']}"
-
-    def test_valet_data_quality(self):
-        """Ensure Valet data meets quality standards."""
-        with get_db_session() as session:
-            result = session.execute(
-                text(
-                    """
-                    SELECT COUNT(*)
-                    FROM metadata.series_metadata sm
-                    JOIN metadata.data_sources ds ON sm.source_id = ds.source_id
-                    WHERE ds.source_name = 'VALET'
-
-                """
-                )
-            )
-            valet_series_count = result.scalar()
-
-            assert valet_series_count >= 1, "Expected at least 1 Valet series"
+    def plugin(self, http_cache):
+        """ValetPlugin reading from the recorded responses."""
+        plugin = ValetPlugin()
+        plugin.http_cache = http_cache
+        yield plugin
+        plugin.close()
+
+    def test_fetch_fx_series_in_one_request(self, plugin, http_cache):
+        """A comma-separated series list splits into one batch per series."""
+        batches = plugin.fetch_observations_many(["FXUSDCAD", "FXEURCAD"], start_date="2024-01-02")
+
+        assert http_cache.hits + http_cache.misses == 1
+        assert set(batches) == {"FXUSDCAD", "FXEURCAD"}
+        for batch in batches.values():
+            assert batch.dates.astype(str).tolist()[0] == "2024-01-02"
+            assert len(batch.dates) == len(batch.values) == 4
+
+    def test_fx_rates_are_realistic(self, plugin):
+        """Verify reasonable FX rate values (USD/CAD and EUR/CAD typically 1.2-1.6)."""
+        batches = plugin.fetch_observations_many(["FXUSDCAD", "FXEURCAD"], start_date="2024-01-02")
+
+        for batch in batches.values():
+            assert ((batch.values > 0.5) & (batch.values < 2.0)).all(), batch.values
@@ -0,0 +1,53 @@
+"""
+Project Chronos: Unit Tests for Materialized Analytics Refresh
+===============================================================
+Purpose: Verify that only affected materializations are refreshed, concurrently
+"""
+
+from psycopg2 import sql
+
+from chronos.ingestion.analytics_refresh import REFRESH_SQL, refresh_for_series, refresh_views
+
+
+class TestAnalyticsRefresh:
+    """Test dependency-driven refresh against a mocked connection."""
+
+    def test_no_changed_series_skips_database(self, mocker):
+        """A run that wrote nothing does not touch the database."""
+        conn = mocker.MagicMock()
+
+        assert refresh_for_series(conn, []) == {}
+        conn.cursor.assert_not_called()
+
+    def test_refreshes_affected_views(self, mocker):
+        """Each affected view is refreshed concurrently and committed on its own."""
+        conn = mocker.MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [("fx_rates_normalized",), ("fx_volatility",)]
+
+        refreshed = refresh_for_series(conn, ["FXUSDCAD"])
+
+        assert set(refreshed) == {"fx_rates_normalized", "fx_volatility"}
+        assert conn.commit.call_count == 2
+        assert cursor.execute.call_args_list[1].args[0] == REFRESH_SQL.format(
+            sql.Identifier("analytics"), sql.Identifier("fx_rates_normalized")
+        )
+
+    def test_failed_refresh_does_not_stop_others(self, mocker):
+        """A failing view is rolled back and the remaining views still refresh."""
+        conn = mocker.MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.execute.side_effect = [Exception("not populated"), None, None]
+
+        refreshed = refresh_views(conn, ["broken_view", "fx_volatility"])
+
+        assert list(refreshed) == ["fx_volatility"]
+        conn.rollback.assert_called_once()
+
+    def test_missing_tables_disable_refresh(self, mocker):
+        """Before the migration, refresh is skipped rather than failing ingestion."""
+        conn = mocker.MagicMock()
+        conn.cursor.return_value.execute.side_effect = Exception("relation does not exist")
+
+        assert refresh_for_series(conn, ["GDP"]) == {}
+        conn.rollback.assert_called_once()
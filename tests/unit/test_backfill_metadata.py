@@ -0,0 +1,102 @@
+"""
+Project Chronos: Unit Tests for Metadata Backfill
+=================================================
+Purpose: Verify the bulk UPDATE casts enum columns and announces updated series, that
+batches of one source run serially and that an unbuildable plugin only skips its source
+"""
+
+import re
+import threading
+import time
+
+from chronos.ingestion import backfill_metadata as backfill
+from chronos.ingestion.backfill_metadata import UPDATE_SQL
+from chronos.ingestion.timeseries_cli import SERIES_CHANGED_CHANNEL
+
+ENUM_COLUMNS = {
+    "unit_type": "metadata.unit_type_enum",
+    "seasonal_adjustment": "metadata.seasonal_adjustment_enum",
+}
+
+
+class TestUpdateSQL:
+    """Test the VALUES-list UPDATE statement."""
+
+    def test_enum_columns_are_cast(self):
+        """VALUES columns are text; enum columns reject them without a cast."""
+        for column, enum_type in ENUM_COLUMNS.items():
+            assignment = re.search(rf"\b{column} = ([^,\n]+)", UPDATE_SQL).group(1)
+            assert assignment.strip() == f"v.{column}::{enum_type}"
+
+    def test_updated_series_are_announced(self):
+        """API processes cache metadata and drop it on SERIES_CHANGED_CHANNEL."""
+        returning = UPDATE_SQL.strip().rstrip(";").rsplit("RETURNING", 1)[1]
+        assert returning.strip() == f"pg_notify('{SERIES_CHANGED_CHANNEL}', sm.series_id::text)"
+
+
+class TestBackfillConcurrency:
+    """Test that each source has at most one batch in flight."""
+
+    def test_batches_of_one_source_do_not_overlap(self, mocker):
+        in_flight = {"FRED": 0, "StatsCan": 0}
+        peak = {"FRED": 0, "StatsCan": 0}
+        lock = threading.Lock()
+
+        def plugin_for(source_name):
+            def fetch_metadata_many(series_ids):
+                with lock:
+                    in_flight[source_name] += 1
+                    peak[source_name] = max(peak[source_name], in_flight[source_name])
+                time.sleep(0.01)
+                with lock:
+                    in_flight[source_name] -= 1
+                return {series_id: {"units": "Percent"} for series_id in series_ids}
+
+            plugin = mocker.MagicMock()
+            plugin.fetch_metadata_many.side_effect = fetch_metadata_many
+            return plugin
+
+        plugins = {name: plugin_for(name) for name in in_flight}
+        registry = mocker.MagicMock()
+        registry.get.side_effect = plugins.get
+        mocker.patch.object(backfill, "PLUGINS", registry)
+
+        rows = [(i, f"S{i}", f"Series {i}", "FRED" if i % 2 else "StatsCan") for i in range(20)]
+        conn = mocker.MagicMock()
+        conn.cursor.return_value.fetchall.return_value = rows
+        mocker.patch.object(backfill, "get_db_connection", return_value=conn)
+        execute_values = mocker.patch.object(backfill, "execute_values")
+
+        backfill.backfill_metadata(batch_size=2)
+
+        assert peak == {"FRED": 1, "StatsCan": 1}
+        assert execute_values.call_count == 10
+
+    def test_unbuildable_plugin_skips_only_its_source(self, mocker, capsys):
+        """A plugin that cannot be created (e.g. no FRED_API_KEY) does not abort the run."""
+        plugin = mocker.MagicMock()
+        plugin.fetch_metadata_many.side_effect = lambda ids: {i: {"units": "Index"} for i in ids}
+
+        def get(source_name):
+            if source_name == "FRED":
+                raise ValueError("FRED API key required")
+            return plugin
+
+        registry = mocker.MagicMock()
+        registry.get.side_effect = get
+        mocker.patch.object(backfill, "PLUGINS", registry)
+
+        rows = [(i, f"S{i}", f"Series {i}", "FRED" if i % 2 else "StatsCan") for i in range(6)]
+        conn = mocker.MagicMock()
+        conn.cursor.return_value.fetchall.return_value = rows
+        mocker.patch.object(backfill, "get_db_connection", return_value=conn)
+        execute_values = mocker.patch.object(backfill, "execute_values")
+
+        backfill.backfill_metadata(batch_size=10)
+
+        updates = execute_values.call_args[0][2]
+        assert [update[0] for update in updates] == [0, 2, 4]
+        output = capsys.readouterr().out
+        assert "Could not create plugin for FRED (3 series)" in output
+        assert "Updated: 3" in output
+        assert "Skipped: 3" in output
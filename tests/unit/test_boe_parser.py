@@ -0,0 +1,62 @@
+"""
+Project Chronos: Unit Tests for the Bank of England XML Parser
+==============================================================
+Purpose: Verify streaming IADB parsing and multi-series splitting
+"""
+
+from chronos.ingestion.boe import parse_iadb_xml
+
+IADB_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<Envelope xmlns="https://www.bankofengland.co.uk/website/agg_series">
+  <Cube>
+    <Cube SCODE="IUDBEDR">
+      <Cube TIME="2024-01-02" OBS_VALUE="5.25"/>
+      <Cube TIME="2024-01-03" OBS_VALUE="5.25"/>
+    </Cube>
+    <Cube SCODE="IUDMNPY">
+      <Cube TIME="2024-01-02" OBS_VALUE="3.61"/>
+    </Cube>
+  </Cube>
+</Envelope>"""
+
+SDMX_XML = b"""<?xml version="1.0"?>
+<message:GenericData
+    xmlns:message="http://www.SDMX.org/resources/SDMXML/schemas/v1_0/message"
+    xmlns:generic="http://www.SDMX.org/resources/SDMXML/schemas/v1_0/generic">
+  <message:DataSet>
+    <generic:Series>
+      <generic:Obs>
+        <generic:Time>2024-01-02</generic:Time>
+        <generic:ObsValue value="5.25"/>
+      </generic:Obs>
+    </generic:Series>
+  </message:DataSet>
+</message:GenericData>"""
+
+
+def chunked(data: bytes, size: int = 37):
+    """Split a document into small chunks to exercise incremental parsing."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestParseIADBXML:
+    """Test parse_iadb_xml."""
+
+    def test_multi_series_split(self):
+        """Native IADB documents split into per-series columns."""
+        columns = parse_iadb_xml(chunked(IADB_XML), ["IUDBEDR", "IUDMNPY"])
+
+        assert columns["IUDBEDR"] == (["2024-01-02", "2024-01-03"], ["5.25", "5.25"])
+        assert columns["IUDMNPY"] == (["2024-01-02"], ["3.61"])
+
+    def test_sdmx_layout(self):
+        """SDMX generic Obs elements map onto the requested series."""
+        columns = parse_iadb_xml(chunked(SDMX_XML), ["IUDBEDR"])
+
+        assert columns["IUDBEDR"] == (["2024-01-02"], ["5.25"])
+
+    def test_missing_series_absent(self):
+        """Requested codes with no data are simply not present."""
+        columns = parse_iadb_xml([IADB_XML], ["IUDBEDR", "XXXX"])
+
+        assert "XXXX" not in columns
@@ -0,0 +1,60 @@
+"""
+Project Chronos: Unit Tests for Scheduler Cadence Rules
+=======================================================
+Purpose: Verify next-due computation per frequency without a database
+"""
+
+from datetime import UTC, date, datetime, timedelta
+
+from chronos.ingestion.cadence import next_due, normalize_frequency
+
+
+class TestNormalizeFrequency:
+    """Test frequency label normalisation."""
+
+    def test_catalog_labels(self):
+        """Catalog values map directly onto cadences."""
+        assert normalize_frequency("Monthly") == "monthly"
+        assert normalize_frequency("Quarterly") == "quarterly"
+
+    def test_fred_labels_and_codes(self):
+        """FRED qualifiers and short codes are reduced to the base frequency."""
+        assert normalize_frequency("Weekly, Ending Friday") == "weekly"
+        assert normalize_frequency("Daily, Close") == "daily"
+        assert normalize_frequency("A") == "annual"
+        assert normalize_frequency("Semi-Annual") == "semiannual"
+
+    def test_irregular_is_unknown(self):
+        """Irregular and missing frequencies have no cadence."""
+        assert normalize_frequency("Irregular") is None
+        assert normalize_frequency(None) is None
+
+
+class TestNextDue:
+    """Test next-due times."""
+
+    def test_never_loaded_is_due_now(self):
+        """Series without observations are due immediately."""
+        assert next_due("Monthly", None) <= datetime.now(UTC)
+
+    def test_daily_due_next_day(self):
+        """A daily series is due the day after its latest observation."""
+        assert next_due("Daily", date(2024, 3, 4)) == datetime(2024, 3, 5, tzinfo=UTC)
+
+    def test_monthly_waits_for_period_end(self):
+        """Period-start dated monthly data is due once the following month ends."""
+        assert next_due("Monthly", date(2024, 1, 1)) == datetime(2024, 3, 1, tzinfo=UTC)
+
+    def test_annual_not_due_for_a_year(self):
+        """Annual data is not refetched within the year."""
+        assert next_due("Annual", date(2023, 1, 1)) == datetime(2025, 1, 1, tzinfo=UTC)
+
+    def test_overdue_series_respects_recheck(self):
+        """Once overdue, a series is re-polled on the recheck interval."""
+        checked = datetime(2024, 6, 1, 12, tzinfo=UTC)
+        assert next_due("Monthly", date(2024, 1, 1), checked) == checked + timedelta(days=1)
+
+    def test_irregular_polls_daily(self):
+        """Unknown frequencies fall back to the default recheck."""
+        checked = datetime(2024, 6, 1, tzinfo=UTC)
+        assert next_due("Irregular", date(2024, 1, 1), checked) == checked + timedelta(days=1)
@@ -0,0 +1,107 @@
+"""
+Project Chronos: Unit Tests for Ingestion Run Checkpoints
+=========================================================
+Purpose: Verify run start/resume and checkpoint rows against a mocked connection
+"""
+
+import json
+from collections import Counter
+
+import pytest
+
+from chronos.ingestion.checkpoint import RunCheckpoint
+
+RUN_ID = "5b0c7f4e-2d1a-4c8e-9f3b-6a7d8e9f0a1b"
+
+
+class TestRunCheckpoint:
+    """Test RunCheckpoint bookkeeping."""
+
+    def test_new_run_gets_id(self, mocker):
+        """Starting a run inserts a running row under a fresh run_id."""
+        conn = mocker.MagicMock()
+        checkpoint = RunCheckpoint.start(conn, series_count=10)
+
+        assert checkpoint.enabled
+        assert len(checkpoint.run_id) == 36
+        conn.commit.assert_called_once()
+
+    def test_resume_loads_completed(self, mocker):
+        """Resuming reads back the series already finished in that run."""
+        conn = mocker.MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.rowcount = 1
+        cursor.fetchall.return_value = [(1, "GDP"), (2, "FXUSDCAD")]
+
+        checkpoint = RunCheckpoint.start(conn, 10, resume_run_id=RUN_ID)
+
+        assert checkpoint.run_id == RUN_ID
+        assert checkpoint.is_complete(1, "GDP")
+        assert not checkpoint.is_complete(1, "UNRATE")
+
+    def test_resume_unknown_run_raises(self, mocker):
+        """An unknown run_id is an error rather than a silent fresh start."""
+        conn = mocker.MagicMock()
+        conn.cursor.return_value.rowcount = 0
+
+        with pytest.raises(ValueError):
+            RunCheckpoint.start(conn, 10, resume_run_id=RUN_ID)
+
+    def test_resume_malformed_run_id_raises(self, mocker):
+        """A run_id that is not a UUID is reported like an unknown run, not a DataError."""
+        conn = mocker.MagicMock()
+
+        with pytest.raises(ValueError, match="No ingestion run with run_id not-a-uuid"):
+            RunCheckpoint.start(conn, 10, resume_run_id="not-a-uuid")
+        conn.cursor.assert_not_called()
+
+    def test_missing_columns_disable_checkpoints(self, mocker):
+        """Before the migration, runs proceed without checkpoints."""
+        conn = mocker.MagicMock()
+        conn.cursor.return_value.execute.side_effect = Exception("column run_id does not exist")
+
+        checkpoint = RunCheckpoint.start(conn, 10)
+
+        assert not checkpoint.enabled
+        checkpoint.record(conn, 1, "GDP", None)
+        conn.rollback.assert_called_once()
+
+    def test_record_converts_timings_to_ms(self, mocker):
+        """Stage timings are stored in milliseconds."""
+        conn = mocker.MagicMock()
+        checkpoint = RunCheckpoint("run", enabled=True)
+        counts = {"fetched": 5, "timings": {"fetch": 0.25, "parse": 0.001, "write": 0.5}}
+
+        checkpoint.record(conn, 1, "GDP", None, counts)
+
+        params = conn.cursor.return_value.execute.call_args[0][1]
+        assert params[11:14] == (250.0, 1.0, 500.0)
+
+    def test_finish_sums_series_rows(self, mocker):
+        """Run totals come from the series rows, not from this attempt's summary."""
+        conn = mocker.MagicMock()
+        checkpoint = RunCheckpoint("run", enabled=True)
+        summary = {"failed": [], "successful": 3, "written": 10, "revised": 4}
+
+        checkpoint.finish(conn, summary)
+
+        sql, params = conn.cursor.return_value.execute.call_args[0]
+        assert "SUM(records_inserted)" in sql
+        assert "jsonb_each_text(s.quality_flags)" in sql
+        assert params == ("success", None, "run", "run", "run")
+
+    def test_record_stores_quality_counts(self, mocker):
+        """Each series row keeps how many observations every check flagged."""
+        conn = mocker.MagicMock()
+        checkpoint = RunCheckpoint("run", enabled=True)
+
+        checkpoint.record(conn, 1, "GDP", None, {"quality": Counter(spike=2, stale=14)})
+        flagged = conn.cursor.return_value.execute.call_args[0][1][14]
+        checkpoint.record(conn, 1, "UNRATE", None, {"quality": Counter()})
+        clean = conn.cursor.return_value.execute.call_args[0][1][14]
+        checkpoint.record(conn, 1, "CPI", None, error="No data")
+        failed = conn.cursor.return_value.execute.call_args[0][1][14]
+
+        assert json.loads(flagged) == {"spike": 2, "stale": 14}
+        assert json.loads(clean) == {}
+        assert failed is None
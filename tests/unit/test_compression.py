@@ -0,0 +1,47 @@
+"""
+Project Chronos: Unit Tests for Compression-Aware Loading
+==========================================================
+Purpose: Verify that unchanged rows are dropped before merging into compressed chunks
+"""
+
+from datetime import date
+
+from chronos.ingestion.compression import (
+    DECOMPRESS_CHUNK_SQL,
+    DROP_UNCHANGED_SQL,
+    prepare_staged_merge,
+)
+
+
+class TestPrepareStagedMerge:
+    """Test prepare_staged_merge() against a mocked cursor."""
+
+    def test_no_compressed_chunks(self, mocker):
+        """Batches inside the revision window touch nothing."""
+        cursor = mocker.MagicMock()
+        cursor.fetchall.return_value = []
+
+        assert prepare_staged_merge(cursor, 7, date(2024, 1, 1), date(2025, 1, 1)) == 0
+        assert cursor.execute.call_count == 1
+
+    def test_counts_only_chunks_with_changes(self, mocker):
+        """Chunks whose staged rows all match stored values receive no writes."""
+        cursor = mocker.MagicMock()
+        cursor.fetchall.return_value = [
+            ("_timescaledb_internal._hyper_1_1_chunk", date(2010, 1, 1), date(2011, 1, 1)),
+            ("_timescaledb_internal._hyper_1_2_chunk", date(2011, 1, 1), date(2012, 1, 1)),
+        ]
+        # Rows remain staged for the second chunk only
+        cursor.fetchone.side_effect = [(False,), (True,)]
+
+        written = prepare_staged_merge(cursor, 7, date(2010, 6, 1), date(2011, 6, 1))
+
+        assert written == 1
+        statements = [c.args for c in cursor.execute.call_args_list]
+        assert (DROP_UNCHANGED_SQL, (7, date(2010, 1, 1), date(2011, 1, 1))) in statements
+        # Native DML on compressed chunks decompresses only the series' segment
+        assert not any(statement[0] == DECOMPRESS_CHUNK_SQL for statement in statements)
+
+    def test_unchanged_compares_at_column_precision(self):
+        """Staged doubles are rounded to numeric(20, 6) like the stored value."""
+        assert "s.value::numeric(20, 6)" in DROP_UNCHANGED_SQL
@@ -0,0 +1,67 @@
+"""
+Project Chronos: Unit Tests for FRED Delta Discovery
+====================================================
+Purpose: Verify paging of fred/series/updates without network access
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import requests
+
+from chronos.ingestion.fred import FREDPlugin
+
+
+def make_response(payload):
+    """Build a JSON requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+class TestFetchUpdatedSeries:
+    """Test FREDPlugin.fetch_updated_series."""
+
+    def test_pages_until_count(self, monkeypatch):
+        """All pages are requested and merged into one set of IDs."""
+        plugin = FREDPlugin("key")
+        plugin.UPDATES_PAGE_SIZE = 2
+        pages = [
+            {"count": 3, "seriess": [{"id": "GDP"}, {"id": "UNRATE"}]},
+            {"count": 3, "seriess": [{"id": "CPIAUCSL"}]},
+        ]
+        offsets = []
+
+        def fake_send(method, url, **kwargs):
+            offsets.append(kwargs["params"]["offset"])
+            return make_response(pages.pop(0))
+
+        monkeypatch.setattr(plugin, "_send", fake_send)
+        updated = plugin.fetch_updated_series(datetime.now(UTC) - timedelta(hours=24))
+
+        assert updated == {"GDP", "UNRATE", "CPIAUCSL"}
+        assert offsets == [0, 2]
+
+    def test_window_too_old_returns_none(self, monkeypatch):
+        """Lookbacks beyond FRED's update window cannot narrow the run."""
+        plugin = FREDPlugin("key")
+        monkeypatch.setattr(plugin, "_send", lambda *a, **k: None)
+
+        assert plugin.fetch_updated_series(datetime.now(UTC) - timedelta(days=30)) is None
+
+    def test_times_sent_in_fred_format(self, monkeypatch):
+        """start_time and end_time use FRED's YYYYMMDDHhmm format."""
+        plugin = FREDPlugin("key")
+        sent = {}
+
+        def fake_send(method, url, **kwargs):
+            sent.update(kwargs["params"])
+            return make_response({"count": 0, "seriess": []})
+
+        monkeypatch.setattr(plugin, "_send", fake_send)
+        until = datetime(2024, 7, 1, 17, 30, tzinfo=UTC)
+        plugin.fetch_updated_series(until - timedelta(hours=1), until)
+
+        assert sent["start_time"] == "202407011130"
+        assert sent["end_time"] == "202407011230"
@@ -0,0 +1,125 @@
+"""
+Project Chronos: Unit Tests for Embedding Generation
+====================================================
+Purpose: Verify the streamed, page-at-a-time encode and bulk UPDATE against mocked sessions
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from chronos.cli import generate_embeddings as cli
+from chronos.cli.generate_embeddings import UPDATE_SQL, description_hash
+
+ROWS = [(1, "Real GDP"), (2, "Unemployment rate"), (3, "Consumer prices"), (4, "Housing starts")]
+
+
+class FakeModel:
+    """Encodes each text as [length, 0.5]"""
+
+    def __init__(self, name):
+        self.name = name
+        self.batches = []
+
+    def encode(self, descriptions, batch_size):
+        self.batches.append((list(descriptions), batch_size))
+        return np.array([[float(len(d)), 0.5] for d in descriptions])
+
+    def start_multi_process_pool(self, devices):
+        return {"devices": devices}
+
+    def encode_multi_process(self, descriptions, pool, batch_size):
+        return self.encode(descriptions, batch_size)
+
+    def stop_multi_process_pool(self, pool):
+        self.stopped = pool
+
+
+@pytest.fixture
+def sessions(mocker):
+    """Patched model and reader/writer sessions; the reader streams ROWS"""
+    models = []
+
+    def sentence_transformer(name):
+        models.append(FakeModel(name))
+        return models[-1]
+
+    mocker.patch.dict(
+        sys.modules,
+        {"sentence_transformers": mocker.MagicMock(SentenceTransformer=sentence_transformer)},
+    )
+
+    reader, writer = mocker.MagicMock(), mocker.MagicMock()
+    reader.execute.return_value.scalar_one.return_value = len(ROWS)
+    reader.execute.return_value.partitions.side_effect = lambda size: (
+        ROWS[start : start + size] for start in range(0, len(ROWS), size)
+    )
+    contexts = iter([reader, writer])
+    session = mocker.patch.object(cli, "get_db_session")
+    session.return_value.__enter__.side_effect = lambda: next(contexts)
+    return reader, writer, models
+
+
+class TestGenerateEmbeddings:
+    """Test generate_embeddings() page by page."""
+
+    def test_one_update_and_commit_per_page(self, sessions):
+        reader, writer, models = sessions
+
+        cli.generate_embeddings("test-model", page_size=3, batch_size=2)
+
+        updates = writer.execute.call_args_list
+        assert [call.args[0] for call in updates] == [UPDATE_SQL, UPDATE_SQL]
+        assert writer.commit.call_count == 2
+        first, second = (call.args[1] for call in updates)
+        assert first["series_ids"] == [1, 2, 3]
+        assert second["series_ids"] == [4]
+        assert first["embeddings"][0] == "[8.0,0.5]"
+        assert first["hashes"] == [description_hash("test-model", d) for _, d in ROWS[:3]]
+        assert first["model"] == "test-model"
+        assert [batch for batch, _ in models[0].batches] == [
+            [d for _, d in ROWS[:3]],
+            [ROWS[3][1]],
+        ]
+
+    def test_rows_are_streamed_in_pages(self, sessions):
+        reader, _, _ = sessions
+
+        cli.generate_embeddings("test-model", page_size=3, mode="missing")
+
+        statement = reader.execute.call_args_list[1].args[0]
+        assert statement.get_execution_options()["stream_results"]
+        assert statement.get_execution_options()["yield_per"] == 3
+        assert "description_embedding IS NULL" in str(statement)
+        reader.execute.return_value.partitions.assert_called_once_with(3)
+
+    def test_process_pool_is_stopped(self, sessions):
+        _, writer, models = sessions
+
+        cli.generate_embeddings("test-model", page_size=10, processes=2)
+
+        assert models[0].stopped == {"devices": ["cpu", "cpu"]}
+        assert writer.execute.call_args.args[1]["series_ids"] == [1, 2, 3, 4]
+
+    def test_model_change_selects_rows_by_new_model_hash(self, sessions):
+        """Switching models re-embeds rows hashed under the previous model."""
+        reader, writer, _ = sessions
+
+        cli.generate_embeddings("new-model", page_size=10)
+
+        count, select = reader.execute.call_args_list
+        assert count.args[1] == select.args[1] == {"model": "new-model"}
+        assert "description_embedding_hash IS DISTINCT FROM" in str(select.args[0])
+        hashes = writer.execute.call_args.args[1]["hashes"]
+        assert hashes == [description_hash("new-model", d) for _, d in ROWS]
+        assert hashes[0] != description_hash("test-model", ROWS[0][1])
+
+    def test_nothing_pending_writes_nothing(self, sessions):
+        reader, writer, _ = sessions
+        reader.execute.return_value.partitions.side_effect = lambda size: iter(())
+
+        cli.generate_embeddings("test-model")
+
+        writer.execute.assert_not_called()
+        writer.commit.assert_not_called()
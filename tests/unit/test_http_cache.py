@@ -0,0 +1,167 @@
+"""
+Project Chronos: Unit Tests for the Ingestion HTTP Cache
+========================================================
+Purpose: Verify record/replay and conditional revalidation without network access
+"""
+
+import io
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from chronos.ingestion.http_cache import HTTPCache
+from chronos.utils.exceptions import HTTPCacheMissError
+
+URL = "https://api.stlouisfed.org/fred/series/observations"
+
+
+def make_response(status_code=200, body=b'{"observations": []}', headers=None):
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = URL
+    response.headers.update(headers or {"Content-Type": "application/json"})
+    response._content = body
+    return response
+
+
+class FakeTransport:
+    """Records calls and returns canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+class TestHTTPCache:
+    """Test cache modes and keying."""
+
+    def test_record_then_replay(self, tmp_path):
+        """Recorded responses replay offline with identical bodies."""
+        body = b'{"observations": [{"date": "2024-01-01", "value": "5.33"}]}'
+        recorder = HTTPCache(tmp_path, mode="record")
+        recorder.request(FakeTransport(make_response(body=body)), "GET", URL, params={"a": 1})
+
+        replay = HTTPCache(tmp_path, mode="replay")
+        transport = FakeTransport()
+        response = replay.request(transport, "GET", URL, params={"a": 1})
+
+        assert transport.calls == []
+        assert response.status_code == 200
+        assert response.json()["observations"][0]["value"] == "5.33"
+
+    def test_replay_miss_raises(self, tmp_path):
+        """Replay mode never falls back to the network."""
+        with pytest.raises(HTTPCacheMissError):
+            HTTPCache(tmp_path, mode="replay").request(FakeTransport(), "GET", URL)
+
+    def test_api_key_not_part_of_key(self, tmp_path):
+        """Recordings replay regardless of the credential used."""
+        assert HTTPCache.key("GET", URL, params={"series_id": "GDP", "api_key": "a"}) == (
+            HTTPCache.key("GET", URL, params={"series_id": "GDP", "api_key": "b"})
+        )
+
+    def test_request_body_is_part_of_key(self):
+        """POST payloads (StatsCan) produce distinct keys."""
+        assert HTTPCache.key("POST", URL, json=[{"vectorId": 1}]) != HTTPCache.key(
+            "POST", URL, json=[{"vectorId": 2}]
+        )
+
+    def test_not_modified_reuses_stored_body(self, tmp_path):
+        """A 304 revalidation serves the stored body and sends validators."""
+        cache = HTTPCache(tmp_path, mode="cache")
+        first = make_response(headers={"ETag": '"v1"', "Content-Type": "application/json"})
+        cache.request(FakeTransport(first), "GET", URL)
+
+        transport = FakeTransport(make_response(status_code=304, body=b""))
+        response = cache.request(transport, "GET", URL)
+
+        assert transport.calls[0][2]["headers"]["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.content == b'{"observations": []}'
+        assert cache.revalidated == 1
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        """Entries younger than max_age are served without a request."""
+        cache = HTTPCache(tmp_path, mode="cache", max_age=3600)
+        cache.request(FakeTransport(make_response()), "GET", URL)
+
+        transport = FakeTransport()
+        cache.request(transport, "GET", URL)
+
+        assert transport.calls == []
+        assert cache.hits == 1
+
+    def test_errors_are_not_cached(self, tmp_path):
+        """Non-200 responses pass through and are not stored."""
+        cache = HTTPCache(tmp_path, mode="record")
+        cache.request(FakeTransport(make_response(status_code=500)), "GET", URL)
+
+        assert cache.load(HTTPCache.key("GET", URL)) is None
+
+    def test_api_key_not_stored(self, tmp_path):
+        """Recordings can be shared without leaking the credential."""
+        response = make_response()
+        response.url = f"{URL}?series_id=GDP&api_key=secret&file_type=json"
+        cache = HTTPCache(tmp_path, mode="record")
+        cache.request(FakeTransport(response), "GET", URL, params={"series_id": "GDP"})
+
+        meta, _ = cache.load(HTTPCache.key("GET", URL, params={"series_id": "GDP"}))
+        assert meta["url"] == f"{URL}?series_id=GDP&file_type=json"
+        assert not any("secret" in path.read_text() for path in tmp_path.rglob("*.json"))
+
+
+def streamed_response(body: bytes) -> requests.Response:
+    """A stream=True response whose body has not been read yet."""
+    response = make_response(headers={"Content-Type": "application/xml"})
+    response._content = False
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+
+class TestStreamedResponses:
+    """Test that stream=True bodies are recorded and replayed chunk by chunk."""
+
+    BODY = b"<Envelope>" + b"<Cube TIME='2024-01-02' OBS_VALUE='5.25'/>" * 50 + b"</Envelope>"
+
+    def test_recorded_as_the_caller_reads(self, tmp_path):
+        cache = HTTPCache(tmp_path, mode="record")
+        response = cache.request(
+            FakeTransport(streamed_response(self.BODY)), "GET", URL, stream=True
+        )
+        key = HTTPCache.key("GET", URL)
+
+        assert cache.load(key) is None
+        assert b"".join(response.iter_content(64)) == self.BODY
+        assert cache.load(key)[1] == self.BODY
+
+    def test_abandoned_stream_is_not_stored(self, tmp_path):
+        cache = HTTPCache(tmp_path, mode="record")
+        response = cache.request(
+            FakeTransport(streamed_response(self.BODY)), "GET", URL, stream=True
+        )
+
+        next(response.iter_content(64))
+        response.close()
+
+        assert cache.load(HTTPCache.key("GET", URL)) is None
+        assert not list(tmp_path.rglob("*.partial"))
+
+    def test_replayed_in_chunks(self, tmp_path):
+        HTTPCache(tmp_path, mode="record").request(
+            FakeTransport(make_response(body=self.BODY)), "GET", URL
+        )
+
+        response = HTTPCache(tmp_path, mode="replay").request(
+            FakeTransport(), "GET", URL, stream=True
+        )
+        chunks = list(response.iter_content(64))
+
+        assert len(chunks) > 1
+        assert max(map(len, chunks)) == 64
+        assert b"".join(chunks) == self.BODY
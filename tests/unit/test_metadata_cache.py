@@ -0,0 +1,91 @@
+"""
+Project Chronos: Unit Tests for the Metadata Refresh Cache
+==========================================================
+Purpose: Verify TTL and content-hash decisions without a database
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from chronos.ingestion.metadata_cache import MetadataCache, catalog_digest, metadata_digest
+
+SERIES = {
+    "series_name": "Real GDP",
+    "frequency": "Quarterly",
+    "category": "Growth",
+    "geography_name": "United States",
+}
+API = {"units": "Billions of Dollars", "unit_type": "CURRENCY", "seasonal_adjustment": "SAAR"}
+CATALOG_HASH = catalog_digest(SERIES)
+
+
+class TestMetadataDigest:
+    """Test content hashing of series metadata."""
+
+    def test_digest_is_stable(self):
+        """Same inputs always hash the same."""
+        assert metadata_digest(SERIES, API) == metadata_digest(dict(SERIES), dict(API))
+
+    def test_digest_ignores_source_last_updated(self):
+        """A new upstream last_updated alone does not change the hash."""
+        refreshed = {**API, "last_updated": "2026-10-18 07:51:02-05"}
+        assert metadata_digest(SERIES, API) == metadata_digest(SERIES, refreshed)
+
+    def test_digest_changes_with_content(self):
+        """Changing a written field changes the hash."""
+        changed = {**API, "units": "Millions of Dollars"}
+        assert metadata_digest(SERIES, API) != metadata_digest(SERIES, changed)
+
+
+class TestMetadataCache:
+    """Test freshness and change decisions."""
+
+    def _cache(self, checked_at, **kwargs):
+        entries = {
+            (1, "GDP"): {
+                "source_last_updated": None,
+                "content_hash": metadata_digest(SERIES, API),
+                "catalog_hash": CATALOG_HASH,
+                "checked_at": checked_at,
+            }
+        }
+        return MetadataCache(entries, ttl=timedelta(hours=24), **kwargs)
+
+    def test_recent_entry_is_fresh(self):
+        """Entries checked within the TTL skip the API call."""
+        now = datetime(2026, 10, 19, 12, tzinfo=UTC)
+        cache = self._cache(now - timedelta(hours=1))
+        assert cache.is_fresh(1, "GDP", CATALOG_HASH, now=now)
+
+    def test_expired_entry_is_not_fresh(self):
+        """Entries older than the TTL are refreshed."""
+        now = datetime(2026, 10, 19, 12, tzinfo=UTC)
+        cache = self._cache(now - timedelta(hours=25))
+        assert not cache.is_fresh(1, "GDP", CATALOG_HASH, now=now)
+        assert cache.is_unchanged(1, "GDP", metadata_digest(SERIES, API))
+
+    def test_catalog_change_is_not_fresh_within_ttl(self):
+        """A catalog-side rename or frequency change is written without waiting for the TTL."""
+        now = datetime(2026, 10, 19, 12, tzinfo=UTC)
+        cache = self._cache(now - timedelta(hours=1))
+        for field, value in (("series_name", "Real GDP (chained)"), ("frequency", "Monthly")):
+            changed = catalog_digest({**SERIES, field: value})
+            assert not cache.is_fresh(1, "GDP", changed, now=now)
+
+    def test_entry_without_catalog_hash_is_not_fresh(self):
+        """Rows cached before catalog hashes existed are refreshed once."""
+        now = datetime(2026, 10, 19, 12, tzinfo=UTC)
+        cache = self._cache(now - timedelta(hours=1))
+        cache.entries[(1, "GDP")]["catalog_hash"] = None
+        assert not cache.is_fresh(1, "GDP", CATALOG_HASH, now=now)
+
+    def test_unknown_series_is_not_fresh(self):
+        """Series never seen before are always fetched."""
+        cache = self._cache(datetime.now(UTC))
+        assert not cache.is_fresh(1, "UNRATE", CATALOG_HASH)
+        assert not cache.is_unchanged(1, "UNRATE", metadata_digest(SERIES, API))
+
+    def test_force_refresh_bypasses_cache(self):
+        """The forced refresh flag ignores both TTL and hash."""
+        cache = self._cache(datetime.now(UTC), force_refresh=True)
+        assert not cache.is_fresh(1, "GDP", CATALOG_HASH)
+        assert not cache.is_unchanged(1, "GDP", metadata_digest(SERIES, API))
@@ -0,0 +1,74 @@
+"""
+Project Chronos: Unit Tests for ObservationBatch
+================================================
+Purpose: Verify vectorized parsing and COPY rendering of plugin output
+"""
+
+import numpy as np
+
+from chronos.ingestion.batch import ObservationBatch
+
+
+class TestObservationBatchParsing:
+    """Test vectorized parsing of raw plugin columns."""
+
+    def test_parses_dates_and_values(self):
+        """String dates and values become datetime64[D] and float64 arrays."""
+        batch = ObservationBatch.from_strings("GDP", ["2024-01-01", "2024-04-01"], ["1.5", "2"])
+
+        assert batch.dates.dtype == np.dtype("datetime64[D]")
+        assert batch.values.dtype == np.float64
+        assert batch.values.tolist() == [1.5, 2.0]
+
+    def test_drops_missing_values(self):
+        """FRED '.' placeholders and None are skipped and counted."""
+        batch = ObservationBatch.from_strings(
+            "GDP", ["2024-01-01", "2024-02-01", "2024-03-01"], ["1.0", ".", None]
+        )
+
+        assert len(batch) == 1
+        assert batch.skipped == 2
+
+    def test_month_periods_resolve_to_first_day(self):
+        """StatsCan YYYY-MM reference periods map to the first of the month."""
+        batch = ObservationBatch.from_strings("v1", ["2024-02", "2024-01"], [2, 1])
+
+        assert np.datetime_as_string(batch.dates).tolist() == ["2024-01-01", "2024-02-01"]
+        assert batch.values.tolist() == [1.0, 2.0]
+
+    def test_duplicate_dates_keep_last(self):
+        """Repeated dates keep the last value supplied."""
+        batch = ObservationBatch.from_strings(
+            "FXUSDCAD", ["2024-01-02", "2024-01-02"], ["1.33", "1.34"]
+        )
+
+        assert len(batch) == 1
+        assert batch.values[0] == 1.34
+
+    def test_unparseable_dates_are_skipped(self):
+        """Garbage dates fall back to a lenient parse and are dropped."""
+        batch = ObservationBatch.from_strings("X", ["2024-01-01", "not a date"], ["1", "2"])
+
+        assert len(batch) == 1
+        assert batch.skipped == 1
+
+    def test_empty_input(self):
+        """No observations yields an empty, falsy batch."""
+        batch = ObservationBatch.from_strings("X", [], [])
+
+        assert len(batch) == 0
+        assert not batch
+        assert batch.start is None
+
+
+class TestObservationBatchCopy:
+    """Test COPY buffer rendering."""
+
+    def test_copy_buffer_rows(self):
+        """Each observation renders as date,value,flag."""
+        batch = ObservationBatch.from_strings("GDP", ["2024-01-01", "2024-04-01"], ["1.05", "2"])
+
+        assert batch.to_copy_buffer().read().splitlines() == [
+            "2024-01-01,1.05,good",
+            "2024-04-01,2.0,good",
+        ]
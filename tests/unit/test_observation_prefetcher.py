@@ -0,0 +1,82 @@
+"""
+Project Chronos: Unit Tests for Multi-Series Prefetching
+========================================================
+Purpose: Verify that one bad series ID in a chunk only fails its own series
+"""
+
+import numpy as np
+import pytest
+
+from chronos.ingestion.batch import ObservationBatch
+from chronos.ingestion.timeseries_cli import ObservationPrefetcher
+
+
+def batch(series_id: str) -> ObservationBatch:
+    return ObservationBatch(
+        series_id, np.array(["2024-01-02"], dtype="datetime64[D]"), np.array([1.0])
+    )
+
+
+@pytest.fixture
+def plugin(mocker):
+    """Valet-like plugin that rejects any request naming BAD"""
+    plugin = mocker.MagicMock()
+    plugin.MAX_SERIES_PER_REQUEST = 30
+    plugin.SUPPORTS_START_DATE = False
+
+    def fetch_many(series_ids):
+        if "BAD" in series_ids:
+            raise ValueError(f"Series {','.join(series_ids)} not found in Valet")
+        return {series_id: batch(series_id) for series_id in series_ids}
+
+    def fetch_one(series_id):
+        return fetch_many([series_id])[series_id]
+
+    plugin.fetch_observations_many.side_effect = fetch_many
+    plugin.fetch_observations.side_effect = fetch_one
+    mocker.patch("chronos.ingestion.timeseries_cli.PLUGINS", {"BOC": plugin})
+    return plugin
+
+
+def catalog(series_ids):
+    return [{"source": "BOC", "series_id": series_id} for series_id in series_ids]
+
+
+class TestObservationPrefetcher:
+    """Test ObservationPrefetcher against a mocked plugin."""
+
+    def test_chunk_is_fetched_once(self, plugin):
+        """Healthy series share one request."""
+        prefetcher = ObservationPrefetcher(catalog(["A", "B", "C"]))
+
+        for series_id in ["A", "B", "C"]:
+            assert prefetcher.fetch(plugin, "BOC", series_id).series_id == series_id
+
+        assert plugin.fetch_observations_many.call_count == 1
+        plugin.fetch_observations.assert_not_called()
+
+    def test_bad_id_fails_only_its_own_series(self, plugin):
+        """GOOD1 and GOOD2 load although BAD shares their chunk."""
+        prefetcher = ObservationPrefetcher(catalog(["GOOD1", "BAD", "GOOD2"]))
+
+        assert prefetcher.fetch(plugin, "BOC", "GOOD1").series_id == "GOOD1"
+        with pytest.raises(ValueError, match="Series BAD not found"):
+            prefetcher.fetch(plugin, "BOC", "BAD")
+        assert prefetcher.fetch(plugin, "BOC", "GOOD2").series_id == "GOOD2"
+
+    def test_rest_of_failed_chunk_is_requeued(self, plugin):
+        """Series after a failed chunk are still batched, not dropped."""
+        series_ids = ["GOOD1", "BAD"] + [f"S{i}" for i in range(40)]
+        prefetcher = ObservationPrefetcher(catalog(series_ids))
+
+        loaded = []
+        for series_id in series_ids:
+            try:
+                loaded.append(prefetcher.fetch(plugin, "BOC", series_id).series_id)
+            except ValueError:
+                assert series_id == "BAD"
+
+        assert loaded == [series_id for series_id in series_ids if series_id != "BAD"]
+        # Two failed chunks, two single fetches, then full-size chunks again
+        assert plugin.fetch_observations.call_count == 2
+        assert plugin.fetch_observations_many.call_count <= 6
@@ -0,0 +1,57 @@
+"""
+Project Chronos: Unit Tests for the DataSourcePlugin HTTP Transport
+===================================================================
+Purpose: Verify session pooling, retry policy and throttling without network access
+"""
+
+import time
+
+from chronos.ingestion.base import DataSourcePlugin
+
+
+class DummyPlugin(DataSourcePlugin):
+    """Minimal concrete plugin for exercising the base class."""
+
+    REQUEST_INTERVAL = 0.05
+
+    def fetch_observations(self, series_id):
+        return []
+
+    def get_source_id(self):
+        return 0
+
+    def get_source_name(self):
+        return "Dummy"
+
+
+class TestPluginSession:
+    """Test the shared pooled session."""
+
+    def test_session_is_reused(self):
+        """All requests of a plugin share one keep-alive session."""
+        plugin = DummyPlugin()
+        assert plugin.session is plugin.session
+
+    def test_retry_policy_is_mounted(self):
+        """The class-level retry policy is applied to HTTPS connections."""
+        plugin = DummyPlugin()
+        retries = plugin.session.get_adapter("https://example.org").max_retries
+
+        assert retries.total == DataSourcePlugin.MAX_RETRIES
+        assert 429 in retries.status_forcelist
+        assert "POST" in retries.allowed_methods
+
+    def test_close_releases_session(self):
+        """Closing drops the session so a new one is created on demand."""
+        plugin = DummyPlugin()
+        first = plugin.session
+        plugin.close()
+        assert plugin.session is not first
+
+    def test_throttle_spaces_requests(self):
+        """Consecutive requests wait at least REQUEST_INTERVAL."""
+        plugin = DummyPlugin()
+        start = time.monotonic()
+        plugin._throttle()
+        plugin._throttle()
+        assert time.monotonic() - start >= DummyPlugin.REQUEST_INTERVAL
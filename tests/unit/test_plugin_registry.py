@@ -0,0 +1,65 @@
+"""
+Project Chronos: Unit Tests for the Ingestion Plugin Registry
+=============================================================
+Purpose: Verify lazy loading, alias lookup and per-source configuration
+"""
+
+import pytest
+
+from chronos.ingestion.registry import BUILTIN_PLUGINS, PluginRegistry, PluginSpec
+
+
+class TestPluginRegistry:
+    """Test PluginRegistry."""
+
+    def test_membership_does_not_instantiate(self):
+        """Checking a source exists never creates its plugin."""
+        registry = PluginRegistry(load_entry_points=False)
+
+        assert "FRED" in registry
+        assert registry.loaded() == {}
+
+    def test_only_requested_plugin_is_created(self, monkeypatch):
+        """A single-source run needs no credentials for other sources."""
+        monkeypatch.delenv("FRED_API_KEY", raising=False)
+        registry = PluginRegistry(load_entry_points=False)
+
+        assert registry["Valet"].get_source_name() == "Bank of Canada Valet API"
+        assert list(registry.loaded()) == ["Valet"]
+
+    def test_config_read_at_instantiation(self, monkeypatch):
+        """Per-source configuration comes from the environment when first used."""
+        registry = PluginRegistry(load_entry_points=False)
+        monkeypatch.setenv("FRED_API_KEY", "abc")
+
+        assert registry["FRED"].api_key == "abc"
+
+    def test_missing_key_fails_on_access(self, monkeypatch):
+        """A missing FRED key only fails when FRED is actually requested."""
+        monkeypatch.delenv("FRED_API_KEY", raising=False)
+        registry = PluginRegistry(load_entry_points=False)
+
+        with pytest.raises(ValueError):
+            registry["FRED"]
+
+    def test_aliases_resolve_to_same_instance(self):
+        """data_sources names map onto the catalog source."""
+        registry = PluginRegistry(load_entry_points=False)
+
+        assert registry["Bank of Canada Valet"] is registry["Valet"]
+        assert registry.resolve("statistics canada") == "StatsCan"
+        assert "Unknown Source" not in registry
+
+    def test_attributes_apply_to_later_plugins(self):
+        """set_attribute reaches plugins created afterwards."""
+        registry = PluginRegistry(load_entry_points=False)
+        registry.set_attribute("http_cache", "sentinel")
+
+        assert registry["BOE"].http_cache == "sentinel"
+
+    def test_register_third_party(self):
+        """Additional specs can be registered without touching the CLI."""
+        registry = PluginRegistry(BUILTIN_PLUGINS, load_entry_points=False)
+        registry.register(PluginSpec("BOE2", "chronos.ingestion.boe:BOEPlugin"))
+
+        assert registry["BOE2"].get_source_name() == "Bank of England"
@@ -0,0 +1,116 @@
+"""
+Project Chronos: Unit Tests for Data-Quality Flags
+==================================================
+Purpose: Verify the vectorized quality checks applied to observation batches
+"""
+
+import numpy as np
+
+from chronos.ingestion.batch import ObservationBatch
+from chronos.ingestion.quality import assess, gap_mask, sign_flip_mask, spike_mask, stale_mask
+
+
+def random_walk(n, seed=0):
+    return 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, n))
+
+
+def monthly_batch(values, start="2020-01"):
+    dates = np.arange(np.datetime64(start), np.datetime64(start) + len(values)).astype(
+        "datetime64[D]"
+    )
+    return ObservationBatch("CPI", dates, np.asarray(values, dtype=np.float64))
+
+
+class TestQualityChecks:
+    """Test each check in isolation."""
+
+    def test_spike_is_flagged(self):
+        """A single outsized print that reverts is a spike; its neighbours are not."""
+        values = random_walk(24)
+        values[6] = 500
+
+        assert np.flatnonzero(spike_mask(values)).tolist() == [6]
+
+    def test_level_shift_is_not_spike(self):
+        """A permanent jump has no reversal and is left alone."""
+        values = random_walk(24)
+        values[12:] += 100
+
+        assert not spike_mask(values).any()
+
+    def test_bad_latest_print_is_flagged(self):
+        """The newest observation is flagged on the move into it alone."""
+        values = np.r_[random_walk(23), 1000.0]
+
+        assert np.flatnonzero(spike_mask(values)).tolist() == [23]
+
+    def test_sign_flip_in_positive_series(self):
+        """A negative value in an always-positive series is suspect."""
+        values = np.r_[np.full(30, 2.5), -2.5]
+
+        assert np.flatnonzero(sign_flip_mask(values)).tolist() == [30]
+
+    def test_sign_changes_in_mixed_series_are_normal(self):
+        """Growth rates crossing zero are not flagged."""
+        values = np.tile([1.0, -1.0], 10)
+
+        assert not sign_flip_mask(values).any()
+
+    def test_gap_depends_on_frequency(self):
+        """A 3-month hole is a gap for monthly data but not for quarterly data."""
+        dates = np.array(["2020-01-01", "2020-02-01", "2020-05-01"], dtype="datetime64[D]")
+
+        assert gap_mask(dates, "monthly").tolist() == [False, False, True]
+        assert not gap_mask(dates, "quarterly").any()
+        assert not gap_mask(dates, None).any()
+
+    def test_stale_repeats(self):
+        """Only repeats beyond the tolerated run length are flagged."""
+        values = np.r_[1.0, np.full(9, 2.0), 3.0]
+
+        assert np.flatnonzero(stale_mask(values, "daily")).tolist() == [7, 8, 9]
+
+
+class TestAssess:
+    """Test flag assignment on a batch."""
+
+    def test_clean_series_is_good(self):
+        """Ordinary data keeps the 'good' flag everywhere."""
+        batch = monthly_batch(random_walk(24))
+
+        assert assess(batch, "Monthly") == {}
+        assert set(batch.flags) == {"good"}
+
+    def test_most_severe_flag_wins(self):
+        """A spike after a gap is stored as a spike but counted under both."""
+        batch = monthly_batch(random_walk(24))
+        batch.values[6] = 500
+        batch.dates[6:] += 90
+
+        counts = assess(batch, "M")
+
+        assert batch.flags[6] == "spike"
+        assert counts["spike"] == 1
+        assert counts["gap"] == 1
+
+    def test_flags_reach_copy_buffer(self):
+        """Assessed flags replace the constant default in COPY rows."""
+        batch = monthly_batch(np.r_[random_walk(23), 1000.0])
+        assess(batch, "Monthly")
+
+        rows = batch.to_copy_buffer().getvalue().splitlines()
+        assert rows[-1].endswith(",spike")
+        assert rows[0].endswith(",good")
+
+    def test_short_batch_is_checked_against_history(self):
+        """An incremental batch below MIN_OBSERVATIONS still gets spike checks."""
+        values = random_walk(40)
+        history = monthly_batch(values[:36])
+        batch = monthly_batch(np.r_[values[36:39], 1000.0], start="2023-01")
+
+        assert assess(monthly_batch(batch.values.copy(), start="2023-01"), "Monthly") == {}
+
+        counts = assess(batch, "Monthly", history)
+
+        assert counts == {"spike": 1}
+        assert batch.flags.tolist() == ["good", "good", "good", "spike"]
@@ -0,0 +1,37 @@
+"""
+Project Chronos: Unit Tests for the Ingestion Scheduler
+=======================================================
+Purpose: Verify the daemon loop survives failed passes and state is read per series
+"""
+
+import pytest
+
+from chronos.ingestion.scheduler import STATE_QUERY, IngestionScheduler
+
+
+class TestRunForever:
+    """Test IngestionScheduler.run_forever() without a database."""
+
+    def test_failed_pass_does_not_stop_daemon(self, mocker):
+        """An exception in one pass is logged and the next pass still runs."""
+        scheduler = IngestionScheduler.__new__(IngestionScheduler)
+        scheduler.run_once = mocker.MagicMock(
+            side_effect=[ConnectionError("database restarted"), 1, KeyboardInterrupt]
+        )
+        mocker.patch("chronos.ingestion.scheduler.time.sleep")
+
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.run_forever(poll_interval=0)
+
+        assert scheduler.run_once.call_count == 3
+
+
+class TestStateQuery:
+    """Test the scheduling state query."""
+
+    def test_latest_observation_is_a_keyed_probe(self):
+        """No aggregate over the hypertable; one LIMIT 1 lookup per series."""
+        assert "MAX(" not in STATE_QUERY
+        assert "GROUP BY" not in STATE_QUERY
+        assert "LATERAL" in STATE_QUERY
+        assert "LIMIT 1" in STATE_QUERY
@@ -0,0 +1,111 @@
+"""
+Project Chronos: Unit Tests for Sharded Ingestion
+=================================================
+Purpose: Verify that shards cover every series once, spread each source evenly
+and merge back into one run summary
+"""
+
+from collections import Counter
+
+import pytest
+
+from chronos.ingestion.timeseries_cli import merge_summaries, new_summary, shard_series
+
+SERIES = [
+    {"source": source, "series_id": f"{prefix}{number:03d}"}
+    for source, prefix in [("FRED", "DEX"), ("VALET", "FXUSD"), ("STATSCAN", "v")]
+    for number in range(120)
+]
+
+
+class TestShardSeries:
+    """Test shard_series() coverage, balance and stability."""
+
+    @pytest.mark.parametrize("workers", [1, 2, 3, 4, 7])
+    def test_every_series_lands_on_exactly_one_shard(self, workers):
+        shards = shard_series(SERIES, workers)
+
+        assigned = [(s["source"], s["series_id"]) for shard in shards for s in shard]
+        assert len(shards) <= workers
+        assert sorted(assigned) == sorted((s["source"], s["series_id"]) for s in SERIES)
+
+    @pytest.mark.parametrize("workers", [2, 3, 4])
+    def test_each_source_is_spread_across_shards(self, workers):
+        """No shard ends up with a whole source (and its rate limit) to itself."""
+        shards = shard_series(SERIES, workers)
+
+        assert len(shards) == workers
+        for source in ("FRED", "VALET", "STATSCAN"):
+            counts = [sum(s["source"] == source for s in shard) for shard in shards]
+            assert max(counts) - min(counts) <= 1, counts
+
+    def test_small_sources_do_not_pile_onto_one_shard(self):
+        series = [{"source": source, "series_id": "A"} for source in ("FRED", "VALET", "BOE")]
+
+        shards = shard_series(series, 3)
+
+        assert [len(shard) for shard in shards] == [1, 1, 1]
+
+    def test_assignment_is_stable_and_keeps_catalog_order(self):
+        shards = shard_series(SERIES, 3)
+
+        assert shard_series(list(SERIES), 3) == shards
+        for shard in shards:
+            assert shard == sorted(shard, key=SERIES.index)
+
+    def test_empty_shards_are_dropped(self):
+        shards = shard_series(SERIES[:2], 8)
+
+        assert 1 <= len(shards) <= 2
+        assert all(shards)
+
+
+class TestMergeSummaries:
+    """Test merge_summaries() totals."""
+
+    def summary(self, **values):
+        summary = new_summary()
+        summary.update(values)
+        return summary
+
+    def test_counts_lists_and_timings_add_up(self):
+        first = self.summary(
+            total=3,
+            successful=2,
+            failed=["DEX001"],
+            written=40,
+            http_hits=1,
+            fetch_seconds=1.5,
+            changed_series=["DEX002"],
+        )
+        second = self.summary(total=2, successful=2, written=10, http_hits=2, fetch_seconds=0.5)
+
+        merged = merge_summaries([first, second])
+
+        assert merged["total"] == 5
+        assert merged["successful"] == 4
+        assert merged["failed"] == ["DEX001"]
+        assert merged["written"] == 50
+        assert merged["http_hits"] == 3
+        assert merged["fetch_seconds"] == pytest.approx(2.0)
+        assert merged["changed_series"] == ["DEX002"]
+
+    def test_quality_counters_are_summed_per_check(self):
+        first = self.summary(quality=Counter(spike=2, stale=5))
+        second = self.summary(quality=Counter(stale=1, gap=3))
+
+        merged = merge_summaries([first, second])
+
+        assert merged["quality"] == Counter(spike=2, stale=6, gap=3)
+        assert isinstance(merged["quality"], Counter)
+
+    def test_inputs_are_not_modified(self):
+        first = self.summary(failed=["A"], quality=Counter(spike=1))
+
+        merge_summaries([first, self.summary(failed=["B"], quality=Counter(spike=1))])
+
+        assert first["failed"] == ["A"]
+        assert first["quality"] == Counter(spike=1)
+
+    def test_no_shards_is_an_empty_summary(self):
+        assert merge_summaries([]) == new_summary()
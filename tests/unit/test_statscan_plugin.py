@@ -0,0 +1,76 @@
+"""
+Project Chronos: Unit Tests for StatsCan Batch Metadata
+=======================================================
+Purpose: Verify multi-vector getSeriesInfoFromVector requests without network access
+"""
+
+import json
+
+import requests
+
+from chronos.ingestion.statscan import StatsCanPlugin
+
+
+def series_info(vector_id, uom=239, title="CPI, seasonally adjusted"):
+    """Build one getSeriesInfoFromVector result."""
+    return {
+        "status": "SUCCESS",
+        "object": {
+            "vectorId": vector_id,
+            "memberUomCode": uom,
+            "frequencyCode": 6,
+            "productId": 18100004,
+            "SeriesTitleEn": title,
+        },
+    }
+
+
+class FakeTransport:
+    """Answers every requested vector, except those listed as missing."""
+
+    def __init__(self, missing=()):
+        self.payloads = []
+        self.missing = set(missing)
+
+    def __call__(self, method, url, **kwargs):
+        self.payloads.append(kwargs["json"])
+        body = [
+            (
+                {"status": "FAILED", "object": "invalid vector"}
+                if item["vectorId"] in self.missing
+                else series_info(item["vectorId"])
+            )
+            for item in kwargs["json"]
+        ]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        return response
+
+
+class TestStatsCanMetadataMany:
+    """Test StatsCanPlugin.fetch_metadata_many."""
+
+    def test_one_request_per_chunk(self, monkeypatch):
+        """Vectors are requested together, chunked by MAX_VECTORS_PER_REQUEST."""
+        plugin = StatsCanPlugin()
+        plugin.MAX_VECTORS_PER_REQUEST = 2
+        transport = FakeTransport()
+        monkeypatch.setattr(plugin, "_send", transport)
+
+        metadata = plugin.fetch_metadata_many(["v41690973", "v41690914", "V2062815"])
+
+        assert [len(p) for p in transport.payloads] == [2, 1]
+        assert set(metadata) == {"v41690973", "v41690914", "V2062815"}
+        assert metadata["V2062815"]["unit_type"] == "PERCENTAGE"
+        assert metadata["v41690973"]["frequency"] == "Monthly"
+
+    def test_failed_vectors_are_omitted(self, monkeypatch):
+        """Vectors with a non-success status are left out of the result."""
+        plugin = StatsCanPlugin()
+        monkeypatch.setattr(plugin, "_send", FakeTransport(missing={2062815}))
+
+        metadata = plugin.fetch_metadata_many(["v41690973", "v2062815"])
+
+        assert list(metadata) == ["v41690973"]
+        assert plugin.fetch_metadata("v2062815") == {}
@@ -0,0 +1,137 @@
+"""
+Project Chronos: Unit Tests for Valet Multi-Series Fetching
+===========================================================
+Purpose: Verify comma-list and group requests split into per-series batches
+"""
+
+import json
+
+import requests
+
+from chronos.ingestion.valet import ValetPlugin
+
+PAYLOAD = {
+    "seriesDetail": {"FXUSDCAD": {}, "FXEURCAD": {}},
+    "observations": [
+        {"d": "2024-01-02", "FXUSDCAD": {"v": "1.3316"}, "FXEURCAD": {"v": "1.4566"}},
+        {"d": "2024-01-03", "FXUSDCAD": {"v": "1.3340"}},
+    ],
+}
+
+
+class FakeTransport:
+    """Records requests and returns the canned payload."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, method, url, **kwargs):
+        self.calls.append((url, kwargs.get("params")))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(PAYLOAD).encode()
+        return response
+
+
+class TestValetMultiSeries:
+    """Test ValetPlugin batched fetching."""
+
+    def test_comma_list_single_request(self, monkeypatch):
+        """Several series come back from one request, split per series."""
+        plugin = ValetPlugin()
+        transport = FakeTransport()
+        monkeypatch.setattr(plugin, "_send", transport)
+
+        batches = plugin.fetch_observations_many(["FXUSDCAD", "FXEURCAD"])
+
+        assert len(transport.calls) == 1
+        assert transport.calls[0][0].endswith("/FXUSDCAD,FXEURCAD/json")
+        assert batches["FXUSDCAD"].values.tolist() == [1.3316, 1.334]
+        assert batches["FXEURCAD"].values.tolist() == [1.4566]
+
+    def test_dates_missing_for_a_series_are_not_skipped(self):
+        """Only present-but-invalid cells count as skipped, not another series' dates."""
+        payload = {
+            "observations": [
+                {"d": "2024-01-02", "FXUSDCAD": {"v": "1.3316"}, "FXEURCAD": {"v": "1.4566"}},
+                {"d": "2024-01-03", "FXUSDCAD": {"v": "1.3340"}},
+                {"d": "2024-01-04", "FXUSDCAD": {"v": "1.3332"}, "FXEURCAD": {"v": ""}},
+            ],
+        }
+
+        batches = ValetPlugin._split(payload, ["FXUSDCAD", "FXEURCAD"])
+
+        assert batches["FXUSDCAD"].skipped == 0
+        assert batches["FXEURCAD"].values.tolist() == [1.4566]
+        assert batches["FXEURCAD"].skipped == 1
+
+    def test_group_uses_series_detail(self, monkeypatch):
+        """Group responses are split using the series listed in seriesDetail."""
+        plugin = ValetPlugin()
+        monkeypatch.setattr(plugin, "_send", FakeTransport())
+
+        batches = plugin.fetch_group("FX_RATES_DAILY")
+
+        assert set(batches) == {"FXUSDCAD", "FXEURCAD"}
+
+    def test_incremental_filters_are_sent(self, monkeypatch):
+        """start_date and recent are passed through as query parameters."""
+        plugin = ValetPlugin()
+        transport = FakeTransport()
+        monkeypatch.setattr(plugin, "_send", transport)
+
+        plugin.fetch_observations_many(["FXUSDCAD"], start_date="2024-01-01", recent=5)
+
+        assert transport.calls[0][1] == {"start_date": "2024-01-01", "recent": 5}
+
+
+class RetiredSeriesTransport:
+    """Answers like Valet: 404 for any list naming RETIRED, else one value per series."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, method, url, **kwargs):
+        self.calls += 1
+        requested = url.rsplit("/", 2)[-2].split(",")
+        response = requests.Response()
+        response.url = url
+        if "RETIRED" in requested:
+            response.status_code = 404
+            return response
+        response.status_code = 200
+        observations = [{"d": "2024-01-02", **{s: {"v": "1.0"} for s in requested}}]
+        response._content = json.dumps(
+            {"seriesDetail": dict.fromkeys(requested, {}), "observations": observations}
+        ).encode()
+        return response
+
+
+class TestValetRetiredSeries:
+    """A retired series in a full-size chunk fails alone."""
+
+    def test_retired_series_fails_only_itself(self, monkeypatch):
+        from chronos.ingestion.timeseries_cli import ObservationPrefetcher
+
+        plugin = ValetPlugin()
+        plugin.REQUEST_INTERVAL = 0
+        transport = RetiredSeriesTransport()
+        monkeypatch.setattr(plugin, "_send", transport)
+        monkeypatch.setattr("chronos.ingestion.timeseries_cli.PLUGINS", {"BOC": plugin})
+
+        series_ids = [f"FX{i:02d}CAD" for i in range(ValetPlugin.MAX_SERIES_PER_REQUEST)]
+        series_ids.insert(3, "RETIRED")
+        prefetcher = ObservationPrefetcher([{"source": "BOC", "series_id": s} for s in series_ids])
+
+        failed = []
+        for series_id in series_ids:
+            try:
+                batch = prefetcher.fetch(plugin, "BOC", series_id)
+            except ValueError:
+                failed.append(series_id)
+                continue
+            assert batch.values.tolist() == [1.0]
+
+        assert failed == ["RETIRED"]
+        # Far fewer requests than fetching each series on its own
+        assert transport.calls < len(series_ids) // 2